@@ -1,261 +1,774 @@
 #!/usr/bin/python3
 import sys
 import os
+import math
+import time
 import random
 import json
+import html
+import sqlite3
 import configparser
-from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
+from dataclasses import asdict
+
+# Reference point for the time-to-first-paint figure reported at startup
+_PROCESS_START = time.perf_counter()
+
+if __name__ == "__main__" and sys.argv[1:2] == ["--batch"]:
+    # Headless batch generation never needs Qt, so dispatch before importing PyQt6
+    # or any of the window's own modules
+    from netcontrol.batch import main as batch_main
+    sys.exit(batch_main(sys.argv[2:]))
+
+from netcontrol.engine import (
+    DEFAULT_CALLSIGN, DEFAULT_NAME, DEFAULT_LOCATION, DEFAULT_NUM_TOPICS,
+    DEFAULT_TOPICS, DEFAULT_ANNOUNCEMENTS, NetProfile,
+    build_sections, generate_sections, read_lines, script_topics
+)
+from netcontrol.config import NetConfig
+from netcontrol.lineindex import LineIndex
+from netcontrol.topicstore import TopicStore, DEFAULT_LIBRARY, file_signature
+from netcontrol.templates import TemplateError, available_template_sets
+from netcontrol.checkins import (
+    DuplicateCheckIn, CHECKIN_GROUPS, COLUMNS as CHECKIN_COLUMNS, export_checkin_log
+)
+from netcontrol.themes import THEMES_DIR, BUILTIN_THEMES, load_user_themes
+# @trace.traced decorates methods as the classes below are defined, so it cannot wait
+from netcontrol import trace
 
+# Only what the startup path needs; rarely used dialogs are imported where they are opened
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QTextEdit, QVBoxLayout, QHBoxLayout,
-    QPushButton, QFileDialog, QMessageBox, QSpinBox, QGroupBox, QScrollArea,
-    QProgressBar, QListWidget, QSplitter, QCompleter, QFontDialog, QTabWidget,
-    QGridLayout, QFrame, QSizePolicy, QToolTip, QCheckBox, QComboBox
+    QPushButton, QFileDialog, QMessageBox, QSpinBox, QGroupBox,
+    QProgressBar, QListWidget, QSplitter, QTabWidget, QStackedLayout,
+    QGridLayout, QFrame, QCheckBox, QComboBox, QTableView, QHeaderView, QAbstractItemView,
+    QCompleter, QTabBar, QListWidgetItem, QListView
 )
-from PyQt6.QtCore import Qt, QTimer, QSettings, pyqtSignal, QPropertyAnimation, QRect, QEasingCurve
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap, QPainter
-
-DEFAULT_CALLSIGN = "N0CALL"
-DEFAULT_NAME = "Net Control"
-DEFAULT_LOCATION = "Anytown, USA"
-DEFAULT_NUM_TOPICS = 1
-
-class NetConfig:
-    def __init__(self):
-        self.config_file = 'net_config.ini'
-        self.templates_dir = Path('templates')
-        self.config = configparser.ConfigParser()
-        self.load_or_create_config()
-    
-    def load_or_create_config(self):
-        """Load existing config or create default one"""
-        if not os.path.exists(self.config_file):
-            self.create_default_config()
-        
-        self.config.read(self.config_file)
-    
-    def create_default_config(self):
-        """Create default configuration file"""
-        config = configparser.ConfigParser()
-        
-        # Club Information
-        config['CLUB'] = {
-            'name': 'Amateur Radio Club',
-            'net_name': 'Weekly Net',
-            'meeting_day': 'Monday',
-            'meeting_time': '7:00 PM',
-            'timezone': 'Local Time',
-            'website': '',
-            'email': '',
-            'repeater_info': 'Local Repeater'
-        }
-        
-        # Default Operator Information
-        config['DEFAULTS'] = {
-            'callsign': os.environ.get('HAM_CALLSIGN', 'N0CALL'),
-            'name': os.environ.get('HAM_NAME', 'Net Control'),
-            'location': os.environ.get('HAM_LOCATION', 'Anytown, USA'),
-            'num_topics': '1'
-        }
-        
-        # Script Sections Configuration
-        config['SCRIPT_SECTIONS'] = {
-            'use_opening': 'true',
-            'use_club_announcements': 'true',
-            'use_topics': 'true',
-            'use_checkins': 'true',
-            'use_emergency_traffic': 'false',
-            'use_formal_traffic': 'false',
-            'use_elmering': 'false',
-            'use_roundtable': 'true',
-            'use_closing': 'true'
-        }
-        
-        # Custom Text Sections
-        config['CUSTOM_TEXT'] = {
-            'opening_addition': '',
-            'special_instructions': '',
-            'checkin_instructions': 'Please say your callsign phonetically twice, followed by your name and location.',
-            'closing_addition': 'Thank you for participating in tonight\'s net. 73!'
-        }
-        
-        # Net Format Options
-        config['NET_FORMAT'] = {
-            'is_directed': 'true',
-            'use_roundtable': 'true',
-            'allow_comments': 'true',
-            'emergency_priority': 'true',
-            'formal_traffic': 'false'
-        }
-        
-        with open(self.config_file, 'w') as f:
-            config.write(f)
-        
-        print(f"Created default configuration file: {self.config_file}")
-    
-    def get_club_info(self):
-        """Get club information from config"""
-        return {
-            'name': self.config.get('CLUB', 'name'),
-            'net_name': self.config.get('CLUB', 'net_name'),
-            'meeting_day': self.config.get('CLUB', 'meeting_day'),
-            'meeting_time': self.config.get('CLUB', 'meeting_time'),
-            'timezone': self.config.get('CLUB', 'timezone'),
-            'website': self.config.get('CLUB', 'website'),
-            'email': self.config.get('CLUB', 'email'),
-            'repeater_info': self.config.get('CLUB', 'repeater_info')
-        }
-    
-    def get_defaults(self):
-        """Get default operator information"""
-        return {
-            'callsign': self.config.get('DEFAULTS', 'callsign'),
-            'name': self.config.get('DEFAULTS', 'name'),
-            'location': self.config.get('DEFAULTS', 'location'),
-            'num_topics': self.config.getint('DEFAULTS', 'num_topics')
-        }
-    
-    def get_script_sections(self):
-        """Get enabled script sections"""
-        return {
-            'use_opening': self.config.getboolean('SCRIPT_SECTIONS', 'use_opening'),
-            'use_club_announcements': self.config.getboolean('SCRIPT_SECTIONS', 'use_club_announcements'),
-            'use_topics': self.config.getboolean('SCRIPT_SECTIONS', 'use_topics'),
-            'use_checkins': self.config.getboolean('SCRIPT_SECTIONS', 'use_checkins'),
-            'use_emergency_traffic': self.config.getboolean('SCRIPT_SECTIONS', 'use_emergency_traffic'),
-            'use_formal_traffic': self.config.getboolean('SCRIPT_SECTIONS', 'use_formal_traffic'),
-            'use_elmering': self.config.getboolean('SCRIPT_SECTIONS', 'use_elmering'),
-            'use_roundtable': self.config.getboolean('SCRIPT_SECTIONS', 'use_roundtable'),
-            'use_closing': self.config.getboolean('SCRIPT_SECTIONS', 'use_closing')
-        }
-    
-    def get_custom_text(self):
-        """Get custom text additions"""
-        return {
-            'opening_addition': self.config.get('CUSTOM_TEXT', 'opening_addition'),
-            'special_instructions': self.config.get('CUSTOM_TEXT', 'special_instructions'),
-            'checkin_instructions': self.config.get('CUSTOM_TEXT', 'checkin_instructions'),
-            'closing_addition': self.config.get('CUSTOM_TEXT', 'closing_addition')
-        }
-    
-    def get_net_format(self):
-        """Get net format settings"""
-        return {
-            'is_directed': self.config.getboolean('NET_FORMAT', 'is_directed'),
-            'use_roundtable': self.config.getboolean('NET_FORMAT', 'use_roundtable'),
-            'allow_comments': self.config.getboolean('NET_FORMAT', 'allow_comments'),
-            'emergency_priority': self.config.getboolean('NET_FORMAT', 'emergency_priority'),
-            'formal_traffic': self.config.getboolean('NET_FORMAT', 'formal_traffic')
-        }
-    
-    def save_config(self, section, key, value):
-        """Save a configuration value"""
-        if section not in self.config:
-            self.config.add_section(section)
-        self.config.set(section, key, str(value))
-        
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
-
+from PyQt6.QtCore import (
+    Qt, QTimer, QSettings, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractTableModel, QAbstractListModel, QModelIndex, QStringListModel
+)
+from PyQt6.QtGui import QFont, QColor, QPalette, QTextDocument, QPdfWriter, QPageSize
+
+@trace.traced
+def write_pdf(path, profile, sections, progress=None):
+    """PDF exporter: lay the HTML export out in an offscreen QTextDocument and print it"""
+    from netcontrol.export import iter_script_html
+    document = QTextDocument()
+    document.setHtml(''.join(iter_script_html(profile, sections)))
+    if progress is not None:
+        progress(0.5)
+    writer = QPdfWriter(path)
+    writer.setPageSize(QPageSize(QPageSize.PageSizeId.Letter))
+    writer.setTitle(f"{profile.club_name} {profile.net_name}")
+    document.print(writer)
+    if progress is not None:
+        progress(1.0)
+
+
+def topic_preview_text(topics):
+    """First few topics plus a count of the rest"""
+    return "\n".join(topics[:3]) + f"\n... and {len(topics)-3} more"
+
+
+@trace.traced
+def set_style_state(widget, name, value):
+    """Set a dynamic property the theme stylesheet selects on, re-polishing only if it changed"""
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
 
-    def get_lines_from_file(filepath):
-        """Read lines from a text file, filtering out empty lines"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
-            return lines
-        except Exception as e:
-            print(f"Error reading file {filepath}: {e}")
-            return []
 
 class AnimatedButton(QPushButton):
     """Custom button with hover animations"""
-    def __init__(self, text, parent=None):
+    def __init__(self, text, parent=None, role=None):
         super().__init__(text, parent)
         self.setMinimumHeight(40)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+        # The hover highlight is a :hover rule in the theme, selected by this property
+        self.setProperty("animated", "true")
+        if role:
+            self.setProperty("role", role)
+
+class TaskCanceled(Exception):
+    """Raised inside a background task when the user cancels it"""
+
+
+class TaskSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    canceled = pyqtSignal()
+
 
-    def enterEvent(self, event):
-        self.setStyleSheet(self.styleSheet() + "background-color: #4a90e2;")
-        super().enterEvent(event)
+class ConfigSignals(QObject):
+    # Emitted from NetConfig's save timer thread, delivered on the GUI thread
+    save_failed = pyqtSignal(str)
+
+
+class BackgroundTask(QRunnable):
+    """Runs fn(report_progress) on the thread pool
+
+    The signals object is created on the GUI thread, so its signals are delivered
+    there as queued events; the result arrives in a single finished() emission.
+    """
+    def __init__(self, fn, name="background task"):
+        super().__init__()
+        self.fn = fn
+        self.name = name
+        self.signals = TaskSignals()
+        self.cancel_requested = False
+        self.last_percent = -1
+
+    def cancel(self):
+        self.cancel_requested = True
+
+    def report_progress(self, fraction):
+        if self.cancel_requested:
+            raise TaskCanceled()
+        percent = int(fraction * 100)
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        try:
+            with trace.span(self.name):
+                result = self.fn(self.report_progress)
+        except TaskCanceled:
+            self.signals.canceled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class FieldValidator(QObject):
+    """Debounced required-field validation that only restyles fields whose state changed"""
+    def __init__(self, fields, on_valid_changed, delay_ms=150, parent=None):
+        super().__init__(parent)
+        self.fields = list(fields)
+        self.on_valid_changed = on_valid_changed
+        self.state = {}  # field -> last applied validity
+        self.dirty = set(self.fields)
+        self.valid = None
+        self.restyle_count = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.validate)
+        for field in self.fields:
+            field.textChanged.connect(lambda _text, field=field: self.mark_dirty(field))
+
+    def mark_dirty(self, field):
+        self.dirty.add(field)
+        self.timer.start()
+
+    @trace.traced
+    def validate(self):
+        """Check the fields edited since the last run; returns overall validity"""
+        self.timer.stop()
+        for field in self.dirty:
+            valid = bool(field.text().strip())
+            if self.state.get(field) is not valid:
+                self.state[field] = valid
+                set_style_state(field, "valid", "true" if valid else "false")
+                self.restyle_count += 1
+        self.dirty.clear()
+
+        valid = all(self.state.values())
+        if valid is not self.valid:
+            self.valid = valid
+            self.on_valid_changed(valid)
+        return valid
+
+
+class RosterCompleter(QCompleter):
+    """Completer whose candidates come from the roster index, refreshed on every keystroke"""
+    def __init__(self, field, column, roster=None):
+        super().__init__(field)
+        self.field = field
+        self.column = column
+        self.roster = roster
+        self.candidates = QStringListModel(self)
+        self.setModel(self.candidates)
+        self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setMaxVisibleItems(12)
+        field.setCompleter(self)
+        field.textEdited.connect(self.update_candidates)
+
+    @trace.traced
+    def update_candidates(self, text):
+        if self.roster is None:
+            return
+        self.candidates.setStringList(self.roster.complete(text, self.column))
+        self.setCompletionPrefix(text)
+        if self.candidates.rowCount():
+            self.complete()
+
+
+class ThemeManager:
+    """Builds each theme's palette and stylesheet once, then switches in a single pass"""
+    PALETTE_ROLES = (
+        (QPalette.ColorRole.Window, 'window'),
+        (QPalette.ColorRole.WindowText, 'window_text'),
+        (QPalette.ColorRole.Base, 'base'),
+        (QPalette.ColorRole.AlternateBase, 'alternate_base'),
+        (QPalette.ColorRole.Text, 'text'),
+        (QPalette.ColorRole.Button, 'button'),
+        (QPalette.ColorRole.ButtonText, 'button_text'),
+        (QPalette.ColorRole.Highlight, 'highlight'),
+        (QPalette.ColorRole.HighlightedText, 'highlighted_text'),
+        (QPalette.ColorRole.PlaceholderText, 'disabled_text'),
+        (QPalette.ColorRole.Mid, 'border'),
+    )
+
+    def __init__(self, window, themes_dir=THEMES_DIR):
+        # Styling the top-level window re-polishes only its widget tree, about half the
+        # cost of an application-wide stylesheet
+        self.window = window
+        self.themes = dict(BUILTIN_THEMES)
+        self.themes.update(load_user_themes(themes_dir))
+        self.compiled = {}  # name -> (QPalette, stylesheet)
+        self.current = None
+
+        # The font used to come from a catch-all QWidget rule; set it once instead
+        font = QFont()
+        font.setFamilies(['Segoe UI', 'Arial', 'sans-serif'])
+        font.setPixelSize(13)
+        QApplication.setFont(font)
+
+    def names(self):
+        return list(self.themes)
+
+    @trace.traced
+    def compile(self, name):
+        if name not in self.compiled:
+            theme = self.themes[name]
+            colors = dict(theme.colors)
+            palette = QPalette()
+            for role, key in self.PALETTE_ROLES:
+                palette.setColor(role, QColor(colors[key]))
+            palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText,
+                             QColor(colors['disabled_text']))
+            palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text,
+                             QColor(colors['disabled_text']))
+            self.compiled[name] = (palette, theme.stylesheet)
+        return self.compiled[name]
+
+    @trace.traced
+    def apply(self, name):
+        """Switch the whole application to a theme; returns the time taken in ms"""
+        if name == self.current:
+            return 0.0
+        started = time.perf_counter()
+        palette, stylesheet = self.compile(name)
+        self.window.setPalette(palette)
+        self.window.setStyleSheet(stylesheet)
+        self.current = name
+        return (time.perf_counter() - started) * 1000
+
+    def benchmark(self, rounds=20):
+        """Alternate between the built-in themes, including the repaint; returns per-switch ms"""
+        names = ['Dark', 'Light']
+        timings = []
+        for i in range(rounds):
+            started = time.perf_counter()
+            self.apply(names[i % 2] if self.current != names[i % 2] else names[(i + 1) % 2])
+            QApplication.processEvents()
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+
+class NetScheduler(QObject):
+    """Section auto-advance driven by one precise timer and a monotonic deadline
+
+    The timer only wakes the scheduler for countdown updates; whether a section
+    is due is always decided against time.monotonic(), so late wake-ups never
+    add up. Chained sections are measured from the previous deadline rather than
+    from the moment the timer fired.
+    """
+    due = pyqtSignal()
+    remaining_changed = pyqtSignal(float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.started = None
+        self.deadline = None
+        self.running = False
+        self.paused_remaining = None
+
+    def start(self, seconds, chain=False):
+        """Run a section for `seconds`; chain continues from the last deadline if it is recent"""
+        now = time.monotonic()
+        base = self.deadline if chain and self.deadline is not None else now
+        if base + seconds <= now:
+            # Far behind (e.g. the machine was suspended): restart rather than skip sections
+            base = now
+        self.started = base
+        self.deadline = base + seconds
+        self.paused_remaining = None
+        self.running = True
+        self.tick()
+
+    def set_duration(self, seconds):
+        """Change the running section's length, keeping its start time"""
+        if self.running:
+            self.deadline = self.started + seconds
+            self.tick()
+        elif self.paused_remaining is not None:
+            elapsed = self.deadline - self.started - self.paused_remaining
+            self.paused_remaining = max(0.0, seconds - elapsed)
+            self.deadline = self.started + seconds
+
+    def remaining(self):
+        if self.paused_remaining is not None:
+            return self.paused_remaining
+        if not self.running:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def tick(self):
+        if not self.running:
+            return
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0.001:
+            self.running = False
+            self.remaining_changed.emit(0.0)
+            self.due.emit()
+            return
+        self.remaining_changed.emit(remaining)
+        # Wake when the displayed whole-second countdown changes, or at the deadline
+        fraction = remaining % 1.0 or 1.0
+        self.timer.start(max(1, math.ceil(fraction * 1000)))
+
+    def pause(self):
+        if self.running:
+            self.paused_remaining = max(0.0, self.deadline - time.monotonic())
+            self.running = False
+            self.timer.stop()
+
+    def resume(self):
+        if self.paused_remaining is None:
+            return
+        duration = self.deadline - self.started
+        self.deadline = time.monotonic() + self.paused_remaining
+        self.started = self.deadline - duration
+        self.paused_remaining = None
+        self.running = True
+        self.tick()
+
+    def cancel(self):
+        self.timer.stop()
+        self.running = False
+        self.paused_remaining = None
+        self.deadline = None
+
+
+class CheckInTableModel(QAbstractTableModel):
+    """Table model over a CheckInStore; appends insert one row instead of resetting the view"""
+    TIME, CALLSIGN, NAME, LOCATION, GROUP, TRAFFIC, COMMENTS = range(7)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(CHECKIN_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return CHECKIN_COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        store = self.store
+        if column == self.TIME:
+            return time.strftime("%H:%M:%S", time.localtime(store.times[row]))
+        if column == self.CALLSIGN:
+            return store.callsigns[row]
+        if column == self.NAME:
+            return store.names[row]
+        if column == self.LOCATION:
+            return store.locations[row]
+        if column == self.GROUP:
+            return CHECKIN_GROUPS[store.groups[row]]
+        if column == self.TRAFFIC:
+            return "Yes" if store.flags[row] & 1 else "No"
+        return store.comments[row]
+
+    def append(self, callsign, **fields):
+        """Add a check-in; raises DuplicateCheckIn/ValueError before the view is touched"""
+        callsign = self.store.validate(callsign, fields.get('group', 0))
+        row = len(self.store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.store.append(callsign, **fields)
+        self.endInsertRows()
+        return row
+
+    def remove(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        callsign = self.store.remove(row)
+        self.endRemoveRows()
+        return callsign
+
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+    def set_store(self, store):
+        """Show another session's log"""
+        self.beginResetModel()
+        self.store = store
+        self.endResetModel()
+
+
+class SectionListModel(QAbstractListModel):
+    """Section titles for the navigator; the view only asks for the rows it paints"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sections = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.sections)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{row + 1}. {self.sections[row][0]}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # First line of the section, so edits show up without opening it
+            return self.sections[row][1].strip().split('\n', 1)[0][:200]
+        return None
+
+    def set_sections(self, sections):
+        """Show another script, signalling only the rows added or removed and one range for the rest"""
+        old, new = len(self.sections), len(sections)
+        if new < old:
+            self.beginRemoveRows(QModelIndex(), new, old - 1)
+            self.sections = sections
+            self.endRemoveRows()
+        elif new > old:
+            self.beginInsertRows(QModelIndex(), old, new - 1)
+            self.sections = sections
+            self.endInsertRows()
+        else:
+            self.sections = sections
+        if min(old, new):
+            self.dataChanged.emit(self.index(0), self.index(min(old, new) - 1))
+
+    def section_changed(self, row):
+        self.dataChanged.emit(self.index(row), self.index(row))
 
-    def leaveEvent(self, event):
-        self.setStyleSheet(self.styleSheet().replace("background-color: #4a90e2;", ""))
-        super().leaveEvent(event)
 
 class StatusBar(QFrame):
     """Custom status bar with better visual feedback"""
     def __init__(self):
         super().__init__()
+        self.setObjectName("statusBar")
         self.setFrameStyle(QFrame.Shape.StyledPanel)
         self.setMaximumHeight(30)
         
         layout = QHBoxLayout()
         self.status_label = QLabel("")
         self.status_icon = QLabel("")
+
+        # One progress bar and cancel button per running background task
+        self.task_widgets = {}
+        self.task_layout = QHBoxLayout()
+        self.task_layout.setContentsMargins(0, 0, 0, 0)
+
+        # One clear timer, restarted by every message
+        self.clear_timer = QTimer(self)
+        self.clear_timer.setSingleShot(True)
+        self.clear_timer.setInterval(4000)
+        self.clear_timer.timeout.connect(self.clear_message)
         
         layout.addWidget(self.status_icon)
         layout.addWidget(self.status_label)
         layout.addStretch()
+        layout.addLayout(self.task_layout)
         self.setLayout(layout)
-        
+
+    def start_task(self, task, message, cancel_callback):
+        """Show a progress bar and cancel button for a background task"""
+        progress = QProgressBar()
+        progress.setMaximumWidth(260)
+        progress.setFormat(f"{message} %p%")
+        progress.setValue(0)
+        cancel_btn = QPushButton("✖ Cancel")
+        cancel_btn.setToolTip(f"Cancel {message}")
+        cancel_btn.clicked.connect(lambda: cancel_callback())
+        self.task_layout.addWidget(progress)
+        self.task_layout.addWidget(cancel_btn)
+        self.task_widgets[task] = (progress, cancel_btn)
+
+    def set_progress(self, task, percent):
+        widgets = self.task_widgets.get(task)
+        if widgets is not None:
+            widgets[0].setValue(percent)
+
+    def finish_task(self, task):
+        for widget in self.task_widgets.pop(task, ()):
+            self.task_layout.removeWidget(widget)
+            widget.deleteLater()
+
+    def set_state(self, state):
+        for widget in (self, self.status_label, self.status_icon):
+            set_style_state(widget, "state", state)
+
     def show_message(self, message, error=False):
         self.status_label.setText(message)
         if error:
-            self.setStyleSheet("background-color: #ffebee; color: #c62828; border: 1px solid #ef5350;")
+            self.set_state("error")
             self.status_icon.setText("⚠")
         else:
-            self.setStyleSheet("background-color: #e8f5e8; color: #2e7d32; border: 1px solid #66bb6a;")
+            self.set_state("success")
             self.status_icon.setText("✓")
         
-        QTimer.singleShot(4000, self.clear_message)
+        self.clear_timer.start()
         
     def clear_message(self):
         self.status_label.setText("")
         self.status_icon.setText("")
-        self.setStyleSheet("")
+        self.set_state("")
+
+class SectionViewStack(QWidget):
+    """Script view that keeps one laid-out QTextEdit page per recently shown section
+
+    Pages live in a StackAll layout, so each one is laid out at the visible size
+    when it is added (the neighbours of the current section are added during idle
+    time) and navigating only raises a page; no text is re-set or re-laid-out.
+    """
+    MAX_PAGES = 24
+
+    def __init__(self, placeholder_text, font, parent=None):
+        super().__init__(parent)
+        self.script_font = font
+        self.pages = OrderedDict()  # section index -> QTextEdit, least recently shown first
+        self.current_index = None
+        self.pending = []
+
+        self.stack = QStackedLayout(self)
+        self.stack.setStackingMode(QStackedLayout.StackingMode.StackAll)
+        self.placeholder = self.create_page(placeholder_text)
+        self.stack.addWidget(self.placeholder)
+
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.timeout.connect(self.prefetch_next)
+
+    @trace.traced
+    def create_page(self, content):
+        page = QTextEdit()
+        page.setReadOnly(True)
+        page.setFont(self.script_font)
+        page.setPlainText(content)
+        page.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        return page
+
+    def page(self, index, content):
+        """Cached page for a section, creating it if needed"""
+        page = self.pages.get(index)
+        if page is None:
+            page = self.create_page(content)
+            self.stack.addWidget(page)
+            self.pages[index] = page
+            self.trim()
+        return page
+
+    @trace.traced
+    def show_section(self, index, content):
+        """Raise the page for a section and return it"""
+        previous = self.stack.currentWidget()
+        page = self.page(index, content)
+        self.pages.move_to_end(index)
+        if page is not previous:
+            previous.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            page.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+            self.stack.setCurrentWidget(page)
+        self.current_index = index
+        return page
+
+    def prefetch(self, items):
+        """Build pages for (index, content) items once the event loop is idle"""
+        self.pending = [(index, content) for index, content in items if index not in self.pages]
+        if self.pending:
+            self.prefetch_timer.start(0)
+
+    @trace.traced
+    def prefetch_next(self):
+        # One page per idle slot keeps the GUI responsive while pages are laid out
+        if self.pending:
+            index, content = self.pending.pop(0)
+            self.page(index, content)
+            self.stack.setCurrentWidget(self.pages.get(self.current_index, self.placeholder))
+        if self.pending:
+            self.prefetch_timer.start(0)
+
+    def trim(self):
+        while len(self.pages) > self.MAX_PAGES:
+            index = next(i for i in self.pages if i != self.current_index)
+            self.remove_page(index)
+
+    def remove_page(self, index):
+        page = self.pages.pop(index)
+        self.stack.removeWidget(page)
+        page.deleteLater()
+
+    def invalidate(self, index):
+        """Drop a section's page so it is rebuilt from the current text"""
+        if index in self.pages and index != self.current_index:
+            self.remove_page(index)
+
+    def clear(self):
+        """Drop all section pages and show the placeholder"""
+        self.prefetch_timer.stop()
+        self.pending = []
+        for index in list(self.pages):
+            self.remove_page(index)
+        self.current_index = None
+        self.stack.setCurrentWidget(self.placeholder)
+        return self.placeholder
+
+    def set_script_font(self, font):
+        self.script_font = font
+        self.placeholder.setFont(font)
+        for page in self.pages.values():
+            page.setFont(font)
+
+
+def session_attribute(name):
+    """Window attribute that reads and writes the active NetSession"""
+    return property(lambda self: getattr(self.session, name),
+                    lambda self, value: setattr(self.session, name, value))
+
 
 class NetControlWindow(QWidget):
+    SETUP_TAB = 0
+    SCRIPT_TAB = 1
+    CHECKINS_TAB = 2
+    ANALYTICS_TAB = 3
+    SETTINGS_TAB = 4
+
+    # Per-net state belongs to the session shown in the session bar (see netcontrol.session)
+    sections = session_attribute('sections')
+    section_idx = session_attribute('section_idx')
+    section_edits = session_attribute('edits')
+    export_lines = session_attribute('export_lines')
+    topics = session_attribute('topics')
+    club_announcements = session_attribute('club_announcements')
+    nco_announcements = session_attribute('nco_announcements')
+    checkin_store = session_attribute('checkin_store')
+    net_started = session_attribute('net_started')
+    recorded_net_id = session_attribute('recorded_net_id')
+    journal = session_attribute('journal')
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Net Control Script Manager")
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
-        self.section_idx = 0
-        self.sections = []
-        self.export_lines = []
+        from netcontrol.session import SessionManager
+        self.sessions = SessionManager()
+        self.session = self.sessions.new_session()
         self.topic_file_path = ""
         self.nco_file_path = ""
         self.settings = QSettings("NetControl", "NetApp")
         self.last_font = None
         self.theme_dark = True
+        self.theme_name = 'Dark'
+        self.theme_manager = ThemeManager(self)
         self.auto_advance = False
+        self.default_section_seconds = 15
+        self.section_durations = {}  # section title -> seconds
+        self.scheduler = NetScheduler(self)
+        self.section_durations_updating = False
+        self.scheduler.due.connect(self.auto_advance_due)
+        self.scheduler.remaining_changed.connect(self.show_time_remaining)
+        self.first_paint_ms = None
+        self.topic_store = None
+        self.active_tasks = {}  # task kind -> running BackgroundTask
+        self.net_config = None  # loaded on first use by get_net_config
+        self.config_signals = ConfigSignals(self)
+        self.config_signals.save_failed.connect(self.config_save_failed)
+        self.roster = None
+        self.roster_file = ""
+        self.roster_completers = []
+        self.licensee_store = None  # opened on first lookup, once a licensee file has been imported
+        self.net_history = None  # opened by the Analytics tab or when a net is logged
+        self.mirror = None  # web view of the shown section, when enabled in Settings
+        self.archive = None  # full-text index of exports, opened by the first search
+        self.mirror_enabled = False
+        self.mirror_port = 8765
+        self.edit_journal_timer = QTimer(self)
+        self.edit_journal_timer.setSingleShot(True)
+        self.edit_journal_timer.setInterval(1000)
+        self.edit_journal_timer.timeout.connect(self.commit_section_edit)
         self.init_ui()
         self.load_settings()
-        self.apply_dark_theme()
+        self.apply_theme()
+        self.recover_session()
+        if self.mirror_enabled:
+            self.start_mirror()
+        if self.roster_file and os.path.exists(self.roster_file):
+            QTimer.singleShot(0, lambda: self.load_roster(self.roster_file))
 
     def init_ui(self):
         # Main container with tabs
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
 
-        # Setup Tab
+        # Tabs start as empty pages; each is filled in the first time it is shown
         self.setup_tab = QWidget()
-        self.init_setup_tab()
         self.tab_widget.addTab(self.setup_tab, "📋 Setup")
 
-
-        # Script Tab
         self.script_tab = QWidget()
-        self.init_script_tab()
         self.tab_widget.addTab(self.script_tab, "📻 Net Script")
 
-        # Settings Tab
+        self.checkins_tab = QWidget()
+        self.tab_widget.addTab(self.checkins_tab, "📝 Check-ins")
+
+        self.analytics_tab = QWidget()
+        self.tab_widget.addTab(self.analytics_tab, "📈 Analytics")
+
         self.settings_tab = QWidget()
-        self.init_settings_tab()
         self.tab_widget.addTab(self.settings_tab, "⚙️ Settings")
 
+        self.pending_tabs = {
+            self.SETUP_TAB: self.init_setup_tab,
+            self.SCRIPT_TAB: self.init_script_tab,
+            self.CHECKINS_TAB: self.init_checkins_tab,
+            self.ANALYTICS_TAB: self.init_analytics_tab,
+            self.SETTINGS_TAB: self.init_settings_tab
+        }
+        # The Setup tab is always the first one shown and the rest of the window depends on it
+        self.ensure_tab(self.SETUP_TAB)
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+        self.tab_widget.currentChanged.connect(
+            lambda index: index == self.ANALYTICS_TAB and self.refresh_analytics()
+        )
+
         # Main layout
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -264,6 +777,21 @@ class NetControlWindow(QWidget):
         header = self.create_header()
         main_layout.addWidget(header)
 
+        # One tab per net; every net shares the tabs below
+        session_layout = QHBoxLayout()
+        self.session_tabs = QTabBar()
+        self.session_tabs.setTabsClosable(True)
+        self.session_tabs.setExpanding(False)
+        self.session_tabs.addTab(self.session.name)
+        self.session_tabs.currentChanged.connect(self.switch_session)
+        self.session_tabs.tabCloseRequested.connect(self.close_session)
+        new_session_btn = QPushButton("➕ New Net")
+        new_session_btn.setToolTip("Run another net alongside this one")
+        new_session_btn.clicked.connect(self.new_session)
+        session_layout.addWidget(self.session_tabs, 1)
+        session_layout.addWidget(new_session_btn)
+        main_layout.addLayout(session_layout)
+
         main_layout.addWidget(self.tab_widget)
 
         # Status bar
@@ -272,6 +800,24 @@ class NetControlWindow(QWidget):
 
         self.setLayout(main_layout)
 
+    @trace.traced
+    def ensure_tab(self, index):
+        """Build a tab's widgets if it has not been shown yet"""
+        builder = self.pending_tabs.pop(index, None)
+        if builder is not None:
+            builder()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - _PROCESS_START) * 1000
+            QTimer.singleShot(0, self.report_startup_time)
+
+    def report_startup_time(self):
+        """Report how long it took from process start to the first painted frame"""
+        print(f"Time to first paint: {self.first_paint_ms:.0f} ms")
+        self.status_bar.show_message(f"Ready in {self.first_paint_ms:.0f} ms")
+
     def set_splitter_top_bottom_ratio(self, splitter, top_ratio=0.25):
         """Set the splitter ratio for top (top_ratio) and bottom (1-top_ratio)"""
         total = splitter.size().height() or 1000  # fallback if not yet shown
@@ -388,6 +934,7 @@ class NetControlWindow(QWidget):
         self.num_topics_input.setMaximum(10)
         self.num_topics_input.setMinimumHeight(35)
         self.num_topics_input.setSuffix(" topics")
+        self.attach_roster(self.callsign_input, self.name_input, self.location_input)
 
         operator_layout.addWidget(QLabel("Callsign:"), 0, 0)
         operator_layout.addWidget(self.callsign_input, 0, 1)
@@ -439,7 +986,19 @@ class NetControlWindow(QWidget):
         format_options_layout.addWidget(self.elmering_cb, 2, 0)
         format_options_layout.addWidget(self.comments_cb, 2, 1)
 
+        # Net format = a set of section templates in templates/<name>/
+        template_set_layout = QHBoxLayout()
+        self.template_set_combo = QComboBox()
+        self.template_set_combo.addItem("Standard", "")
+        for name in available_template_sets():
+            self.template_set_combo.addItem(name, name)
+        self.template_set_combo.setToolTip("Section templates to use (folders under templates/)")
+        template_set_layout.addWidget(QLabel("Script Format:"))
+        template_set_layout.addWidget(self.template_set_combo)
+        template_set_layout.addStretch()
+
         format_layout.addLayout(format_options_layout)
+        format_layout.addLayout(template_set_layout)
         format_group.setLayout(format_layout)
 
         # Content Management Group (keep existing but update labels)
@@ -464,18 +1023,26 @@ class NetControlWindow(QWidget):
         randomize_btn.clicked.connect(self.randomize_topics)
         randomize_btn.setMinimumSize(115, 32)
 
+        self.no_repeat_cb = QCheckBox("No repeats within")
+        self.no_repeat_cb.setToolTip("Skip topics used in recent nets (history is kept in topics.db)")
+        self.no_repeat_nets_input = QSpinBox()
+        self.no_repeat_nets_input.setRange(1, 520)
+        self.no_repeat_nets_input.setValue(8)
+        self.no_repeat_nets_input.setSuffix(" nets")
+
         topics_header.addWidget(topics_label)
         topics_header.addStretch()
+        topics_header.addWidget(self.no_repeat_cb)
+        topics_header.addWidget(self.no_repeat_nets_input)
         topics_header.addWidget(randomize_btn)
         topics_header.addWidget(topic_file_btn)
 
 
-        # Use generic topics instead of SkyHubLink-specific ones
-        self.topics = self.load_default_topics()
+        # Sessions start with the generic topics instead of SkyHubLink-specific ones
         self.topic_preview = QTextEdit()
         self.topic_preview.setReadOnly(True)
         self.topic_preview.setMaximumHeight(100)
-        self.topic_preview.setPlainText("\n".join(self.topics[:3]) + f"\n... and {len(self.topics)-3} more")
+        self.topic_preview.setPlainText(topic_preview_text(self.topics))
 
         topics_layout.addLayout(topics_header)
         topics_layout.addWidget(self.topic_preview)
@@ -498,8 +1065,7 @@ class NetControlWindow(QWidget):
         announcements_header.addStretch()
         announcements_header.addWidget(announce_file_btn)
 
-        # Use generic announcements
-        self.club_announcements = self.load_default_announcements()
+        # Sessions start with the generic announcements
         self.announce_preview = QTextEdit()
         self.announce_preview.setReadOnly(True)
         self.announce_preview.setMaximumHeight(80)
@@ -527,13 +1093,11 @@ class NetControlWindow(QWidget):
         save_template_btn.setToolTip("Save current settings as a template")
         save_template_btn.setMinimumSize(115, 32)
 
-        self.quit_btn = AnimatedButton("🚪 Quit Application")
+        self.quit_btn = AnimatedButton("🚪 Quit Application", role="danger")
         self.quit_btn.clicked.connect(self.quit_net)
-        self.quit_btn.setStyleSheet("background-color: #e74c3c; color: white;")
 
-        self.start_btn = AnimatedButton("🚀 Generate Net Script")
+        self.start_btn = AnimatedButton("🚀 Generate Net Script", role="primary")
         self.start_btn.setMinimumHeight(50)
-        self.start_btn.setStyleSheet("font-size: 16px; font-weight: bold; background-color: #27ae60; color: white;")
         self.start_btn.clicked.connect(self.start_net_script)
 
         reset_btn = AnimatedButton("🔄 Reset Fields")
@@ -557,79 +1121,79 @@ class NetControlWindow(QWidget):
         self.setup_tab.setLayout(layout)
 
         # Enhanced validation for all fields
-        self.callsign_input.textChanged.connect(self.validate_fields)
-        self.name_input.textChanged.connect(self.validate_fields)
-        self.location_input.textChanged.connect(self.validate_fields)
-        self.club_name_input.textChanged.connect(self.validate_fields)
-        self.net_name_input.textChanged.connect(self.validate_fields)
+        self.validator = FieldValidator([
+            self.callsign_input, self.name_input, self.location_input,
+            self.club_name_input, self.net_name_input, self.meeting_time_input
+        ], self.start_btn.setEnabled, parent=self)
         self.validate_fields()
+        self.connect_config_fields()
 
-    def load_default_topics(self):
-        """Load default discussion topics"""
-        return [
-            "What's your favorite amateur radio operating mode and why?",
-            "Share a memorable QSO or contest experience from your amateur radio journey.",
-            "What new amateur radio equipment or technology have you tried recently?",
-            "Discuss your favorite amateur radio frequency band and what makes it special.",
-            "What amateur radio emergency preparedness activities have you participated in?",
-            "Share tips for new amateur radio operators getting started in the hobby.",
-            "What amateur radio project are you currently working on or planning?",
-            "Discuss the role of amateur radio in your local community.",
-            "What's the most interesting amateur radio contact you've made?",
-            "Share your thoughts on the future of amateur radio technology.",
-            "What amateur radio training or education have you found most valuable?",
-            "Discuss your experience with amateur radio public service events.",
-            "What advice would you give to someone considering getting their amateur radio license?",
-            "Share your favorite amateur radio memory or story.",
-            "What role does amateur radio play in your emergency preparedness plans?"
-        ]
+    def connect_config_fields(self):
+        """Persist user edits of club, operator and format fields to net_config.ini
 
-    def load_default_announcements(self):
-        """Load default club announcements"""
-        return [
-            "Remember to check our club website for the latest news and updates.",
-            "Our next club meeting will be announced on the website and mailing list.",
-            "New members are always welcome - visit our website for membership information.",
-            "Check out our club's social media presence for daily updates and photos.",
-            "Upcoming amateur radio events and contests will be posted on our website.",
-            "Technical help and elmering sessions are available - contact club officers.",
-            "Remember to follow good amateur radio operating practices on all repeaters."
-        ]
+        Only user-driven signals are used (textEdited, activated, clicked, and the
+        spin box only while it has focus), so filling the form from the config, a
+        template, saved settings or another session does not write the values back.
+        NetConfig debounces the keystrokes into one write.
+        """
+        line_edits = {
+            ('CLUB', 'name'): self.club_name_input,
+            ('CLUB', 'net_name'): self.net_name_input,
+            ('CLUB', 'meeting_time'): self.meeting_time_input,
+            ('CLUB', 'timezone'): self.timezone_input,
+            ('CLUB', 'repeater_info'): self.repeater_info_input,
+            ('CLUB', 'website'): self.website_input,
+            ('DEFAULTS', 'callsign'): self.callsign_input,
+            ('DEFAULTS', 'name'): self.name_input,
+            ('DEFAULTS', 'location'): self.location_input,
+        }
+        for (section, key), field in line_edits.items():
+            field.textEdited.connect(
+                lambda text, section=section, key=key: self.save_config_value(section, key, text)
+            )
+        # Arrow clicks, the wheel and typing all focus the spin box; setValue from code does not
+        self.num_topics_input.valueChanged.connect(
+            lambda value: self.num_topics_input.hasFocus() and self.save_config_value('DEFAULTS', 'num_topics', value)
+        )
+        self.meeting_day_combo.activated.connect(
+            lambda _index: self.save_config_value('CLUB', 'meeting_day', self.meeting_day_combo.currentText())
+        )
+        checkboxes = {
+            ('NET_FORMAT', 'is_directed'): self.directed_net_cb,
+            ('NET_FORMAT', 'use_roundtable'): self.roundtable_cb,
+            ('NET_FORMAT', 'emergency_priority'): self.emergency_traffic_cb,
+            ('NET_FORMAT', 'formal_traffic'): self.formal_traffic_cb,
+            ('SCRIPT_SECTIONS', 'use_elmering'): self.elmering_cb,
+        }
+        for (section, key), checkbox in checkboxes.items():
+            checkbox.clicked.connect(
+                lambda checked, section=section, key=key: self.save_config_value(section, key, checked)
+            )
+
+    def get_net_config(self):
+        if self.net_config is None:
+            self.net_config = NetConfig(on_save_error=lambda e: self.config_signals.save_failed.emit(str(e)))
+        return self.net_config
+
+    def save_config_value(self, section, key, value):
+        """Schedule a debounced write of one setting"""
+        self.get_net_config().save_config(section, key, value)
+
+    def config_save_failed(self, error):
+        print(f"Config save failed: {error}")
+        self.status_bar.show_message(f"Could not save settings: {error}", error=True)
 
-    # Updated validation method
     def validate_fields(self):
-        """Enhanced field validation for club and operator information"""
-        operator_valid = all([
-            self.callsign_input.text().strip(),
-            self.name_input.text().strip(),
-            self.location_input.text().strip()
-        ])
-
-        club_valid = all([
-            self.club_name_input.text().strip(),
-            self.net_name_input.text().strip(),
-            self.meeting_time_input.text().strip()
-        ])
-
-        # Visual feedback for invalid fields
-        required_fields = [
-            (self.callsign_input, self.callsign_input.text().strip()),
-            (self.name_input, self.name_input.text().strip()),
-            (self.location_input, self.location_input.text().strip()),
-            (self.club_name_input, self.club_name_input.text().strip()),
-            (self.net_name_input, self.net_name_input.text().strip()),
-            (self.meeting_time_input, self.meeting_time_input.text().strip())
-        ]
+        """Validate club and operator information now, flushing any debounced keystrokes"""
+        return self.validator.validate()
 
-        for field, value in required_fields:
-            if not value:
-                field.setStyleSheet("border-color: #e74c3c;")
-            else:
-                field.setStyleSheet("border-color: #28a745;")
+    def load_default_topics(self):
+        """Load default discussion topics"""
+        return list(DEFAULT_TOPICS)
 
-        valid = operator_valid and club_valid
-        self.start_btn.setEnabled(valid)
-        return valid
+    def load_default_announcements(self):
+        """Load default club announcements"""
+        return list(DEFAULT_ANNOUNCEMENTS)
 
     def load_announcements_file(self):
         """Load club announcements from file"""
@@ -641,15 +1205,73 @@ class NetControlWindow(QWidget):
         )
         if file:
             self.announce_file_path = os.path.dirname(file)
-            announcements = get_lines_from_file(file)
-            if announcements:
-                self.club_announcements = announcements  # ✅ Correct assignment
-                self.announce_file_label.setText(f"📁 {os.path.basename(file)} ({len(announcements)} items)")
-                self.announce_preview.setPlainText("\n".join(self.club_announcements))
-                self.status_bar.show_message(f"Loaded {len(announcements)} announcements")
+            self.run_background_task(
+                f"Loading {os.path.basename(file)}",
+                lambda report: self.read_announcements(file, report),
+                lambda result, session=self.session: self.announcements_loaded(result, session=session),
+                kind='announcements'
+            )
+
+    @staticmethod
+    def read_announcements(file, report):
+        """Worker-thread part of an announcements load: lines plus their preview text"""
+        announcements = read_lines(file, report)
+        return announcements, "\n".join(announcements)
+
+    @trace.traced
+    def announcements_loaded(self, result, nco=False, session=None):
+        """Store loaded announcements on the session that asked for them"""
+        session = session or self.session
+        announcements, preview = result
+        if announcements:
+            if nco:
+                session.nco_announcements = announcements
             else:
-                QMessageBox.warning(self, "No Announcements Found", "The selected file is empty or unreadable.")
-                self.status_bar.show_message("Failed to load announcements file", error=True)
+                session.club_announcements = announcements
+            if session is self.session:
+                self.announce_preview.setPlainText(preview)
+            self.status_bar.show_message(f"Loaded {len(announcements)} announcements")
+        else:
+            QMessageBox.warning(self, "No Announcements Found", "The selected file is empty or unreadable.")
+            self.status_bar.show_message("Failed to load announcements file", error=True)
+
+    def run_background_task(self, message, fn, on_finished, kind=None):
+        """Run fn(report_progress) on the worker pool with progress and cancel in the status bar
+
+        Tasks of different kinds run side by side; a new task cancels only a running
+        task of the same kind (defaulting to the same message), whose result is dropped.
+        """
+        kind = kind or message
+        superseded = self.active_tasks.get(kind)
+        if superseded is not None:
+            superseded.cancel()
+            self.status_bar.finish_task(superseded)
+        task = BackgroundTask(fn, message)
+        task.signals.progress.connect(lambda percent: self.task_progress(task, percent))
+        task.signals.finished.connect(lambda result: self.task_done(kind, task) and on_finished(result))
+        task.signals.failed.connect(lambda error: self.task_done(kind, task) and self.task_failed(message, error))
+        task.signals.canceled.connect(
+            lambda: self.task_done(kind, task) and self.status_bar.show_message(f"{message} canceled")
+        )
+        self.active_tasks[kind] = task
+        self.status_bar.start_task(task, message, task.cancel)
+        QThreadPool.globalInstance().start(task)
+
+    def task_progress(self, task, percent):
+        self.status_bar.set_progress(task, percent)
+
+    def task_done(self, kind, task):
+        """Clear the task from the status bar; False if it was superseded and should be ignored"""
+        if self.active_tasks.get(kind) is not task:
+            return False
+        del self.active_tasks[kind]
+        self.status_bar.finish_task(task)
+        return True
+
+    def task_failed(self, message, error):
+        print(f"{message} failed: {error}")
+        QMessageBox.warning(self, "Operation Failed", f"{message} failed:\n{error}")
+        self.status_bar.show_message(f"{message} failed", error=True)
 
     def init_script_tab(self):
         """Initialize the script execution tab"""
@@ -693,14 +1315,42 @@ class NetControlWindow(QWidget):
         self.edit_btn.toggled.connect(self.toggle_section_editing)
         self.edit_btn.setMinimumSize(115, 32)
 
+        # Edit history; while a page is being edited, Ctrl+Z inside it undoes typing instead
+        self.undo_btn = QPushButton("↶")
+        self.undo_btn.setToolTip("Undo the last edit to this section (Ctrl+Z)")
+        self.undo_btn.clicked.connect(self.undo_section_edit)
+
+        self.redo_btn = QPushButton("↷")
+        self.redo_btn.setToolTip("Redo (Ctrl+Y)")
+        self.redo_btn.clicked.connect(self.redo_section_edit)
+
+        self.original_btn = QPushButton("⟲ Original")
+        self.original_btn.setToolTip("Put every edited section back to the generated text")
+        self.original_btn.clicked.connect(self.reset_script_edits)
+
         self.export_btn = AnimatedButton("💾 Export Script")
         self.export_btn.clicked.connect(self.export_script)
         self.export_btn.setEnabled(False)
         self.export_btn.setMinimumSize(115, 32)
 
-        auto_advance_cb = QCheckBox("Auto-advance (15s)")
+        auto_advance_cb = QCheckBox("Auto-advance")
         auto_advance_cb.toggled.connect(self.toggle_auto_advance)
 
+        self.section_seconds_input = QSpinBox()
+        self.section_seconds_input.setRange(5, 3600)
+        self.section_seconds_input.setValue(self.default_section_seconds)
+        self.section_seconds_input.setSuffix(" s")
+        self.section_seconds_input.setToolTip("Auto-advance time for this section")
+        self.section_seconds_input.valueChanged.connect(self.set_section_duration)
+
+        self.pause_btn = QPushButton("⏸ Pause")
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.toggled.connect(self.toggle_pause)
+
+        self.countdown_label = QLabel("")
+        self.countdown_label.setMinimumWidth(90)
+
         control_layout.addWidget(self.prev_btn)
         control_layout.addWidget(self.next_btn)
         control_layout.addWidget(QLabel("|"))
@@ -708,7 +1358,13 @@ class NetControlWindow(QWidget):
         control_layout.addWidget(self.jump_spinner)
         control_layout.addWidget(QLabel("|"))
         control_layout.addWidget(self.edit_btn)
+        control_layout.addWidget(self.undo_btn)
+        control_layout.addWidget(self.redo_btn)
+        control_layout.addWidget(self.original_btn)
         control_layout.addWidget(auto_advance_cb)
+        control_layout.addWidget(self.section_seconds_input)
+        control_layout.addWidget(self.pause_btn)
+        control_layout.addWidget(self.countdown_label)
         control_layout.addStretch()
         control_layout.addWidget(self.export_btn)
 
@@ -725,8 +1381,13 @@ class NetControlWindow(QWidget):
         list_label = QLabel("📋 Script Sections")
         list_label.setStyleSheet("font-weight: bold; font-size: 14px;")
 
-        self.section_list = QListWidget()
-        self.section_list.itemClicked.connect(self.jump_to_section)
+        self.section_model = SectionListModel(self)
+        self.section_list = QListView()
+        self.section_list.setModel(self.section_model)
+        # Rows all have one height, so the view never measures rows it does not paint
+        self.section_list.setUniformItemSizes(True)
+        self.section_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.section_list.clicked.connect(self.jump_to_section)
         self.section_list.setAlternatingRowColors(True)
 
         left_layout.addWidget(list_label)
@@ -741,14 +1402,13 @@ class NetControlWindow(QWidget):
         self.section_label = QLabel("No script loaded")
         self.section_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50; padding: 10px;")
 
-        # Script text area
-        self.section_text = QTextEdit()
-        self.section_text.setReadOnly(True)
-        self.section_text.setFont(QFont("Consolas", 12))
-        self.section_text.setPlainText("Generate a net script from the Setup tab to begin.")
+        # Script text area; section_text always refers to the page currently shown
+        self.section_views = SectionViewStack("Generate a net script from the Setup tab to begin.",
+                                              QFont("Consolas", 12))
+        self.section_text = self.section_views.placeholder
 
         right_layout.addWidget(self.section_label)
-        right_layout.addWidget(self.section_text)
+        right_layout.addWidget(self.section_views)
         right_panel.setLayout(right_layout)
 
         # Add panels to splitter
@@ -757,9 +1417,8 @@ class NetControlWindow(QWidget):
         splitter.setSizes([200, 900])  # Give more space to script content
         self.set_splitter_top_bottom_ratio(splitter, 0.25)
 
-        quit_btn = AnimatedButton("🚪 Quit Application")
+        quit_btn = AnimatedButton("🚪 Quit Application", role="danger")
         quit_btn.clicked.connect(self.quit_net)
-        quit_btn.setStyleSheet("background-color: #e74c3c; color: white;")
 
         # Progress bar at bottom
         progress_layout = QHBoxLayout()
@@ -776,6 +1435,7 @@ class NetControlWindow(QWidget):
         self.script_tab.setLayout(layout)
 
 
+    @trace.traced
     def load_template(self):
         """Load a net configuration template"""
         file, _ = QFileDialog.getOpenFileName(
@@ -815,6 +1475,9 @@ class NetControlWindow(QWidget):
                     self.formal_traffic_cb.setChecked(temp_config.getboolean('NET_FORMAT', 'formal_traffic', fallback=False))
                     self.elmering_cb.setChecked(temp_config.getboolean('SCRIPT_SECTIONS', 'use_elmering', fallback=False))
                     self.comments_cb.setChecked(temp_config.getboolean('NET_FORMAT', 'allow_comments', fallback=True))
+                    index = self.template_set_combo.findData(temp_config.get('NET_FORMAT', 'template_set', fallback=''))
+                    if index >= 0:
+                        self.template_set_combo.setCurrentIndex(index)
 
                 self.status_bar.show_message(f"Template loaded: {os.path.basename(file)}")
 
@@ -857,7 +1520,8 @@ class NetControlWindow(QWidget):
                     'use_roundtable': str(self.roundtable_cb.isChecked()),
                     'allow_comments': str(self.comments_cb.isChecked()),
                     'emergency_priority': str(self.emergency_traffic_cb.isChecked()),
-                    'formal_traffic': str(self.formal_traffic_cb.isChecked())
+                    'formal_traffic': str(self.formal_traffic_cb.isChecked()),
+                    'template_set': self.template_set_combo.currentData()
                 }
 
                 # Script sections
@@ -874,40 +1538,322 @@ class NetControlWindow(QWidget):
                 QMessageBox.critical(self, "Template Save Error", f"Failed to save template:\n{str(e)}")
                 self.status_bar.show_message("Failed to save template", error=True)
 
-    # FIX FOR FIELD VALIDATION - Replace your existing validate_fields method
-    def validate_fields(self):
-        """Enhanced field validation for club and operator information"""
-        operator_valid = all([
-            self.callsign_input.text().strip(),
-            self.name_input.text().strip(),
-            self.location_input.text().strip()
-        ])
-
-        club_valid = all([
-            self.club_name_input.text().strip(),
-            self.net_name_input.text().strip(),
-            self.meeting_time_input.text().strip()
-        ])
-
-        # Visual feedback for invalid fields
-        required_fields = [
-            (self.callsign_input, self.callsign_input.text().strip()),
-            (self.name_input, self.name_input.text().strip()),
-            (self.location_input, self.location_input.text().strip()),
-            (self.club_name_input, self.club_name_input.text().strip()),
-            (self.net_name_input, self.net_name_input.text().strip()),
-            (self.meeting_time_input, self.meeting_time_input.text().strip())
-        ]
+    def init_checkins_tab(self):
+        """Initialize the check-in log tab; entry is keyboard-driven (Enter adds, Delete removes)"""
+        layout = QVBoxLayout()
 
-        for field, value in required_fields:
-            if not value:
-                field.setStyleSheet("border: 2px solid #e74c3c;")
-            else:
-                field.setStyleSheet("border: 2px solid #28a745;")
+        self.checkin_count_label = QLabel("Total Check-ins: 0")
+        self.checkin_count_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        layout.addWidget(self.checkin_count_label)
+
+        form_group = QGroupBox("➕ New Check-in")
+        form_layout = QGridLayout()
+        self.checkin_callsign_input = QLineEdit()
+        self.checkin_callsign_input.setPlaceholderText("e.g., W5ALC")
+        self.checkin_name_input = QLineEdit()
+        self.checkin_name_input.setPlaceholderText("e.g., Jon")
+        self.checkin_location_input = QLineEdit()
+        self.checkin_location_input.setPlaceholderText("e.g., Pueblo, CO")
+        self.checkin_comments_input = QLineEdit()
+        self.checkin_comments_input.setPlaceholderText("Optional comments or traffic details...")
+        self.checkin_group_combo = QComboBox()
+        self.checkin_group_combo.addItems(CHECKIN_GROUPS)
+        self.checkin_traffic_cb = QCheckBox("Has Traffic")
+        add_btn = QPushButton("Add Check-in")
+        add_btn.clicked.connect(self.add_checkin)
+
+        for field in (self.checkin_callsign_input, self.checkin_name_input,
+                      self.checkin_location_input, self.checkin_comments_input):
+            field.returnPressed.connect(self.add_checkin)
+        self.attach_roster(self.checkin_callsign_input, self.checkin_name_input, self.checkin_location_input)
+
+        form_layout.addWidget(QLabel("Callsign:"), 0, 0)
+        form_layout.addWidget(self.checkin_callsign_input, 0, 1)
+        form_layout.addWidget(QLabel("Name:"), 0, 2)
+        form_layout.addWidget(self.checkin_name_input, 0, 3)
+        form_layout.addWidget(QLabel("Location:"), 1, 0)
+        form_layout.addWidget(self.checkin_location_input, 1, 1)
+        form_layout.addWidget(QLabel("Group:"), 1, 2)
+        form_layout.addWidget(self.checkin_group_combo, 1, 3)
+        form_layout.addWidget(QLabel("Comments:"), 2, 0)
+        form_layout.addWidget(self.checkin_comments_input, 2, 1, 1, 2)
+        form_layout.addWidget(self.checkin_traffic_cb, 2, 3)
+        form_layout.addWidget(add_btn, 3, 3)
+        form_group.setLayout(form_layout)
+        layout.addWidget(form_group)
+
+        self.checkin_model = CheckInTableModel(self.checkin_store, self)
+        self.checkin_table = QTableView()
+        self.checkin_table.setModel(self.checkin_model)
+        self.checkin_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.checkin_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.checkin_table.setAlternatingRowColors(True)
+        # Fixed row heights and column widths, so appending a row never measures the others,
+        # and the row-number header, which would query every row to size itself, stays hidden
+        self.checkin_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.checkin_table.verticalHeader().setDefaultSectionSize(24)
+        self.checkin_table.verticalHeader().setVisible(False)
+        self.checkin_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.checkin_table.horizontalHeader().setStretchLastSection(True)
+        self.checkin_table.installEventFilter(self)
+        layout.addWidget(self.checkin_table)
 
-        valid = operator_valid and club_valid
-        self.start_btn.setEnabled(valid)
-        return valid
+        action_layout = QHBoxLayout()
+        remove_btn = QPushButton("Remove Selected")
+        remove_btn.clicked.connect(self.remove_checkin)
+        export_btn = QPushButton("Export Check-in Log...")
+        export_btn.clicked.connect(self.export_checkin_log)
+        end_btn = QPushButton("🏁 End Net && Log to History")
+        end_btn.clicked.connect(self.end_net)
+        action_layout.addWidget(remove_btn)
+        action_layout.addStretch()
+        action_layout.addWidget(export_btn)
+        action_layout.addWidget(end_btn)
+        layout.addLayout(action_layout)
+
+        self.checkins_tab.setLayout(layout)
+
+    def eventFilter(self, obj, event):
+        if (obj is getattr(self, 'checkin_table', None) and event.type() == event.Type.KeyPress
+                and event.key() == Qt.Key.Key_Delete):
+            self.remove_checkin()
+            return True
+        return super().eventFilter(obj, event)
+
+    @trace.traced
+    def add_checkin(self):
+        """Add the form's station to the log; duplicates are rejected and highlighted"""
+        try:
+            row = self.checkin_model.append(
+                self.checkin_callsign_input.text(),
+                name=self.checkin_name_input.text(),
+                location=self.checkin_location_input.text(),
+                comments=self.checkin_comments_input.text(),
+                traffic=self.checkin_traffic_cb.isChecked(),
+                group=self.checkin_group_combo.currentIndex()
+            )
+        except DuplicateCheckIn as e:
+            self.checkin_table.selectRow(e.row)
+            self.checkin_table.scrollTo(self.checkin_model.index(e.row, 0))
+            self.status_bar.show_message(f"{e.callsign} has already checked in", error=True)
+            self.checkin_callsign_input.selectAll()
+            return
+        except ValueError as e:
+            self.status_bar.show_message(str(e), error=True)
+            return
+
+        self.journal_event('checkin', row=list(self.checkin_store[row]))
+        callsign = self.checkin_store.callsigns[row]
+        for field in (self.checkin_callsign_input, self.checkin_name_input,
+                      self.checkin_location_input, self.checkin_comments_input):
+            field.clear()
+        self.checkin_traffic_cb.setChecked(False)
+        self.checkin_callsign_input.setFocus()
+        self.checkin_table.scrollToBottom()
+        self.update_checkin_count()
+        self.status_bar.show_message(f"Added check-in: {callsign}")
+
+    @trace.traced
+    def remove_checkin(self):
+        rows = self.checkin_table.selectionModel().selectedRows()
+        if rows:
+            row = rows[0].row()
+            callsign = self.checkin_model.remove(row)
+            self.journal_event('uncheckin', i=row)
+            self.update_checkin_count()
+            self.status_bar.show_message(f"Removed check-in: {callsign}")
+
+    @trace.traced
+    def end_net(self):
+        """Add this net to the history used by the Analytics tab and start a fresh check-in log"""
+        if not len(self.checkin_store) and not self.sections:
+            self.status_bar.show_message("Nothing to log yet", error=True)
+            return
+        reply = QMessageBox.question(
+            self, "End Net",
+            f"Log this net ({len(self.checkin_store)} check-ins) to history and clear the check-in log?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        ended = time.time()
+        started = self.net_started
+        if started is None:
+            started = min(self.checkin_store.times) if len(self.checkin_store) else ended
+        try:
+            self.history().record_net(started, ended, self.checkin_store, script_topics(self.sections))
+        except OSError as e:
+            QMessageBox.warning(self, "History Error", f"Failed to log the net:\n{e}")
+            self.status_bar.show_message("Failed to log the net", error=True)
+            return
+        self.checkin_model.clear()
+        self.journal_event('clear_checkins')
+        self.net_started = None
+        # The net was held, so regenerating must not forget the topics it used
+        self.recorded_net_id = None
+        self.update_checkin_count()
+        self.status_bar.show_message(f"Net logged: {len(self.net_history)} nets in history")
+
+    def update_checkin_count(self):
+        self.checkin_count_label.setText(f"Total Check-ins: {len(self.checkin_store)}")
+
+    @trace.traced
+    def export_checkin_log(self):
+        if not len(self.checkin_store):
+            self.status_bar.show_message("No check-ins to export", error=True)
+            return
+        file, _ = QFileDialog.getSaveFileName(
+            self, "Export Check-in Log", "checkin_log.txt", "Text Files (*.txt);;CSV Files (*.csv)"
+        )
+        if file:
+            # Snapshot the rows; the log keeps changing while the export runs
+            checkins = list(self.checkin_store)
+            self.run_background_task(
+                f"Exporting {os.path.basename(file)}",
+                lambda report: self.archive_file(export_checkin_log(file, checkins)),
+                lambda path: self.status_bar.show_message("Check-in log exported successfully")
+            )
+
+    def history(self):
+        if self.net_history is None:
+            from netcontrol.history import NetHistory  # NumPy is only needed once history is used
+            self.net_history = NetHistory()
+        return self.net_history
+
+    def init_analytics_tab(self):
+        """Trends over logged nets; recomputed from the history columns each time the tab is shown"""
+        layout = QVBoxLayout()
+
+        # Search over exported scripts and check-in logs
+        search_group = QGroupBox("🔎 Search Past Scripts")
+        search_layout = QVBoxLayout()
+        search_row = QHBoxLayout()
+
+        self.archive_search_input = QLineEdit()
+        self.archive_search_input.setPlaceholderText('Search exports, e.g. winlink or "field day"')
+        self.archive_search_input.returnPressed.connect(self.search_archive)
+
+        search_btn = AnimatedButton("🔎 Search")
+        search_btn.clicked.connect(self.search_archive)
+
+        index_btn = AnimatedButton("📂 Index Folder")
+        index_btn.setToolTip("Add a folder of older exports to the search index")
+        index_btn.clicked.connect(self.index_archive_folder)
+
+        search_row.addWidget(self.archive_search_input, 1)
+        search_row.addWidget(search_btn)
+        search_row.addWidget(index_btn)
+
+        self.archive_results = QListWidget()
+        self.archive_results.setWordWrap(True)
+        self.archive_results.setToolTip("Double-click a result to open the file")
+        self.archive_results.itemActivated.connect(self.open_archive_hit)
+
+        search_layout.addLayout(search_row)
+        search_layout.addWidget(self.archive_results)
+        search_group.setLayout(search_layout)
+
+        self.analytics_view = QTextEdit()
+        self.analytics_view.setReadOnly(True)
+        layout.addWidget(search_group, 1)
+        layout.addWidget(self.analytics_view, 2)
+        self.analytics_tab.setLayout(layout)
+
+    @staticmethod
+    def archive_file(path):
+        """Worker-thread step after an export: make the new file searchable"""
+        from netcontrol.archive import ScriptArchive
+        archive = ScriptArchive()
+        try:
+            archive.add_file(path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Could not index {path}: {e}")
+        finally:
+            archive.close()
+        return path
+
+    @trace.traced
+    def search_archive(self):
+        if self.archive is None:
+            from netcontrol.archive import ScriptArchive
+            self.archive = ScriptArchive()
+        started = time.perf_counter()
+        hits = self.archive.search(self.archive_search_input.text())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.archive_results.clear()
+        for hit in hits:
+            item = QListWidgetItem(f"{hit.dated}  {hit.title}\n{hit.snippet}")
+            item.setData(Qt.ItemDataRole.UserRole, hit.path)
+            item.setToolTip(hit.path)
+            self.archive_results.addItem(item)
+        self.status_bar.show_message(f"{len(hits)} matching exports of {len(self.archive):,} ({elapsed_ms:.0f} ms)")
+
+    def index_archive_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of Exported Scripts",
+                                                  os.path.expanduser("~"))
+        if folder:
+            self.run_background_task(f"Indexing {os.path.basename(folder) or folder}",
+                                     lambda report: self.read_archive_folder(folder, report),
+                                     self.archive_folder_indexed)
+
+    @staticmethod
+    def read_archive_folder(folder, report):
+        from netcontrol.archive import ScriptArchive
+        archive = ScriptArchive()
+        try:
+            return archive.index_folder(folder, report), len(archive)
+        finally:
+            archive.close()
+
+    def archive_folder_indexed(self, result):
+        (read, dropped), total = result
+        self.status_bar.show_message(f"Search index: {read:,} files indexed, {dropped:,} removed, "
+                                     f"{total:,} in all")
+
+    def open_archive_hit(self, item):
+        from PyQt6.QtGui import QDesktopServices
+        from PyQt6.QtCore import QUrl
+        QDesktopServices.openUrl(QUrl.fromLocalFile(item.data(Qt.ItemDataRole.UserRole)))
+
+    @trace.traced
+    def refresh_analytics(self):
+        history = self.history()
+        summary = history.summary()
+        if not summary['nets']:
+            self.analytics_view.setPlainText(
+                "No nets logged yet.\n\nUse \"End Net & Log to History\" on the Check-ins tab after a net."
+            )
+            return
+
+        average = summary['average_minutes']
+        parts = [
+            "<h2>Net History</h2>",
+            f"<p><b>{summary['nets']}</b> nets from {datetime.fromtimestamp(summary['first']):%b %d, %Y} "
+            f"to {datetime.fromtimestamp(summary['last']):%b %d, %Y}<br>",
+            f"<b>{summary['checkins']}</b> check-ins, {summary['checkins_per_net']:.1f} per net, "
+            f"{summary['traffic']} with traffic<br>",
+            f"Average net length: <b>{average:.0f} min</b></p>" if average is not None else "</p>",
+            "<h3>Check-ins by Group</h3><table cellpadding=\"4\">",
+        ]
+        for group, count in history.group_totals().items():
+            parts.append(f"<tr><td>{group}</td><td align=\"right\">{count}</td></tr>")
+        parts.append("</table>")
+
+        weeks, totals, by_group = history.weekly_checkins()
+        parts.append("<h3>Check-ins per Week (last 12)</h3><table cellpadding=\"4\"><tr><th>Week of</th>"
+                     "<th>Total</th>" + "".join(f"<th>{group}</th>" for group in CHECKIN_GROUPS) + "</tr>")
+        for week, total, groups in list(zip(weeks.tolist(), totals.tolist(), by_group.tolist()))[-12:][::-1]:
+            parts.append(f"<tr><td>{week:%b %d, %Y}</td><td align=\"right\">{total}</td>"
+                         + "".join(f"<td align=\"right\">{count}</td>" for count in groups) + "</tr>")
+        parts.append("</table>")
+
+        popular = history.topic_popularity()
+        if popular:
+            parts.append("<h3>Most Used Topics</h3><ol>")
+            parts.extend(f"<li>{html.escape(topic)} ({count})</li>" for topic, count in popular)
+            parts.append("</ol>")
+        self.analytics_view.setHtml("".join(parts))
 
     def init_settings_tab(self):
         """Initialize settings tab"""
@@ -923,13 +1869,20 @@ class NetControlWindow(QWidget):
 
         theme_btn = AnimatedButton("🌙 Dark Mode")
         theme_btn.setCheckable(True)
+        theme_btn.setChecked(self.theme_dark)
         theme_btn.toggled.connect(self.toggle_theme)
         self.theme_btn = theme_btn
 
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(self.theme_manager.names())
+        self.theme_combo.setCurrentText(self.theme_name)
+        self.theme_combo.currentTextChanged.connect(self.set_theme)
+
         appearance_layout.addWidget(QLabel("Display Font:"), 0, 0)
         appearance_layout.addWidget(font_btn, 0, 1)
         appearance_layout.addWidget(QLabel("Theme:"), 1, 0)
         appearance_layout.addWidget(theme_btn, 1, 1)
+        appearance_layout.addWidget(self.theme_combo, 1, 2)
 
         appearance_group.setLayout(appearance_layout)
 
@@ -943,11 +1896,60 @@ class NetControlWindow(QWidget):
         self.confirm_quit_cb = QCheckBox("Confirm before quitting during active net")
         self.confirm_quit_cb.setChecked(True)
 
+        self.trace_cb = QCheckBox("Record a performance trace (saved when turned off or on exit)")
+        self.trace_cb.setToolTip("Writes a Chrome trace file that opens in ui.perfetto.dev")
+        self.trace_cb.setChecked(trace.active())
+        self.trace_cb.toggled.connect(self.set_tracing)
+
         behavior_layout.addWidget(self.remember_settings_cb)
         behavior_layout.addWidget(self.confirm_quit_cb)
+        behavior_layout.addWidget(self.trace_cb)
 
         behavior_group.setLayout(behavior_layout)
 
+        # Roster used for callsign, name and location completion
+        roster_group = QGroupBox("📇 Station Roster")
+        roster_layout = QHBoxLayout()
+
+        self.roster_label = QLabel()
+        self.roster_label.setWordWrap(True)
+        self.update_roster_label()
+
+        roster_btn = AnimatedButton("📂 Load Roster File")
+        roster_btn.clicked.connect(self.load_roster_file)
+
+        licensee_btn = AnimatedButton("🗄 Import Licensee File")
+        licensee_btn.setToolTip("Import a pipe-delimited licensee dump (e.g. ULS EN.dat) for name/location lookup")
+        licensee_btn.clicked.connect(self.import_licensee_file)
+
+        roster_layout.addWidget(self.roster_label, 1)
+        roster_layout.addWidget(roster_btn)
+        roster_layout.addWidget(licensee_btn)
+        roster_group.setLayout(roster_layout)
+
+        # Read-only view of the shown section for the backup NCO and logger
+        mirror_group = QGroupBox("📡 Web Mirror")
+        mirror_layout = QGridLayout()
+
+        self.mirror_cb = QCheckBox("Share the current section with browsers on the local network")
+        self.mirror_cb.setChecked(self.mirror is not None)
+        self.mirror_cb.toggled.connect(self.set_mirror_enabled)
+
+        self.mirror_port_input = QSpinBox()
+        self.mirror_port_input.setRange(1024, 65535)
+        self.mirror_port_input.setValue(self.mirror_port)
+        self.mirror_port_input.editingFinished.connect(self.set_mirror_port)
+
+        self.mirror_label = QLabel()
+        self.mirror_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.update_mirror_label()
+
+        mirror_layout.addWidget(self.mirror_cb, 0, 0, 1, 2)
+        mirror_layout.addWidget(QLabel("Port:"), 1, 0)
+        mirror_layout.addWidget(self.mirror_port_input, 1, 1)
+        mirror_layout.addWidget(self.mirror_label, 2, 0, 1, 2)
+        mirror_group.setLayout(mirror_layout)
+
         # Help section
         help_group = QGroupBox("❓ Help & Shortcuts")
         help_layout = QVBoxLayout()
@@ -962,6 +1964,7 @@ class NetControlWindow(QWidget):
             "Ctrl+Right: Next Section\n"
             "Ctrl+Left: Previous Section\n"
             "Ctrl+E: Export Script\n"
+            "Ctrl+Z / Ctrl+Y: Undo / Redo Section Edit\n"
             "Esc: Quit Application\n\n"
             "Tips:\n"
             "• Use the section list to quickly jump to any part of the script\n"
@@ -979,9 +1982,8 @@ class NetControlWindow(QWidget):
         help_btn = AnimatedButton("📖 Show Help")
         help_btn.clicked.connect(self.show_shortcuts_help)
 
-        quit_btn = AnimatedButton("🚪 Quit Application")
+        quit_btn = AnimatedButton("🚪 Quit Application", role="danger")
         quit_btn.clicked.connect(self.quit_net)
-        quit_btn.setStyleSheet("background-color: #e74c3c; color: white;")
 
         action_layout.addWidget(help_btn)
         action_layout.addStretch()
@@ -989,188 +1991,227 @@ class NetControlWindow(QWidget):
 
         layout.addWidget(appearance_group)
         layout.addWidget(behavior_group)
+        layout.addWidget(roster_group)
+        layout.addWidget(mirror_group)
         layout.addWidget(help_group)
         layout.addLayout(action_layout)
         layout.addStretch()
 
         self.settings_tab.setLayout(layout)
 
-    def apply_modern_theme(self):
-        """Apply modern styling to the application"""
-        style = """
-        QWidget {
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 13px;
-            color: #212529;
-            background-color: #f8f9fa;
-        }
-
-        QTabWidget::pane {
-            border: 1px solid #c0c0c0;
-            color: #212529;
-            background-color: #f8f9fa;
-        }
-
-        QTabBar::tab {
-            background: #e0e0e0;
-            border: 1px solid #b0b0b0;
-            padding: 8px 16px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-
-        QTabBar::tab:selected {
-            background: #d0d0d0;
-            border-color: #a0a0a0;
-            border-bottom: none;
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #cccccc;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding: 10px;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            left: 10px;
-            padding: 0 8px;
-        }
-
-        QLineEdit, QSpinBox, QComboBox {
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            padding: 6px 8px;
-            font-size: 13px;
-            color: #212529;
-            background-color: #ffffff;
-        }
-
-        QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
-            border-color: #4a90e2;
-            background-color: #f0f8ff;
-        }
-
-        QPushButton {
-            color: #212529;
-            background-color: #17a2b8;
-            border: 2px solid #138496;
-            border-radius: 6px;
-            padding: 8px 16px;
-            color: white;
-            font-weight: 500;
-        }
-
-        QPushButton:hover {
-            background-color: #138496;
-            border-color: #117a8b;
-        }
-
-        QPushButton:pressed {
-            background-color: #117a8b;
-        }
-
-        QPushButton:disabled {
-            background-color: #e0e0e0;
-            color: #6c757d;
-            border-color: #cccccc;
-        }
-
-        QTextEdit {
-            border: 1px solid #ccc;
-            border-radius: 4px;
-            background-color: #f4f4f4;
-            font-family: 'Consolas', 'Courier New', monospace;
-            font-size: 14px;
-            line-height: 1.4;
-        }
-
-        QListWidget {
-            border: 1px solid #ccc;
-            border-radius: 4px;
-            background-color: #ffffff;
-            alternate-background-color: #f1f3f5;
-        }
-
-        QListWidget::item {
-            padding: 8px;
-            border-bottom: 1px solid #e9ecef;
-        }
-
-        QListWidget::item:selected {
-            background-color: #4a90e2;
-            color: white;
-        }
+    def attach_roster(self, callsign_field, name_field, location_field):
+        """Complete a callsign/name/location trio from the roster; a chosen callsign fills in the rest"""
+        from netcontrol.roster import CALLSIGN, NAME, LOCATION
+        completers = [RosterCompleter(field, column, self.roster) for field, column in
+                      ((callsign_field, CALLSIGN), (name_field, NAME), (location_field, LOCATION))]
+        self.roster_completers.extend(completers)
+        completers[0].activated.connect(
+            lambda callsign: self.fill_from_roster(callsign, name_field, location_field, overwrite=True)
+        )
+        callsign_field.editingFinished.connect(
+            lambda: self.fill_from_roster(callsign_field.text(), name_field, location_field)
+        )
 
-        QProgressBar {
-            border: 1px solid #ccc;
-            border-radius: 4px;
-            text-align: center;
-            height: 20px;
-        }
+    @trace.traced
+    def fill_from_roster(self, callsign, name_field, location_field, overwrite=False):
+        """Fill name and location for a roster callsign; typed-in values are kept unless overwrite"""
+        station = self.roster.lookup(callsign) if self.roster is not None else None
+        if station is None:
+            station = self.lookup_licensee(callsign)
+        if station is None:
+            return
+        _, name, location = station
+        for field, value in ((name_field, name), (location_field, location)):
+            if value and (overwrite or not field.text().strip()):
+                field.setText(value)
 
-        QProgressBar::chunk {
-            background-color: #28a745;
-            border-radius: 4px;
-        }
+    def load_roster_file(self):
+        file, _ = QFileDialog.getOpenFileName(
+            self, "Select Roster File", os.path.dirname(self.roster_file) or os.path.expanduser("~"),
+            "Roster Files (*.txt *.dat *.csv);;All Files (*)"
+        )
+        if file:
+            self.load_roster(file)
+
+    def load_roster(self, file):
+        """Open a roster in the background; the first open of a file builds its index, later ones reuse it"""
+        from netcontrol.roster import Roster
+        self.run_background_task(
+            f"Indexing roster {os.path.basename(file)}",
+            lambda report: Roster(file, progress=report),
+            lambda roster: self.roster_loaded(file, roster),
+            kind='roster'
+        )
 
-        QLabel {
-            font-weight: normal;
-        }
+    @trace.traced
+    def roster_loaded(self, file, roster):
+        if self.roster is not None:
+            self.roster.close()
+        self.roster = roster
+        self.roster_file = file
+        for completer in self.roster_completers:
+            completer.roster = roster
+        self.update_roster_label()
+        self.status_bar.show_message(f"Roster loaded: {len(roster):,} stations")
+
+    def lookup_licensee(self, callsign):
+        if self.licensee_store is None:
+            from netcontrol.licensees import LicenseeStore, LICENSEE_DB
+            if not os.path.exists(LICENSEE_DB):
+                return None
+            self.licensee_store = LicenseeStore()
+        return self.licensee_store.lookup(callsign)
+
+    def import_licensee_file(self):
+        file, _ = QFileDialog.getOpenFileName(
+            self, "Select Licensee File", os.path.expanduser("~"), "Licensee Files (*.dat *.txt);;All Files (*)"
+        )
+        if file:
+            self.run_background_task(f"Importing {os.path.basename(file)}",
+                                     lambda report: self.read_licensee_file(file, report),
+                                     self.licensee_file_imported, kind='licensees')
+
+    @staticmethod
+    def read_licensee_file(file, report):
+        """Worker-thread import; SQLite connections stay on the thread that opened them"""
+        from netcontrol.licensees import LicenseeStore
+        store = LicenseeStore()
+        try:
+            return store.import_file(file, report)
+        finally:
+            store.close()
 
-        QCheckBox {
-            padding: 4px;
-        }
-        """
-        self.setStyleSheet(style)
+    def licensee_file_imported(self, result):
+        self.status_bar.show_message(f"Licensee import: {result}")
 
+    def update_roster_label(self):
+        if not hasattr(self, 'roster_label'):
+            return
+        if self.roster is not None:
+            self.roster_label.setText(f"{self.roster_file} ({len(self.roster):,} stations)")
+        else:
+            self.roster_label.setText(self.roster_file or "No roster loaded. One station per line: "
+                                                         "CALLSIGN|Name|Location")
 
-    def validate_fields(self):
-        """Enhanced field validation for club and operator information"""
-        operator_valid = all([
-            self.callsign_input.text().strip(),
-            self.name_input.text().strip(),
-            self.location_input.text().strip()
-        ])
-
-        club_valid = all([
-            self.club_name_input.text().strip(),
-            self.net_name_input.text().strip(),
-            self.meeting_time_input.text().strip()
-        ])
-
-        # Visual feedback for invalid fields
-        required_fields = [
-            (self.callsign_input, self.callsign_input.text().strip()),
-            (self.name_input, self.name_input.text().strip()),
-            (self.location_input, self.location_input.text().strip()),
-            (self.club_name_input, self.club_name_input.text().strip()),
-            (self.net_name_input, self.net_name_input.text().strip()),
-            (self.meeting_time_input, self.meeting_time_input.text().strip())
-        ]
+    def start_mirror(self):
+        from netcontrol.mirror import SectionMirror  # asyncio is only needed once the mirror is on
+        self.mirror = SectionMirror('0.0.0.0', self.mirror_port)
+        try:
+            self.mirror.start()
+        except OSError as e:
+            self.mirror = None
+            self.status_bar.show_message(f"Web mirror could not use port {self.mirror_port}: {e.strerror}",
+                                         error=True)
+            return False
+        self.mirror.publish_script(self.sections, self.section_idx)
+        self.status_bar.show_message(f"Web mirror at {self.mirror.url}")
+        return True
+
+    def stop_mirror(self):
+        if self.mirror is not None:
+            self.mirror.stop()
+            self.mirror = None
+
+    def set_mirror_enabled(self, enabled):
+        self.mirror_enabled = enabled
+        if enabled and self.mirror is None:
+            if not self.start_mirror():
+                self.mirror_cb.setChecked(False)
+        elif not enabled:
+            self.stop_mirror()
+        self.update_mirror_label()
+
+    def set_mirror_port(self):
+        port = self.mirror_port_input.value()
+        if port != self.mirror_port:
+            self.mirror_port = port
+            if self.mirror is not None:
+                self.stop_mirror()
+                self.set_mirror_enabled(True)
+
+    def update_mirror_label(self):
+        if not hasattr(self, 'mirror_label'):
+            return
+        if self.mirror is not None:
+            self.mirror_label.setText(f"Viewers open {self.mirror.url} in a browser")
+        else:
+            self.mirror_label.setText("Off")
 
-        for field, value in required_fields:
-            if not value:
-                field.setStyleSheet("border: 2px solid #e74c3c;")
-            else:
-                field.setStyleSheet("border: 2px solid #28a745;")
+    def set_tracing(self, enabled):
+        if enabled:
+            trace.start()
+            self.status_bar.show_message("Recording a performance trace")
+        else:
+            self.save_trace()
 
-        valid = operator_valid and club_valid
-        self.start_btn.setEnabled(valid)
-        return valid
+    def save_trace(self):
+        try:
+            path = trace.stop()
+        except OSError as e:
+            self.status_bar.show_message(f"Could not write the trace: {e}", error=True)
+            return
+        if path:
+            print(f"Trace written to {os.path.abspath(path)}")
+            self.status_bar.show_message(f"Trace written to {os.path.basename(path)}")
 
     def toggle_auto_advance(self, checked):
         """Toggle auto-advance functionality"""
         self.auto_advance = checked
+        self.pause_btn.setEnabled(checked)
         if checked:
+            self.schedule_section()
             self.status_bar.show_message("Auto-advance enabled - sections will advance automatically")
         else:
+            self.stop_schedule()
             self.status_bar.show_message("Auto-advance disabled")
 
+    def section_duration(self, index):
+        title = self.sections[index][0]
+        return self.section_durations.get(title, self.default_section_seconds)
+
+    def schedule_section(self, chain=False):
+        """(Re)start the countdown for the current section if auto-advance applies"""
+        if self.pause_btn.isChecked():
+            self.pause_btn.setChecked(False)
+        if self.auto_advance and self.sections and self.section_idx < len(self.sections) - 1:
+            self.scheduler.start(self.section_duration(self.section_idx), chain)
+        else:
+            self.stop_schedule()
+
+    def stop_schedule(self):
+        self.scheduler.cancel()
+        self.countdown_label.setText("")
+
+    def auto_advance_due(self):
+        if self.section_idx < len(self.sections) - 1:
+            self.section_idx += 1
+            self.display_section(chain=True)
+            self.update_navigation()
+
+    def show_time_remaining(self, seconds):
+        whole = math.ceil(seconds)
+        self.countdown_label.setText(f"⏱ {whole // 60}:{whole % 60:02d} left")
+
+    def set_section_duration(self, seconds):
+        """Spin box edit: remember this section's length and apply it to the running countdown"""
+        if not self.sections or self.section_durations_updating:
+            return
+        self.section_durations[self.sections[self.section_idx][0]] = seconds
+        self.scheduler.set_duration(seconds)
+        remaining = self.scheduler.remaining()
+        if remaining is not None:
+            self.show_time_remaining(remaining)
+
+    def toggle_pause(self, paused):
+        if paused:
+            self.scheduler.pause()
+            self.pause_btn.setText("▶ Resume")
+            if self.scheduler.remaining() is not None:
+                self.countdown_label.setText(self.countdown_label.text().replace("left", "paused"))
+        else:
+            self.scheduler.resume()
+            self.pause_btn.setText("⏸ Pause")
+
     def jump_to_section_number(self, section_num):
         """Jump to a specific section by number"""
         if 1 <= section_num <= len(self.sections):
@@ -1185,15 +2226,32 @@ class NetControlWindow(QWidget):
         )
         if file:
             self.topic_file_path = os.path.dirname(file)
-            topics = get_lines_from_file(file)
-            if topics:
-                self.topics = topics
-                self.topic_file_label.setText(f"📁 {os.path.basename(file)} ({len(topics)} topics)")
-                self.topic_preview.setPlainText("\n".join(self.topics[:3]) + f"\n... and {len(topics)-3} more")
-                self.status_bar.show_message(f"Loaded {len(topics)} topics from {os.path.basename(file)}")
-            else:
-                QMessageBox.warning(self, "No Topics Found", "The selected file is empty or unreadable.")
-                self.status_bar.show_message("Failed to load topics file", error=True)
+            self.run_background_task(
+                f"Loading {os.path.basename(file)}",
+                lambda report: self.index_topics(file, report),
+                lambda result, session=self.session: self.topics_loaded(file, result, session),
+                kind='topics'
+            )
+
+    def index_topics(self, file, report):
+        """Worker-thread part of a topics load: the line index plus its preview text"""
+        # Large libraries stay on disk; only sampled/previewed lines are decoded, and a file
+        # already opened by another session is shared rather than mapped again
+        topics = self.sessions.topic_library(file, progress=report)
+        return topics, topic_preview_text(topics)
+
+    @trace.traced
+    def topics_loaded(self, file, result, session=None):
+        session = session or self.session
+        topics, preview = result
+        if topics:
+            session.topics = topics
+            if session is self.session:
+                self.topic_preview.setPlainText(preview)
+            self.status_bar.show_message(f"Loaded {len(topics)} topics from {os.path.basename(file)}")
+        else:
+            QMessageBox.warning(self, "No Topics Found", "The selected file is empty or unreadable.")
+            self.status_bar.show_message("Failed to load topics file", error=True)
 
     def load_nco_file(self):
         file, _ = QFileDialog.getOpenFileName(
@@ -1201,151 +2259,79 @@ class NetControlWindow(QWidget):
         )
         if file:
             self.nco_file_path = os.path.dirname(file)
-            announcements = get_lines_from_file(file)
-            if announcements:
-                self.nco_announcements = announcements
-                self.nco_file_label.setText(f"📁 {os.path.basename(file)} ({len(announcements)} items)")
-                self.nco_preview.setPlainText("\n".join(self.nco_announcements))
-                self.status_bar.show_message(f"Loaded {len(announcements)} announcements")
-            else:
-                QMessageBox.warning(self, "No Announcements Found", "The selected file is empty or unreadable.")
-                self.status_bar.show_message("Failed to load announcements file", error=True)
+            self.run_background_task(
+                f"Loading {os.path.basename(file)}",
+                lambda report: self.read_announcements(file, report),
+                lambda result, session=self.session: self.announcements_loaded(result, nco=True, session=session),
+                kind='nco-announcements'
+            )
 
     def choose_font(self):
+        from PyQt6.QtWidgets import QFontDialog
+
+        self.ensure_tab(self.SCRIPT_TAB)
         font, ok = QFontDialog.getFont(self.section_text.font(), self, "Choose Script Font")
         if ok:
-            self.section_text.setFont(font)
+            self.section_views.set_script_font(font)
             self.topic_preview.setFont(font)
-            self.nco_preview.setFont(font)
+            self.announce_preview.setFont(font)
             self.last_font = font
             self.status_bar.show_message("Font updated successfully")
 
     def toggle_theme(self, dark_mode):
         """Toggle between light and dark themes"""
-        self.theme_dark = dark_mode
-        if dark_mode:
-            self.apply_dark_theme()
-            self.status_bar.show_message("Dark theme enabled")
-        else:
-            self.apply_modern_theme()
-            self.status_bar.show_message("Light theme enabled")
-
-    def apply_dark_theme(self):
-        """Apply dark theme styling"""
-        dark_style = """
-        QWidget {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 13px;
-        }
-
-        QTabWidget::pane {
-            border: 1px solid #555555;
-            background-color: #2b2b2b;
-        }
-
-        QTabBar::tab {
-            background: #3c3c3c;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            margin-right: 2px;
-            color: #ffffff;
-        }
-
-        QTabBar::tab:selected {
-            background: #2b2b2b;
-            border-bottom-color: #2b2b2b;
-        }
-
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #555555;
-            border-radius: 8px;
-            margin-top: 10px;
-            padding-top: 10px;
-            color: #ffffff;
-        }
-
-        QLineEdit, QSpinBox {
-            border: 2px solid #555555;
-            border-radius: 4px;
-            padding: 8px;
-            font-size: 13px;
-            background-color: #3c3c3c;
-            color: #ffffff;
-        }
-
-        QLineEdit:focus, QSpinBox:focus {
-            border-color: #4a90e2;
-        }
-
-        QPushButton {
-            background-color: #3c3c3c;
-            border: 2px solid #555555;
-            border-radius: 4px;
-            padding: 4px 8px;
-            font-weight: 500;
-            color: #ffffff;
-        }
-
-        QPushButton:hover {
-            background-color: #4a4a4a;
-            border-color: #777777;
-        }
-
-        QTextEdit {
-            border: 1px solid #555555;
-            border-radius: 4px;
-            background-color: #3c3c3c;
-            color: #ffffff;
-            font-family: 'Consolas', 'Courier New', monospace;
-            font-size: 14px;
-            line-height: 1.4;
-        }
-
-        QListWidget {
-            border: 1px solid #555555;
-            border-radius: 4px;
-            background-color: #3c3c3c;
-            color: #ffffff;
-            alternate-background-color: #2b2b2b;
-        }
+        self.set_theme('Dark' if dark_mode else 'Light')
 
-        QListWidget::item:selected {
-            background-color: #4a90e2;
-            color: white;
-        }
-        """
-        self.setStyleSheet(dark_style)
+    @trace.traced
+    def set_theme(self, name):
+        if name == self.theme_name or name not in self.theme_manager.themes:
+            return
+        self.theme_name = name
+        self.theme_dark = self.theme_manager.themes[name].dark
+        self.apply_theme()
+        if hasattr(self, 'theme_btn'):
+            self.theme_btn.blockSignals(True)
+            self.theme_btn.setChecked(self.theme_dark)
+            self.theme_btn.blockSignals(False)
+            self.theme_combo.blockSignals(True)
+            self.theme_combo.setCurrentText(name)
+            self.theme_combo.blockSignals(False)
+        self.status_bar.show_message(f"{name} theme enabled")
+
+    @trace.traced
+    def apply_theme(self):
+        """Apply the current theme; palettes and stylesheets are built once per theme"""
+        self.theme_manager.apply(self.theme_name)
 
     def randomize_topics(self):
         """Randomize the order of topics"""
-        random.shuffle(self.topics)
-        self.topic_preview.setPlainText("\n".join(self.topics[:3]) + f"\n... and {len(self.topics)-3} more")
+        if isinstance(self.topics, LineIndex):
+            self.topics.shuffle()
+        else:
+            random.shuffle(self.topics)
+        self.topic_preview.setPlainText(topic_preview_text(self.topics))
         self.status_bar.show_message("Topics randomized")
 
     def reset_fields(self):
         """Reset all input fields to defaults"""
         # Load defaults from config
-        config = NetConfig()
-        defaults = config.get_defaults()
-        club_info = config.get_club_info()
-        self.meeting_time_input.setText(club_info['meeting_time'])
+        net_config = self.get_net_config()
+        defaults = net_config.get_defaults()
+        club_info = net_config.get_club_info()
 
         # Reset operator fields
-        self.callsign_input.setText(defaults['callsign'])
-        self.name_input.setText(defaults['name'])
-        self.location_input.setText(defaults['location'])
-        self.num_topics_input.setValue(defaults['num_topics'])
+        self.callsign_input.setText(defaults.callsign)
+        self.name_input.setText(defaults.name)
+        self.location_input.setText(defaults.location)
+        self.num_topics_input.setValue(defaults.num_topics)
 
         # Reset club fields
-        self.club_name_input.setText(club_info['name'])
-        self.net_name_input.setText(club_info['net_name'])
-        self.meeting_time_input.setText(club_info['meeting_time'])
-        self.timezone_input.setText(club_info['timezone'])
-        self.repeater_info_input.setText(club_info['repeater_info'])
-        self.website_input.setText(club_info['website'])
+        self.club_name_input.setText(club_info.name)
+        self.net_name_input.setText(club_info.net_name)
+        self.meeting_time_input.setText(club_info.meeting_time)
+        self.timezone_input.setText(club_info.timezone)
+        self.repeater_info_input.setText(club_info.repeater_info)
+        self.website_input.setText(club_info.website)
 
         # Reset topics and announcements
         self.topics = self.load_default_topics()
@@ -1354,135 +2340,341 @@ class NetControlWindow(QWidget):
         # Reset labels and previews
 #        self.topic_file_label.setText("Using default topics")
 #        self.announce_file_label.setText("Using default announcements")
-        self.topic_preview.setPlainText("\n".join(self.topics[:3]) + f"\n... and {len(self.topics)-3} more")
+        self.topic_preview.setPlainText(topic_preview_text(self.topics))
         self.announce_preview.setPlainText("\n".join(self.club_announcements))
 
         self.status_bar.show_message("Fields reset to defaults")
 
+    @trace.traced
     def start_net_script(self):
         """Generate and start the net script"""
         if not self.validate_fields():
             self.status_bar.show_message("Please fill in all required fields", error=True)
             return
 
-        self.generate_script_sections()
-        self.section_idx = 0
+        self.ensure_tab(self.SCRIPT_TAB)
+        try:
+            self.generate_script_sections()
+        except (TemplateError, OSError) as e:
+            QMessageBox.critical(self, "Template Error", f"Failed to render the script templates:\n{str(e)}")
+            self.status_bar.show_message("Script generation failed", error=True)
+            return
+        self.net_started = time.time()
+        self.section_edits = {}
+        profile = self.current_profile()
+        self.journal_event('script', sections=[list(section) for section in self.sections],
+                           started=self.net_started, profile=asdict(profile))
+        self.rename_session(self.session, profile.net_name)
+        self.show_script()
+        self.status_bar.show_message("Net script generated successfully!")
+
+    @trace.traced
+    def show_script(self, index=0, switch_tab=True):
+        """Show self.sections from section `index` on the Script tab"""
+        self.section_text = self.section_views.clear()
         self.progress.setMaximum(len(self.sections))
         self.progress.setVisible(True)
+        self.populate_section_list()
+        self.section_idx = index
+        if self.mirror is not None:
+            self.mirror.publish_script(self.sections, index)
         self.display_section()
         self.update_navigation()
-        self.populate_section_list()
-
-        # Switch to script tab
-        self.tab_widget.setCurrentIndex(1)
-        self.status_bar.show_message("Net script generated successfully!")
-
-    def generate_script_sections(self):
-        """Generate all script sections"""
-        callsign = self.callsign_input.text().strip()
-        name = self.name_input.text().strip()
-        location = self.location_input.text().strip()
-        time = self.meeting_time_input.text().strip()
-        club_name = self.club_name_input.text().strip()
-        day = self.meeting_day_combo.currentText().strip()
-        net_name = self.net_name_input.text().strip()
-        num_topics = self.num_topics_input.value()
-
-        selected_topics = random.sample(self.topics, min(num_topics, len(self.topics)))
-
-        self.sections = []
-        self.export_lines = []
-
-        # Opening
-        opening_text = f"""START OF NET:
-
-    Good evening everyone, it is {time} in the Rocky Mountains. This is {name}, {callsign}, located in {location}. Welcome to the {club_name} {day} Night {net_name}.
-
-    This NET meets every {time} Night to discuss amateur radio and other interesting topics. We are here to have fun on the radio through our communications and help to make the use of many fine repeaters that otherwise might be very underutilized and quiet. That also lets others hear that the repeaters are on the air, and that they are active!
 
-    When more than 2 people are using the repeaters, please set up a 'rotation' so that you won't be doubling over the other parties in a 'round table' discussion. It is VERY IMPORTANT to remember you are on many repeaters simultaneously. Good amateur operating practice is remembering to allow all who might want to join in an opportunity to do so, just like using a single stand-alone repeater. Long ragchews are welcome, though remember, most of the repeaters have a 3-minute timeout, keep that in mind as you talk to a friend.
+        if switch_tab:
+            self.tab_widget.setCurrentIndex(self.SCRIPT_TAB)
 
-    (BREAK FOR REPEATER RESET)"""
-
-
-        # Connection Instructions
-        connect_text = """    When monitoring the repeater system, we ask that you DO NOT 'KERCHUNCK' the system or repeater to test to see if you are keying up the system. PLEASE DO come on and ask for a radio check. KERCHUNCKING the system can cause link issues. Once again, to see if you are making the 'repeater' actually come on and ask for a radio check. Most of the time you will get an answer from someone. AND, if YOU hear anyone ask for a radio check and no one responds fairly quickly, then you come on and advise the asking station that they are making the system and can be heard, or give a proper signal report.
-
-    (BREAK FOR REPEATER RESET)"""
-
-        # Open Floor
-        open_floor_text = """Now we'll open the floor for any additional comments, questions, or announcements. This is your opportunity to share anything ham radio related that we haven't covered tonight. Please give your callsign twice if you have something to share."""
-
-        # Net Instructions
-        net_text = f"""    This is a directed NET. All check-ins must go through net control. We will take a few check-ins then do a roundtable of that list, then take another check-in list. We take check-ins by Modes.
-
-
-    PLEASE LISTEN CAREFULLY TO THESE CHECK-IN INSTRUCTIONS:
-        WHEN CHECKING IN SAY ONLY YOUR CALLSIGN PHONETICALLY TWICE. Please to facilitate the system keying up allow a key up time of 1.5 seconds, and hold the PTT a half second or so at the last syllable so that you don't get cut off. If Net control misses you then please stand by for the next round of check-ins.
-
-    Tonight's Topic:\n\n\t{''.join(selected_topics)}
-
-    SHORTTIMERS CHECK IN FIRST.
-        No-Traffic Check-ins - Make sure to acknowledge check-ins
-        Repeater Owners and System Operators - Make sure to acknowledge check-ins
-        Digital Check-ins - Make sure to acknowledge check-ins
-        Analog Check-ins - Make sure to acknowledge check-ins
-
-    {open_floor_text}
-
-    When all have been called:
-        Did we miss anyone?
-        Last call"""
-
-        closing_text = f"""    This has been the {club_name} {day} Night {net_name}. With that, this is {name}, {callsign} from {location} wrapping up tonight's net and returning all systems to normal amateur use. 73' and have a great night, we will look for you next week!"""
+    def clear_script(self):
+        """Script tab state for a session that has not generated a script yet"""
+        self.stop_schedule()
+        self.section_text = self.section_views.clear()
+        self.section_label.setText("No script loaded")
+        self.progress.setVisible(False)
+        self.section_model.set_sections([])
+        self.update_navigation()
+        if self.mirror is not None:
+            self.mirror.publish_script([])
 
-        self.sections.append((f"Opening", opening_text))
+    def journal_event(self, kind, **data):
+        """Record a change to the running net so it survives a crash"""
+        try:
+            if self.journal is None:
+                from netcontrol.journal import SessionJournal
+                self.journal = SessionJournal(self.session.journal_path)
+            self.journal.record(kind, **data)
+        except OSError as e:
+            print(f"Session journal error: {e}")
+
+    @trace.traced
+    def recover_session(self):
+        """Restore every net left open by a session that did not close normally"""
+        from netcontrol.session import journal_files
+        from netcontrol.journal import read_journal
+        started = time.perf_counter()
+        recovered = []
+        for path in journal_files(self.sessions.journal_path):
+            try:
+                state = read_journal(path)
+            except OSError as e:
+                print(f"Cannot read session journal {path}: {e}")
+                continue
+            if state is None or not (state.sections or state.checkins):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if recovered:
+                session = self.sessions.new_session(journal_path=path)
+                self.session_tabs.addTab(session.name)
+            else:
+                session = self.session
+                session.journal_path = path
+            self.restore_session(session, state)
+            recovered.append(session)
+        if not recovered:
+            return
 
-        self.sections.append(("Connection Instructions", connect_text))
+        self.load_session_ui()
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"Recovered {len(recovered)} session(s) in {elapsed:.0f} ms")
+        self.status_bar.show_message(
+            "Recovered the previous session: " + ", ".join(
+                f"{session.name} ({len(session.sections)} sections, {len(session.checkin_store)} check-ins)"
+                for session in recovered)
+        )
 
-        # Net Control Announcements
-        announcements = getattr(self, "nco_announcements", self.club_announcements)
-        announcements_text = "Now for Net Control announcements:\n\n    " + "\n\n".join(announcements)
-        self.sections.append(("Net Control Announcements", announcements_text))
+    def restore_session(self, session, state):
+        """Load a replayed journal into a session; the journal continues from that state"""
+        from netcontrol.journal import SessionJournal
+        try:
+            session.journal = SessionJournal(session.journal_path, state=state)
+        except OSError as e:
+            print(f"Session journal error: {e}")
+        for checkin in state.checkins:
+            when, callsign, name, location, group, traffic, comments = checkin
+            session.checkin_store.append(callsign, name=name, location=location, comments=comments,
+                                         traffic=traffic, group=group, when=when)
+        session.sections = [tuple(section) for section in state.sections]
+        # Recovered edits become one undoable step from the generated text
+        from netcontrol.pieces import PieceTable, splice_between
+        for index, (original, section) in enumerate(zip(state.originals or (), state.sections)):
+            if original[1] != section[1]:
+                table = session.edits[index] = PieceTable(original[1])
+                table.replace(*splice_between(original[1], section[1]))
+        session.section_idx = min(state.section_idx, max(len(session.sections) - 1, 0))
+        session.net_started = state.started
+        if state.profile:
+            session.profile = NetProfile.from_dict(state.profile)
+            self.rename_session(session, session.profile.net_name)
+
+    def new_session(self):
+        """Open another net; it starts from this net's Setup values so only the differences need typing"""
+        self.store_session_ui()
+        session = self.sessions.new_session()
+        session.profile = self.session.profile
+        self.session_tabs.addTab(session.name)
+        self.session_tabs.setCurrentIndex(len(self.sessions) - 1)
+        self.tab_widget.setCurrentIndex(self.SETUP_TAB)
+        self.net_name_input.setFocus()
+        self.net_name_input.selectAll()
+
+    @trace.traced
+    def switch_session(self, index):
+        if not 0 <= index < len(self.sessions) or self.sessions.sessions[index] is self.session:
+            return
+        self.store_session_ui()
+        self.session = self.sessions.sessions[index]
+        self.load_session_ui()
+        self.status_bar.show_message(f"Switched to {self.session.name}")
+
+    def close_session(self, index):
+        if len(self.sessions) == 1:
+            self.status_bar.show_message("The last net cannot be closed", error=True)
+            return
+        session = self.sessions.sessions[index]
+        if session.sections or len(session.checkin_store):
+            reply = QMessageBox.question(
+                self, "Close Net", f"Close {session.name}? Its script and check-in log will be discarded.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+        if session.journal is not None:
+            session.journal.discard()
+        self.sessions.remove(session)
+        # Removing the current tab selects a neighbour, which switches sessions
+        self.session_tabs.removeTab(index)
+
+    def rename_session(self, session, name):
+        if name:
+            session.name = name
+            self.session_tabs.setTabText(self.sessions.sessions.index(session), name)
+
+    def store_session_ui(self):
+        """Keep the Setup tab and any unsaved section edit with the session being left"""
+        if hasattr(self, 'edit_btn') and self.edit_btn.isChecked():
+            self.edit_btn.setChecked(False)  # saves the edit
+        self.session.profile = self.current_profile()
+
+    @trace.traced
+    def load_session_ui(self):
+        """Show the active session in the shared tabs"""
+        if self.session.profile is not None:
+            self.apply_profile(self.session.profile)
+        self.topic_preview.setPlainText(topic_preview_text(self.topics))
+        self.announce_preview.setPlainText("\n".join(self.nco_announcements or self.club_announcements))
+        if hasattr(self, 'checkin_model'):
+            self.checkin_model.set_store(self.checkin_store)
+            self.update_checkin_count()
+        if self.sections:
+            self.ensure_tab(self.SCRIPT_TAB)
+            self.show_script(self.section_idx, switch_tab=False)
+        elif hasattr(self, 'section_views'):
+            self.clear_script()
+        self.session_tabs.setCurrentIndex(self.sessions.sessions.index(self.session))
+
+    def apply_profile(self, profile):
+        """Fill the Setup tab from a NetProfile"""
+        for field, value in ((self.club_name_input, profile.club_name), (self.net_name_input, profile.net_name),
+                             (self.meeting_time_input, profile.meeting_time), (self.timezone_input, profile.timezone),
+                             (self.repeater_info_input, profile.repeater_info), (self.website_input, profile.website),
+                             (self.callsign_input, profile.callsign), (self.name_input, profile.name),
+                             (self.location_input, profile.location)):
+            field.setText(value)
+        index = self.meeting_day_combo.findText(profile.meeting_day)
+        if index >= 0:
+            self.meeting_day_combo.setCurrentIndex(index)
+        self.num_topics_input.setValue(profile.num_topics)
+        self.directed_net_cb.setChecked(profile.is_directed)
+        self.roundtable_cb.setChecked(profile.use_roundtable)
+        self.comments_cb.setChecked(profile.allow_comments)
+        self.emergency_traffic_cb.setChecked(profile.emergency_priority)
+        self.formal_traffic_cb.setChecked(profile.formal_traffic)
+        self.elmering_cb.setChecked(profile.use_elmering)
+        index = self.template_set_combo.findData(profile.template_set)
+        if index >= 0:
+            self.template_set_combo.setCurrentIndex(index)
+
+    def current_profile(self):
+        """Snapshot the Setup tab into a NetProfile for the generation engine"""
+        return NetProfile(
+            club_name=self.club_name_input.text().strip(),
+            net_name=self.net_name_input.text().strip(),
+            meeting_day=self.meeting_day_combo.currentText().strip(),
+            meeting_time=self.meeting_time_input.text().strip(),
+            timezone=self.timezone_input.text().strip(),
+            repeater_info=self.repeater_info_input.text().strip(),
+            website=self.website_input.text().strip(),
+            callsign=self.callsign_input.text().strip(),
+            name=self.name_input.text().strip(),
+            location=self.location_input.text().strip(),
+            num_topics=self.num_topics_input.value(),
+            is_directed=self.directed_net_cb.isChecked(),
+            use_roundtable=self.roundtable_cb.isChecked(),
+            allow_comments=self.comments_cb.isChecked(),
+            emergency_priority=self.emergency_traffic_cb.isChecked(),
+            formal_traffic=self.formal_traffic_cb.isChecked(),
+            use_elmering=self.elmering_cb.isChecked(),
+            template_set=self.template_set_combo.currentData()
+        )
 
-        # Discussion Topics
-        for i, topic in enumerate(selected_topics, 1):
-            topic_text = f"Discussion Topic {i}:\n\n    {topic}"
-            self.sections.append((f"Topic {i}", topic_text))
-        self.sections.append(("Net Instructions", net_text))
+    @trace.traced
+    def generate_script_sections(self):
+        """Generate all script sections"""
+        announcements = self.nco_announcements or self.club_announcements
+        profile = self.current_profile()
+        selected_topics = self.pick_unused_topics(profile) if self.no_repeat_cb.isChecked() else None
+        if selected_topics is None:
+            self.sections = generate_sections(profile, self.topics, announcements)
+        else:
+            self.sections = build_sections(profile, selected_topics, announcements)
+        self.export_lines = []
 
-        self.sections.append(("Closing", closing_text))
+    @trace.traced
+    def pick_unused_topics(self, profile):
+        """Pick topics not used in recent nets and record this net in the topic store"""
+        try:
+            if self.topic_store is None:
+                self.topic_store = TopicStore()
+            if isinstance(self.topics, LineIndex):
+                library = os.path.abspath(self.topics.path)
+                self.topic_store.sync_library(library, self.topics, file_signature(library))
+            else:
+                library = DEFAULT_LIBRARY
+                self.topic_store.sync_library(library, self.topics)
+
+            # Regenerating before the net is held replaces this session's earlier pick
+            if self.recorded_net_id is not None:
+                self.topic_store.forget_net(self.recorded_net_id)
+            picked = self.topic_store.pick(library, profile.num_topics, self.no_repeat_nets_input.value())
+            self.recorded_net_id = self.topic_store.record_net([topic_id for topic_id, _ in picked],
+                                                               label=profile.net_name, library=library)
+            return [text for _, text in picked]
+        except Exception as e:
+            print(f"Topic store error: {e}")
+            self.status_bar.show_message("Topic history unavailable - picking topics at random", error=True)
+            return None
 
-    def display_section(self):
-        """Display the current section"""
+    @trace.traced
+    def display_section(self, chain=False):
+        """Display the current section; chain keeps auto-advance on the net's original timeline"""
         if not self.sections or self.section_idx >= len(self.sections):
             return
 
+        editing = self.edit_btn.isChecked()
+        if editing:
+            # Keep edits made on the page we are leaving
+            self.commit_section_edit()
+            self.set_page_editing(self.section_text, False)
+
+        if self.journal is None or self.journal.state.section_idx != self.section_idx:
+            self.journal_event('goto', i=self.section_idx)
+        if self.mirror is not None:
+            self.mirror.publish_goto(self.section_idx)
+
         title, content = self.sections[self.section_idx]
         self.section_label.setText(f"Section {self.section_idx + 1}: {title}")
-        self.section_text.setPlainText(content)
-        self.progress.setValue(self.section_idx + 1)
+        self.section_text = self.section_views.show_section(self.section_idx, content)
+        if editing:
+            self.set_page_editing(self.section_text, True)
+        if self.progress.value() != self.section_idx + 1:
+            self.progress.setValue(self.section_idx + 1)
 
         # Update section list selection
-        if self.section_list.count() > 0:
-            self.section_list.setCurrentRow(self.section_idx)
+        if self.section_list.currentIndex().row() != self.section_idx:
+            current = self.section_model.index(self.section_idx)
+            self.section_list.setCurrentIndex(current)
+            self.section_list.scrollTo(current)
+
+        # Lay out the likely next pages while the operator is reading this one
+        self.section_views.prefetch(
+            (i, self.sections[i][1]) for i in (self.section_idx + 1, self.section_idx - 1)
+            if 0 <= i < len(self.sections)
+        )
 
-        # Auto-advance if enabled
-        if self.auto_advance and self.section_idx < len(self.sections) - 1:
-            QTimer.singleShot(15000, self.next_section)  # 15 seconds
+        self.section_durations_updating = True
+        self.section_seconds_input.setValue(self.section_duration(self.section_idx))
+        self.section_durations_updating = False
 
+        # Auto-advance if enabled; manual navigation restarts the countdown
+        self.schedule_section(chain)
+
+    @trace.traced
     def populate_section_list(self):
-        """Populate the section navigation list"""
-        self.section_list.clear()
-        for i, (title, _) in enumerate(self.sections):
-            self.section_list.addItem(f"{i+1}. {title}")
+        """Point the section navigator at the current script"""
+        self.section_model.set_sections(self.sections)
 
+        # Resetting the spinner is not a jump; the caller shows the right section next
+        self.jump_spinner.blockSignals(True)
         self.jump_spinner.setMaximum(len(self.sections))
         self.jump_spinner.setValue(1)
+        self.jump_spinner.blockSignals(False)
 
-    def jump_to_section(self, item):
+    def jump_to_section(self, index):
         """Jump to selected section from list"""
-        self.section_idx = self.section_list.row(item)
+        self.section_idx = index.row()
         self.display_section()
         self.update_navigation()
 
@@ -1507,53 +2699,147 @@ class NetControlWindow(QWidget):
         self.next_btn.setEnabled(has_sections and self.section_idx < len(self.sections) - 1)
         self.export_btn.setEnabled(has_sections)
         self.jump_spinner.setEnabled(has_sections)
+        self.update_edit_history()
+
+    def update_edit_history(self):
+        table = self.section_edits.get(self.section_idx) if self.sections else None
+        self.undo_btn.setEnabled(table is not None and bool(table.undo_stack))
+        self.redo_btn.setEnabled(table is not None and bool(table.redo_stack))
+        self.original_btn.setEnabled(any(table.modified for table in self.section_edits.values()))
 
     def toggle_section_editing(self, enabled):
         """Toggle editing mode for current section"""
-        self.section_text.setReadOnly(not enabled)
+        self.set_page_editing(self.section_text, enabled)
         if enabled:
-            self.section_text.setStyleSheet("background-color: black; border: 2px solid #ffc107;")
             self.status_bar.show_message("Section editing enabled - changes will be saved automatically")
         else:
-            self.section_text.setStyleSheet("")
             # Save changes
-            if self.sections and self.section_idx < len(self.sections):
-                title = self.sections[self.section_idx][0]
-                new_content = self.section_text.toPlainText()
-                self.sections[self.section_idx] = (title, new_content)
+            self.commit_section_edit()
             self.status_bar.show_message("Section editing disabled - changes saved")
 
+    def set_page_editing(self, page, enabled):
+        page.setReadOnly(not enabled)
+        set_style_state(page, "editing", "true" if enabled else "false")
+        # Journal edits a second after typing pauses, not only when editing ends
+        if enabled:
+            page.textChanged.connect(self.edit_journal_timer.start)
+        else:
+            self.edit_journal_timer.stop()
+            try:
+                page.textChanged.disconnect(self.edit_journal_timer.start)
+            except TypeError:
+                pass
+
+    @trace.traced
+    def commit_section_edit(self):
+        """Copy the shown page's text back into self.sections"""
+        index = self.section_views.current_index
+        if index is not None and index < len(self.sections):
+            content = self.sections[index][1]
+            text = self.section_text.toPlainText()
+            if text != content:
+                from netcontrol.pieces import PieceTable, splice_between
+                table = self.section_edits.get(index)
+                if table is None:
+                    table = self.section_edits[index] = PieceTable(content)
+                self.apply_section_edit(index, table.replace(*splice_between(content, text)))
+
+    def apply_section_edit(self, index, splice, refresh_page=False, revert=False):
+        """Store a (start, end, text) change to a section; refresh_page when it did not come from the page"""
+        from netcontrol.pieces import apply_splice
+        title, content = self.sections[index]
+        text = apply_splice(content, splice)
+        self.sections[index] = (title, text)
+        self.section_model.section_changed(index)
+        if revert:
+            # The journal keeps the generated script, so a reset needs no text
+            self.journal_event('revert', i=index)
+        else:
+            start, end, inserted = splice
+            self.journal_event('splice', i=index, at=start, end=end, text=inserted)
+        if self.mirror is not None:
+            self.mirror.publish_edit(index, splice)
+        if refresh_page:
+            if index == self.section_views.current_index:
+                self.section_text.setPlainText(text)
+            else:
+                self.section_views.invalidate(index)
+        if index == self.section_idx:
+            self.update_edit_history()
+
+    @trace.traced
+    def step_edit_history(self, step, empty_message):
+        if not self.sections:
+            return
+        # Typing not yet committed becomes its own step, so undo takes back exactly that
+        self.edit_journal_timer.stop()
+        self.commit_section_edit()
+        table = self.section_edits.get(self.section_idx)
+        splice = step(table) if table is not None else None
+        if splice is None:
+            self.status_bar.show_message(empty_message)
+            return
+        self.apply_section_edit(self.section_idx, splice, refresh_page=True)
+
+    def undo_section_edit(self):
+        self.step_edit_history(lambda table: table.undo(), "Nothing to undo in this section")
+
+    def redo_section_edit(self):
+        self.step_edit_history(lambda table: table.redo(), "Nothing to redo in this section")
+
+    @trace.traced
+    def reset_script_edits(self):
+        """Every section back to its generated text; each reset can be undone in its section"""
+        if not self.sections:
+            return
+        self.edit_journal_timer.stop()
+        self.commit_section_edit()
+        restored = 0
+        for index, table in self.section_edits.items():
+            splice = table.reset()
+            if splice is not None:
+                self.apply_section_edit(index, splice, refresh_page=True, revert=True)
+                restored += 1
+        self.status_bar.show_message(f"{restored} edited section(s) restored to the generated text")
+
+    @trace.traced
     def export_script(self):
         """Export the complete script to a file"""
         if not self.sections:
             self.status_bar.show_message("No script to export", error=True)
             return
+        if self.edit_btn.isChecked():
+            self.commit_section_edit()
+
+        from netcontrol.export import EXPORTERS, register_exporter, export_script
+        # PDF goes through Qt, so the window adds it to the Qt-free formats on first export
+        register_exporter('pdf', "PDF Files", '.pdf', write_pdf)
 
         date_str = datetime.now().strftime("%Y-%m-%d")
         suggested_name = f"net_script_{self.callsign_input.text()}_{date_str}.txt"
-        file, _ = QFileDialog.getSaveFileName(
+        filters = [exporter.file_filter for exporter in EXPORTERS.values()]
+        file, selected_filter = QFileDialog.getSaveFileName(
             self, "Export Net Script", suggested_name,
-            "Text Files (*.txt);;All Files (*)"
+            ";;".join(filters + ["All Files (*)"])
         )
 
         if file:
-            try:
-                with open(file, "w") as f:
-                    f.write(f"Net Control Script\n")
-                    f.write(f"Net Control: {self.callsign_input.text()} - {self.name_input.text()}\n")
-                    f.write(f"Location: {self.location_input.text()}\n")
-                    f.write("=" * 50 + "\n\n")
-
-                    for i, (title, content) in enumerate(self.sections, 1):
-                        f.write(f"SECTION {i}: {title.upper()}\n")
-                        f.write("-" * 30 + "\n")
-                        f.write(content)
-                        f.write("\n\n" + "=" * 50 + "\n\n")
-
-                self.status_bar.show_message(f"Script exported to {os.path.basename(file)}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Failed to export script:\n{str(e)}")
-                self.status_bar.show_message("Export failed", error=True)
+            # A chosen format wins over the suggested extension; "All Files" goes by the extension
+            exporter = next((e for e in EXPORTERS.values() if e.file_filter == selected_filter), None)
+            format_name = None
+            if exporter:
+                file = os.path.splitext(file)[0] + exporter.extension
+                format_name = exporter.name
+            # Sections are immutable tuples, so a shallow copy is a safe snapshot for the worker
+            profile = self.current_profile()
+            sections = list(self.sections)
+            self.run_background_task(
+                f"Exporting {os.path.basename(file)}",
+                lambda report: self.archive_file(
+                    export_script(file, profile, sections, format_name=format_name, progress=report)
+                ),
+                lambda path: self.status_bar.show_message(f"Script exported to {os.path.basename(path)}")
+            )
 
     def show_shortcuts_help(self):
         """Show keyboard shortcuts help dialog"""
@@ -1563,6 +2849,7 @@ class NetControlWindow(QWidget):
             "Ctrl+Right: Next Section\n"
             "Ctrl+Left: Previous Section\n"
             "Ctrl+E: Export Script\n"
+            "Ctrl+Z / Ctrl+Y: Undo / Redo Section Edit\n"
             "Esc: Quit Application\n\n"
             "Click on section names in the left panel to jump directly to any section.\n"
             "Use the 'Edit Section' button to modify script content on the fly."
@@ -1591,17 +2878,29 @@ class NetControlWindow(QWidget):
                 self.num_topics_input.setValue(int(self.settings.value("num_topics", DEFAULT_NUM_TOPICS)))
             except RuntimeError:
                 print("num_topics_input was deleted before settings could be loaded.")
+        self.no_repeat_cb.setChecked(self.settings.value("no_repeat_topics", False, type=bool))
+        self.no_repeat_nets_input.setValue(int(self.settings.value("no_repeat_nets", 8)))
 
         # Load window geometry
         if self.settings.value("geometry"):
             self.restoreGeometry(self.settings.value("geometry"))
 
-        # Load theme
-        self.theme_dark = self.settings.value("dark_theme", False, type=bool)
-        self.theme_btn.setChecked(self.theme_dark)
-        if self.theme_dark:
-            self.apply_dark_theme()
+        # Load theme; applied once by __init__ (and picked up by the Settings tab when it is built)
+        self.theme_dark = self.settings.value("dark_theme", True, type=bool)
+        self.theme_name = self.settings.value("theme", 'Dark' if self.theme_dark else 'Light')
+        if self.theme_name not in self.theme_manager.themes:
+            self.theme_name = 'Dark' if self.theme_dark else 'Light'
+        self.theme_dark = self.theme_manager.themes[self.theme_name].dark
 
+        try:
+            self.section_durations = json.loads(self.settings.value("section_durations", "{}"))
+        except (TypeError, ValueError):
+            self.section_durations = {}
+        self.roster_file = self.settings.value("roster_file", "")
+        self.mirror_enabled = self.settings.value("mirror_enabled", False, type=bool)
+        self.mirror_port = int(self.settings.value("mirror_port", 8765))
+
+    @trace.traced
     def save_settings(self):
         """Save application settings"""
         self.settings.setValue("callsign", self.callsign_input.text())
@@ -1609,12 +2908,21 @@ class NetControlWindow(QWidget):
         self.settings.setValue("location", self.location_input.text())
         self.settings.setValue("location", self.location_input.text())
         self.settings.setValue("num_topics", self.num_topics_input.value())
+        self.settings.setValue("no_repeat_topics", self.no_repeat_cb.isChecked())
+        self.settings.setValue("no_repeat_nets", self.no_repeat_nets_input.value())
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("dark_theme", self.theme_dark)
+        self.settings.setValue("theme", self.theme_name)
+        self.settings.setValue("section_durations", json.dumps(self.section_durations))
+        self.settings.setValue("roster_file", self.roster_file)
+        self.settings.setValue("mirror_enabled", self.mirror_enabled)
+        self.settings.setValue("mirror_port", self.mirror_port)
 
     def quit_net(self):
         """Quit the application with optional confirmation"""
-        if hasattr(self, 'sections') and self.sections and hasattr(self, 'confirm_quit_cb') and self.confirm_quit_cb.isChecked():
+        # Confirmation defaults to on until the Settings tab has been opened
+        confirm = not hasattr(self, 'confirm_quit_cb') or self.confirm_quit_cb.isChecked()
+        if any(session.sections for session in self.sessions) and confirm:
             reply = QMessageBox.question(
                 self, "Confirm Quit",
                 "A net script is currently active. Are you sure you want to quit?",
@@ -1624,14 +2932,30 @@ class NetControlWindow(QWidget):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        self.save_settings()
+        # Same shutdown as closing the window: settings, pending config saves, journals
+        self.close()
         QApplication.quit()
 
     def closeEvent(self, event):
         """Handle application close event"""
         self.save_settings()
+        if self.net_config is not None:
+            try:
+                self.net_config.flush()
+            except OSError as e:
+                print(f"Config save failed: {e}")
+        self.end_session()
         event.accept()
 
+    def end_session(self):
+        """Normal shutdown: the journals are only needed after a crash"""
+        self.stop_mirror()
+        self.save_trace()
+        for session in self.sessions:
+            if session.journal is not None:
+                session.journal.discard()
+                session.journal = None
+
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
         if event.key() == Qt.Key.Key_Escape:
@@ -1645,16 +2969,33 @@ class NetControlWindow(QWidget):
                 self.prev_section()
             elif event.key() == Qt.Key.Key_E:
                 self.export_script()
+            elif event.key() == Qt.Key.Key_Z:
+                self.undo_section_edit()
+            elif event.key() == Qt.Key.Key_Y:
+                self.redo_section_edit()
         super().keyPressEvent(event)
 
 
 def main():
+    """Start the GUI (see netcontrol.batch for headless generation via --batch)"""
+    trace.start_from_environment()
     app = QApplication(sys.argv)
     app.setApplicationName("NetControl")
     app.setApplicationVersion("2.0")
     
     window = NetControlWindow()
     window.show()
+
+    if "--benchmark-themes" in sys.argv:
+        # Build every tab so the benchmark re-polishes the full widget tree
+        for index in list(window.pending_tabs):
+            window.ensure_tab(index)
+        app.processEvents()
+        timings = sorted(window.theme_manager.benchmark())
+        print(f"Theme switch: median {timings[len(timings) // 2]:.1f} ms, "
+              f"min {timings[0]:.1f} ms, max {timings[-1]:.1f} ms over {len(timings)} switches")
+        window.close()
+        return
     
     sys.exit(app.exec())
 
@@ -0,0 +1,11 @@
+"""Qt-free core of the Net Control Script Manager.
+
+Everything in this package can be imported without PyQt6 so that scripts can
+be generated on headless machines (see ``netcontrol.batch``).
+"""
+
+from netcontrol.engine import (
+    DEFAULT_CALLSIGN, DEFAULT_NAME, DEFAULT_LOCATION, DEFAULT_NUM_TOPICS,
+    DEFAULT_TOPICS, DEFAULT_ANNOUNCEMENTS, NetProfile,
+    build_sections, generate_sections, render_script_text, get_lines_from_file
+)
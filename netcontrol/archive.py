@@ -0,0 +1,215 @@
+"""Full-text search over exported scripts and check-in logs
+
+Documents are indexed in an SQLite FTS5 table, an inverted index from each word
+(lower-cased, diacritics folded, Porter-stemmed so "nets" finds "net") to the
+documents containing it. Queries are ranked with bm25 and read only the posting
+lists of the words searched for, so they stay in the millisecond range however
+many nets have been archived.
+
+Updates are incremental. An export is indexed as soon as it has been written,
+and indexing a folder of older exports only reads files whose size or
+modification time changed since they were last indexed, dropping any that have
+been deleted.
+"""
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from html.parser import HTMLParser
+
+from netcontrol.topicstore import file_signature
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    signature TEXT NOT NULL,
+    dated TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS document_text USING fts5(
+    title, body, tokenize = 'porter unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT PRIMARY KEY
+);
+"""
+
+ARCHIVE_DB = 'archive.db'
+INDEXED_EXTENSIONS = ('.txt', '.md', '.html', '.htm', '.csv')
+MAX_DOCUMENT_BYTES = 16 << 20
+
+# net_script_<call>_<YYYY-MM-DD>.txt, as suggested by the export dialog
+DATE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+
+class _HTMLText(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('style', 'script'):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('style', 'script') and self._skip:
+            self._skip -= 1
+        elif tag in ('p', 'div', 'br', 'li', 'tr', 'h1', 'h2', 'h3', 'pre'):
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def document_text(path):
+    """Searchable text of an exported file; HTML is reduced to its text"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read(MAX_DOCUMENT_BYTES)
+    if path.lower().endswith(('.html', '.htm')):
+        parser = _HTMLText()
+        parser.feed(text)
+        text = ''.join(parser.parts)
+    return text
+
+
+def document_date(path):
+    """Date in the file name, falling back to the modification time"""
+    match = DATE_PATTERN.search(os.path.basename(path))
+    if match:
+        return match.group(1)
+    return datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d')
+
+
+def fts_query(text):
+    """Turn what the user typed into an FTS5 query
+
+    Any word may match, and bm25 ranks documents with more of the rarer words
+    first, so a question like "when did we discuss winlink" works as typed.
+    "Quoted words" match as a phrase and win* matches by prefix.
+    """
+    terms = []
+    for phrase, word, star in re.findall(r'"([^"]*)"|(\w+)(\*?)', text):
+        if phrase:
+            words = re.findall(r'\w+', phrase)
+            if words:
+                terms.append('"' + ' '.join(words) + '"')
+        else:
+            terms.append(f'"{word}"{star}')
+    return ' OR '.join(terms)
+
+
+@dataclass
+class SearchHit:
+    path: str
+    title: str
+    dated: str
+    snippet: str    # matches wrapped in [ ]
+    score: float    # bm25; lower is better
+
+
+class ScriptArchive:
+    """SQLite full-text index of exported files; open one per thread, as with TopicStore"""
+
+    def __init__(self, db_path=ARCHIVE_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def add_file(self, path):
+        """Index or re-index one file; True if it was (re)read. Formats without text (PDF) are skipped"""
+        if not path.lower().endswith(INDEXED_EXTENSIONS):
+            return False
+        with self.conn:
+            return self._add_file(os.path.abspath(path))
+
+    def _add_file(self, path, signature=None):
+        signature = signature or file_signature(path)
+        row = self.conn.execute("SELECT id, signature FROM documents WHERE path = ?", (path,)).fetchone()
+        if row and row[1] == signature:
+            return False
+        text = document_text(path)
+        title = os.path.splitext(os.path.basename(path))[0]
+        if row:
+            doc_id = row[0]
+            self.conn.execute("UPDATE documents SET signature = ?, dated = ? WHERE id = ?",
+                              (signature, document_date(path), doc_id))
+            self.conn.execute("DELETE FROM document_text WHERE rowid = ?", (doc_id,))
+        else:
+            doc_id = self.conn.execute("INSERT INTO documents (path, signature, dated) VALUES (?, ?, ?)",
+                                       (path, signature, document_date(path))).lastrowid
+        self.conn.execute("INSERT INTO document_text (rowid, title, body) VALUES (?, ?, ?)",
+                          (doc_id, title, text))
+        return True
+
+    def _remove(self, doc_id):
+        self.conn.execute("DELETE FROM document_text WHERE rowid = ?", (doc_id,))
+        self.conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+    def index_folder(self, folder, progress=None):
+        """Bring a folder's exports up to date; returns (files read, files dropped). Progress may raise to abort"""
+        folder = os.path.abspath(folder)
+        files = []
+        for directory, _, names in os.walk(folder):
+            files.extend(os.path.join(directory, name) for name in names
+                         if name.lower().endswith(INDEXED_EXTENSIONS) and not name.startswith('.'))
+        read = 0
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO folders (path) VALUES (?)", (folder,))
+            known = dict(self.conn.execute(
+                "SELECT path, id FROM documents WHERE path >= ? AND path < ?",
+                (folder + os.sep, folder + chr(ord(os.sep) + 1))
+            ))
+            for done, path in enumerate(files, 1):
+                known.pop(path, None)
+                try:
+                    read += self._add_file(path)
+                except OSError:
+                    continue
+                if progress is not None and done % 50 == 0:
+                    progress(done / len(files))
+            for doc_id in known.values():
+                self._remove(doc_id)
+        return read, len(known)
+
+    def folders(self):
+        return [row[0] for row in self.conn.execute("SELECT path FROM folders ORDER BY path")]
+
+    def refresh(self, progress=None):
+        """Re-index every folder indexed before"""
+        folders = self.folders()
+        for i, folder in enumerate(folders):
+            if os.path.isdir(folder):
+                self.index_folder(folder, progress and (lambda p, i=i: progress((i + p) / len(folders))))
+
+    def search(self, text, limit=25):
+        """Best matches first; an empty or wordless query finds nothing"""
+        query = fts_query(text)
+        if not query:
+            return []
+        # Rank first and build snippets only for the hits kept; a snippet re-reads its document
+        top = self.conn.execute(
+            "SELECT rowid, bm25(document_text, 5.0, 1.0) AS score FROM document_text "
+            "WHERE document_text MATCH ? ORDER BY score LIMIT ?",
+            (query, limit)
+        ).fetchall()
+        hits = []
+        for doc_id, score in top:
+            path, dated, title, snippet = self.conn.execute(
+                "SELECT d.path, d.dated, title, snippet(document_text, 1, '[', ']', ' … ', 16) "
+                "FROM document_text JOIN documents d ON d.id = document_text.rowid "
+                "WHERE document_text MATCH ? AND document_text.rowid = ?",
+                (query, doc_id)
+            ).fetchone()
+            hits.append(SearchHit(path, title, dated, ' '.join(snippet.split()), score))
+        return hits
@@ -0,0 +1,243 @@
+"""Headless batch generation of net scripts across a process pool
+
+Usage:
+    python net-control.py --batch club_a.ini club_b.ini --weeks 13 --out scripts/
+    python net-control.py --batch club_a.ini --weeks 52 --format markdown --zip season.zip
+    python -m netcontrol.batch net_config.ini --start 2026-01-05 --jobs 4
+"""
+import os
+import sys
+import time
+import random
+import zipfile
+import argparse
+from datetime import date, datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from netcontrol.engine import (
+    DEFAULT_TOPICS, DEFAULT_ANNOUNCEMENTS, NetProfile,
+    build_sections, generate_sections, script_filename, get_lines_from_file
+)
+from netcontrol.export import EXPORTERS, atomic_path, export_script, render_script
+from netcontrol.lineindex import LineIndex
+from netcontrol.topicstore import TopicStore, DEFAULT_LIBRARY, file_signature
+from netcontrol.templates import TemplateError
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Per-worker content, loaded once by _init_worker instead of being pickled with every job
+_worker_topics = list(DEFAULT_TOPICS)
+_worker_announcements = list(DEFAULT_ANNOUNCEMENTS)
+
+
+def season_dates(profile, start, weeks):
+    """Meeting dates for `weeks` consecutive weeks, starting on the first meeting day >= start"""
+    if profile.meeting_day in WEEKDAYS:
+        offset = (WEEKDAYS.index(profile.meeting_day) - start.weekday()) % 7
+        start = start + timedelta(days=offset)
+    return [start + timedelta(weeks=i) for i in range(weeks)]
+
+
+def build_jobs(profile_paths, start, weeks, seed=None):
+    """Expand profiles x weeks into picklable job tuples"""
+    jobs = []
+    for path in profile_paths:
+        profile = NetProfile.from_ini(path)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for net_date in season_dates(profile, start, weeks):
+            job_seed = None if seed is None else f"{seed}:{stem}:{net_date.isoformat()}"
+            jobs.append((stem, profile, net_date, job_seed, None))
+    return jobs
+
+
+def assign_unused_topics(jobs, store, topics_file, exclude_recent):
+    """Pick no-repeat topics for every job in date order, recording each net in the store
+
+    Selection depends on the nets before it, so it runs here in the parent process;
+    the workers then only render.
+    """
+    if topics_file:
+        library = os.path.abspath(topics_file)
+        with LineIndex(topics_file) as topics:
+            store.sync_library(library, topics, file_signature(library))
+    else:
+        library = DEFAULT_LIBRARY
+        store.sync_library(library, DEFAULT_TOPICS)
+
+    assigned = []
+    for stem, profile, net_date, job_seed, _ in sorted(jobs, key=lambda job: (job[2], job[0])):
+        rng = random.Random(job_seed) if job_seed is not None else None
+        picked = store.pick(library, profile.num_topics, exclude_recent, rng)
+        store.record_net([topic_id for topic_id, _ in picked], held_at=net_date.isoformat(),
+                         label=profile.net_name, library=library)
+        assigned.append((stem, profile, net_date, job_seed, tuple(text for _, text in picked)))
+    return assigned
+
+
+def _init_worker(topics_file, announcements_file):
+    """Load shared topic/announcement content once per worker process"""
+    global _worker_topics, _worker_announcements
+    if topics_file:
+        # Every worker maps the same file and shares the on-disk line index
+        topics = LineIndex(topics_file)
+        _worker_topics = topics if len(topics) else _worker_topics
+    if announcements_file:
+        _worker_announcements = get_lines_from_file(announcements_file) or _worker_announcements
+
+
+def job_sections(job):
+    stem, profile, net_date, job_seed, selected_topics = job
+    if selected_topics is not None:
+        return build_sections(profile, selected_topics, _worker_announcements)
+    rng = random.Random(job_seed) if job_seed is not None else random.Random()
+    return generate_sections(profile, _worker_topics, _worker_announcements, rng)
+
+
+def job_path(job, format_name='text'):
+    """Output path of a job relative to the output directory or archive root"""
+    stem, profile, net_date = job[:3]
+    return os.path.join(stem, script_filename(profile, net_date, EXPORTERS[format_name].extension))
+
+
+def render_job(job, format_name='text'):
+    """Generate one script; returns (relative path, text)"""
+    return job_path(job, format_name), render_script(job[1], job_sections(job), format_name)
+
+
+def _write_job(args):
+    job, out_dir, format_name = args
+    path = os.path.join(out_dir, job_path(job, format_name))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return export_script(path, job[1], job_sections(job), format_name)
+
+
+def _render_members(args):
+    """Render a chunk of jobs into (archive name, UTF-8 bytes) pairs"""
+    jobs, format_name = args
+    members = []
+    for job in jobs:
+        rel_path, text = render_job(job, format_name)
+        members.append((rel_path.replace(os.sep, '/'), text.encode('utf-8')))
+    return members
+
+
+def _pool_size(jobs, workers):
+    workers = workers or os.cpu_count() or 1
+    return workers, max(1, len(jobs) // (workers * 4))
+
+
+def run_batch(jobs, out_dir, workers=None, topics_file=None, announcements_file=None, format_name='text'):
+    """Generate every job into out_dir; returns the list of written paths"""
+    if workers == 1 or len(jobs) < 2:
+        _init_worker(topics_file, announcements_file)
+        return [_write_job((job, out_dir, format_name)) for job in jobs]
+
+    if topics_file:
+        # Build the line index cache once up front rather than racing in every worker
+        LineIndex(topics_file).close()
+    workers, chunksize = _pool_size(jobs, workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(topics_file, announcements_file)) as pool:
+        return list(pool.map(_write_job, [(job, out_dir, format_name) for job in jobs], chunksize=chunksize))
+
+
+def iter_rendered(jobs, workers=None, topics_file=None, announcements_file=None, format_name='text'):
+    """Yield (archive name, bytes) for every job in completion order
+
+    Only a few chunks per worker are in flight at once, so memory stays bounded
+    by the pool size rather than by the number of scripts.
+    """
+    if workers == 1 or len(jobs) < 2:
+        _init_worker(topics_file, announcements_file)
+        for job in jobs:
+            yield from _render_members(([job], format_name))
+        return
+
+    if topics_file:
+        LineIndex(topics_file).close()
+    workers, chunksize = _pool_size(jobs, workers)
+    chunks = iter([jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(topics_file, announcements_file)) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(_render_members, (chunk, format_name)))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(pool.submit(_render_members, (chunk, format_name)))
+
+
+def run_archive(jobs, zip_path, workers=None, topics_file=None, announcements_file=None, format_name='text'):
+    """Render every job into one deflated zip archive, written atomically; returns the member count"""
+    count = 0
+    with atomic_path(zip_path) as tmp_path:
+        with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for arcname, data in iter_rendered(jobs, workers, topics_file, announcements_file, format_name):
+                archive.writestr(arcname, data)
+                count += 1
+    return count
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="net-control.py --batch",
+        description="Generate net scripts for one or more club profiles without starting the GUI."
+    )
+    parser.add_argument('profiles', nargs='+',
+                        help="net_config.ini or saved net template (.ini) files")
+    parser.add_argument('--weeks', type=int, default=1, help="number of weekly nets per profile")
+    parser.add_argument('--start', type=lambda s: datetime.strptime(s, '%Y-%m-%d').date(),
+                        default=date.today(), help="first date of the season (YYYY-MM-DD)")
+    parser.add_argument('--topics', help="topics file, one topic per line")
+    parser.add_argument('--announcements', help="announcements file, one per line")
+    parser.add_argument('--out', default='scripts', help="output directory")
+    parser.add_argument('--zip', metavar='ARCHIVE', help="write all scripts into this zip archive instead of --out")
+    parser.add_argument('--format', default='text',
+                        choices=[name for name, exporter in EXPORTERS.items() if exporter.chunks],
+                        help="script format (default: text)")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--seed', help="seed for reproducible topic selection")
+    parser.add_argument('--no-repeat', type=int, metavar='K',
+                        help="skip topics used in the last K nets and record these nets in the topic store")
+    parser.add_argument('--topic-db', default='topics.db', help="topic history database (with --no-repeat)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        jobs = build_jobs(args.profiles, args.start, args.weeks, args.seed)
+    except (OSError, ValueError) as e:
+        print(f"Error loading profiles: {e}", file=sys.stderr)
+        return 1
+
+    if args.no_repeat is not None:
+        store = TopicStore(args.topic_db)
+        try:
+            jobs = assign_unused_topics(jobs, store, args.topics, args.no_repeat)
+        finally:
+            store.close()
+
+    started = time.perf_counter()
+    try:
+        if args.zip:
+            count = run_archive(jobs, args.zip, args.jobs, args.topics, args.announcements, args.format)
+        else:
+            count = len(run_batch(jobs, args.out, args.jobs, args.topics, args.announcements, args.format))
+    except TemplateError as e:
+        print(f"Template error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Generated {count} scripts in {args.zip or args.out} ({elapsed:.2f}s, {rate:.0f} scripts/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Check-in log for a running net
+
+Check-ins are stored column by column (a float array for times, a byte array
+for flags and groups, plain lists for the strings) rather than as one object per
+row, and a dict maps each callsign to its row, so duplicate detection is a single
+lookup however many stations have checked in.
+"""
+import csv
+import time
+from array import array
+from datetime import datetime
+from typing import NamedTuple
+
+from netcontrol.export import atomic_path
+
+# Check-in groups, in the order the net instructions call them
+CHECKIN_GROUPS = ('ShortTimers', 'No-Traffic', 'Repeater Owners', 'Digital', 'Analog')
+
+COLUMNS = ('Time', 'Callsign', 'Name', 'Location', 'Group', 'Traffic', 'Comments')
+
+
+class CheckIn(NamedTuple):
+    time: float
+    callsign: str
+    name: str
+    location: str
+    group: int
+    traffic: bool
+    comments: str
+
+    @property
+    def group_name(self):
+        return CHECKIN_GROUPS[self.group]
+
+
+class DuplicateCheckIn(ValueError):
+    """The callsign has already checked in"""
+
+    def __init__(self, callsign, row):
+        super().__init__(f"{callsign} already checked in")
+        self.callsign = callsign
+        self.row = row
+
+
+def normalize_callsign(callsign):
+    return callsign.strip().upper()
+
+
+class CheckInStore:
+    """Append-mostly check-in table with an index from callsign to row"""
+
+    def __init__(self):
+        self.times = array('d')
+        self.flags = bytearray()   # bit 0: has traffic
+        self.groups = bytearray()
+        self.callsigns = []
+        self.names = []
+        self.locations = []
+        self.comments = []
+        self.index = {}
+
+    def __len__(self):
+        return len(self.callsigns)
+
+    def find(self, callsign):
+        """Row of a callsign that already checked in, or None"""
+        return self.index.get(normalize_callsign(callsign))
+
+    def validate(self, callsign, group=0):
+        """Normalized callsign if it can be added; raises DuplicateCheckIn or ValueError"""
+        callsign = normalize_callsign(callsign)
+        if not callsign:
+            raise ValueError("Callsign is required")
+        if callsign in self.index:
+            raise DuplicateCheckIn(callsign, self.index[callsign])
+        if not 0 <= group < len(CHECKIN_GROUPS):
+            raise ValueError(f"Unknown check-in group {group}")
+        return callsign
+
+    def append(self, callsign, name='', location='', comments='', traffic=False, group=0, when=None):
+        """Add a check-in and return its row; raises DuplicateCheckIn for a repeat callsign"""
+        callsign = self.validate(callsign, group)
+        row = len(self.callsigns)
+        self.times.append(time.time() if when is None else when)
+        self.flags.append(1 if traffic else 0)
+        self.groups.append(group)
+        self.callsigns.append(callsign)
+        self.names.append(name.strip())
+        self.locations.append(location.strip())
+        self.comments.append(comments.strip())
+        self.index[callsign] = row
+        return row
+
+    def remove(self, row):
+        """Delete a row; rows after it shift up by one"""
+        callsign = self.callsigns[row]
+        for column in (self.times, self.flags, self.groups, self.callsigns,
+                       self.names, self.locations, self.comments):
+            del column[row]
+        del self.index[callsign]
+        for i in range(row, len(self.callsigns)):
+            self.index[self.callsigns[i]] = i
+        return callsign
+
+    def clear(self):
+        for column in (self.times, self.flags, self.groups, self.callsigns,
+                       self.names, self.locations, self.comments):
+            del column[:]
+        self.index.clear()
+
+    def __getitem__(self, row):
+        return CheckIn(self.times[row], self.callsigns[row], self.names[row], self.locations[row],
+                       self.groups[row], bool(self.flags[row] & 1), self.comments[row])
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def group_counts(self):
+        counts = [0] * len(CHECKIN_GROUPS)
+        for group in self.groups:
+            counts[group] += 1
+        return dict(zip(CHECKIN_GROUPS, counts))
+
+    def traffic_count(self):
+        return sum(flag & 1 for flag in self.flags)
+
+
+def iter_checkin_log(store):
+    """Plain-text check-in log, in the same layout as the C++ ARCNetScript export"""
+    yield (
+        "Check-in Log\n"
+        f"Generated: {datetime.now().strftime('%a %b %d %H:%M:%S %Y')}\n"
+        f"Total Check-ins: {len(store)}\n"
+        "========================================\n\n"
+    )
+    for checkin in store:
+        lines = [
+            f"Time: {datetime.fromtimestamp(checkin.time).strftime('%H:%M:%S')}",
+            f"Callsign: {checkin.callsign}",
+        ]
+        if checkin.name:
+            lines.append(f"Name: {checkin.name}")
+        if checkin.location:
+            lines.append(f"Location: {checkin.location}")
+        lines.append(f"Group: {checkin.group_name}")
+        if checkin.traffic:
+            lines.append("Has Traffic: Yes")
+        if checkin.comments:
+            lines.append(f"Comments: {checkin.comments}")
+        yield '\n'.join(lines) + "\n----------------------------------------\n\n"
+
+
+def export_checkin_log(path, store):
+    """Write the log as CSV for a .csv path, plain text otherwise; atomic like script exports"""
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            if path.lower().endswith('.csv'):
+                writer = csv.writer(f)
+                writer.writerow(COLUMNS)
+                for checkin in store:
+                    writer.writerow((datetime.fromtimestamp(checkin.time).isoformat(timespec='seconds'),
+                                     checkin.callsign, checkin.name, checkin.location, checkin.group_name,
+                                     'Yes' if checkin.traffic else 'No', checkin.comments))
+            else:
+                f.writelines(iter_checkin_log(store))
+    return path
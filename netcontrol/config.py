@@ -0,0 +1,263 @@
+"""net_config.ini as a typed, immutable in-memory snapshot
+
+Reads come from the snapshot and never touch configparser. The file is re-read
+only when its mtime changes, and that is checked at most once per
+RELOAD_CHECK_INTERVAL. Changes made with set() are applied to the snapshot at
+once. The file itself is rewritten after a short debounce, so a burst of edits
+results in a single write, done atomically through a temporary file and a rename.
+That write runs on a timer thread, so a failure is handed to the on_save_error
+callback rather than raised; the edits stay pending for the next save or flush.
+"""
+import os
+import time
+import threading
+import configparser
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from netcontrol.engine import NetProfile
+from netcontrol.templates import TemplateSet
+
+CONFIG_FILE = 'net_config.ini'
+SAVE_DELAY = 0.5
+RELOAD_CHECK_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class ClubInfo:
+    name: str = 'Amateur Radio Club'
+    net_name: str = 'Weekly Net'
+    meeting_day: str = 'Monday'
+    meeting_time: str = '7:00 PM'
+    timezone: str = 'Local Time'
+    website: str = ''
+    email: str = ''
+    repeater_info: str = 'Local Repeater'
+
+
+@dataclass(frozen=True)
+class OperatorDefaults:
+    callsign: str = 'N0CALL'
+    name: str = 'Net Control'
+    location: str = 'Anytown, USA'
+    num_topics: int = 1
+
+
+@dataclass(frozen=True)
+class ScriptSections:
+    use_opening: bool = True
+    use_club_announcements: bool = True
+    use_topics: bool = True
+    use_checkins: bool = True
+    use_emergency_traffic: bool = False
+    use_formal_traffic: bool = False
+    use_elmering: bool = False
+    use_roundtable: bool = True
+    use_closing: bool = True
+
+
+@dataclass(frozen=True)
+class CustomText:
+    opening_addition: str = ''
+    special_instructions: str = ''
+    checkin_instructions: str = 'Please say your callsign phonetically twice, followed by your name and location.'
+    closing_addition: str = 'Thank you for participating in tonight\'s net. 73!'
+
+
+@dataclass(frozen=True)
+class NetFormat:
+    is_directed: bool = True
+    use_roundtable: bool = True
+    allow_comments: bool = True
+    emergency_priority: bool = True
+    formal_traffic: bool = False
+
+
+# ini section -> (snapshot attribute, dataclass)
+SECTIONS = {
+    'CLUB': ('club', ClubInfo),
+    'DEFAULTS': ('defaults', OperatorDefaults),
+    'SCRIPT_SECTIONS': ('script_sections', ScriptSections),
+    'CUSTOM_TEXT': ('custom_text', CustomText),
+    'NET_FORMAT': ('net_format', NetFormat),
+}
+
+
+def _read_section(config, section, cls):
+    """Typed values for one section; missing or malformed keys keep their defaults"""
+    values = {}
+    for field in fields(cls):
+        if not config.has_option(section, field.name):
+            continue
+        try:
+            if field.type is bool:
+                values[field.name] = config.getboolean(section, field.name)
+            elif field.type is int:
+                values[field.name] = config.getint(section, field.name)
+            else:
+                values[field.name] = config.get(section, field.name)
+        except ValueError:
+            pass
+    return cls(**values)
+
+
+def _ini_value(value):
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    club: ClubInfo = ClubInfo()
+    defaults: OperatorDefaults = OperatorDefaults()
+    script_sections: ScriptSections = ScriptSections()
+    custom_text: CustomText = CustomText()
+    net_format: NetFormat = NetFormat()
+    profile: NetProfile = NetProfile()
+
+    @classmethod
+    def from_config(cls, config):
+        values = {attr: _read_section(config, section, section_cls)
+                  for section, (attr, section_cls) in SECTIONS.items()}
+        return cls(profile=NetProfile.from_config(config), **values)
+
+
+def default_config():
+    """ConfigParser holding the built-in defaults, with operator details from the environment"""
+    config = configparser.ConfigParser()
+    for section, (_, cls) in SECTIONS.items():
+        config[section] = {field.name: _ini_value(field.default) for field in fields(cls)}
+    config['DEFAULTS'].update({
+        'callsign': os.environ.get('HAM_CALLSIGN', 'N0CALL'),
+        'name': os.environ.get('HAM_NAME', 'Net Control'),
+        'location': os.environ.get('HAM_LOCATION', 'Anytown, USA'),
+    })
+    return config
+
+
+class NetConfig:
+    """Cached view of net_config.ini with debounced, atomic saves"""
+
+    def __init__(self, config_file=CONFIG_FILE, templates_dir=Path('templates'), on_save_error=None):
+        self.config_file = config_file
+        self.templates_dir = Path(templates_dir)
+        self.on_save_error = on_save_error  # called with the OSError of a failed debounced save
+        self.config = configparser.ConfigParser()
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._dirty = False
+        self._mtime_ns = None
+        self._next_check = 0.0
+        self._snapshot = ConfigSnapshot()
+        self.load_or_create_config()
+
+    def load_or_create_config(self):
+        """Load existing config or create default one"""
+        if not os.path.exists(self.config_file):
+            self.create_default_config()
+        self.reload()
+
+    def create_default_config(self):
+        """Create default configuration file"""
+        self._write(default_config())
+
+        # Section templates live next to the config so they can be edited alongside it
+        TemplateSet(self.templates_dir).write_defaults()
+
+        print(f"Created default configuration file: {self.config_file}")
+
+    def reload(self):
+        """Re-read the file and rebuild the snapshot"""
+        with self._lock:
+            config = configparser.ConfigParser()
+            config.read(self.config_file, encoding='utf-8')
+            self.config = config
+            self._snapshot = ConfigSnapshot.from_config(config)
+            self._mtime_ns = self._file_mtime()
+            self._next_check = time.monotonic() + RELOAD_CHECK_INTERVAL
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def snapshot(self):
+        """Current settings; re-read only if the file was changed by someone else"""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + RELOAD_CHECK_INTERVAL
+            if not self._dirty and self._file_mtime() != self._mtime_ns:
+                self.reload()
+        return self._snapshot
+
+    def get_club_info(self):
+        """Get club information from config"""
+        return self.snapshot.club
+
+    def get_defaults(self):
+        """Get default operator information"""
+        return self.snapshot.defaults
+
+    def get_script_sections(self):
+        """Get enabled script sections"""
+        return self.snapshot.script_sections
+
+    def get_custom_text(self):
+        """Get custom text additions"""
+        return self.snapshot.custom_text
+
+    def get_net_format(self):
+        """Get net format settings"""
+        return self.snapshot.net_format
+
+    def save_config(self, section, key, value):
+        """Save a configuration value; the file is written once edits settle"""
+        with self._lock:
+            if section not in self.config:
+                self.config.add_section(section)
+            elif self.config.get(section, key, fallback=None) == _ini_value(value):
+                return
+            self.config.set(section, key, _ini_value(value))
+            self._snapshot = ConfigSnapshot.from_config(self.config)
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY, self._timed_flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        except OSError as e:
+            if self.on_save_error is not None:
+                self.on_save_error(e)
+            else:
+                print(f"Could not save {self.config_file}: {e}")
+
+    def flush(self):
+        """Write pending changes now; raises OSError if the file cannot be written"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._write(self.config)
+            self._dirty = False
+
+    def _write(self, config):
+        directory, name = os.path.split(os.path.abspath(self.config_file))
+        tmp_file = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                config.write(f)
+            os.replace(tmp_file, self.config_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        self._mtime_ns = self._file_mtime()
@@ -0,0 +1,230 @@
+"""Script generation that works from plain profile objects instead of widgets"""
+import os
+import random
+import configparser
+from dataclasses import dataclass, fields
+
+from netcontrol.templates import TEMPLATES_DIR, TemplateSet
+
+DEFAULT_CALLSIGN = "N0CALL"
+DEFAULT_NAME = "Net Control"
+DEFAULT_LOCATION = "Anytown, USA"
+DEFAULT_NUM_TOPICS = 1
+
+DEFAULT_TOPICS = (
+    "What's your favorite amateur radio operating mode and why?",
+    "Share a memorable QSO or contest experience from your amateur radio journey.",
+    "What new amateur radio equipment or technology have you tried recently?",
+    "Discuss your favorite amateur radio frequency band and what makes it special.",
+    "What amateur radio emergency preparedness activities have you participated in?",
+    "Share tips for new amateur radio operators getting started in the hobby.",
+    "What amateur radio project are you currently working on or planning?",
+    "Discuss the role of amateur radio in your local community.",
+    "What's the most interesting amateur radio contact you've made?",
+    "Share your thoughts on the future of amateur radio technology.",
+    "What amateur radio training or education have you found most valuable?",
+    "Discuss your experience with amateur radio public service events.",
+    "What advice would you give to someone considering getting their amateur radio license?",
+    "Share your favorite amateur radio memory or story.",
+    "What role does amateur radio play in your emergency preparedness plans?"
+)
+
+DEFAULT_ANNOUNCEMENTS = (
+    "Remember to check our club website for the latest news and updates.",
+    "Our next club meeting will be announced on the website and mailing list.",
+    "New members are always welcome - visit our website for membership information.",
+    "Check out our club's social media presence for daily updates and photos.",
+    "Upcoming amateur radio events and contests will be posted on our website.",
+    "Technical help and elmering sessions are available - contact club officers.",
+    "Remember to follow good amateur radio operating practices on all repeaters."
+)
+
+
+def get_lines_from_file(filepath):
+    """Read lines from a text file, filtering out empty lines"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f.readlines() if line.strip()]
+        return lines
+    except Exception as e:
+        print(f"Error reading file {filepath}: {e}")
+        return []
+
+
+def read_lines(filepath, progress=None):
+    """Like get_lines_from_file, but reports progress (0..1) and lets errors propagate
+
+    progress may raise to abort the read, which is how background loads are canceled.
+    """
+    size = os.path.getsize(filepath) or 1
+    lines = []
+    done = 0
+    with open(filepath, 'rb') as f:
+        for n, raw in enumerate(f):
+            done += len(raw)
+            line = raw.decode('utf-8').strip()
+            if line:
+                lines.append(line)
+            if progress is not None and not n & 0xFFF:
+                progress(done / size)
+    return lines
+
+
+@dataclass(frozen=True)
+class NetProfile:
+    """Everything needed to generate a script for one club/operator"""
+    club_name: str = 'Amateur Radio Club'
+    net_name: str = 'Weekly Net'
+    meeting_day: str = 'Monday'
+    meeting_time: str = '7:00 PM'
+    timezone: str = 'Local Time'
+    repeater_info: str = 'Local Repeater'
+    website: str = ''
+    callsign: str = DEFAULT_CALLSIGN
+    name: str = DEFAULT_NAME
+    location: str = DEFAULT_LOCATION
+    num_topics: int = DEFAULT_NUM_TOPICS
+    is_directed: bool = True
+    use_roundtable: bool = True
+    allow_comments: bool = True
+    emergency_priority: bool = True
+    formal_traffic: bool = False
+    use_elmering: bool = False
+    template_set: str = ''
+
+    # (attribute, ini section, ini key) - same layout as net_config.ini and saved templates
+    INI_FIELDS = (
+        ('club_name', 'CLUB', 'name'),
+        ('net_name', 'CLUB', 'net_name'),
+        ('meeting_day', 'CLUB', 'meeting_day'),
+        ('meeting_time', 'CLUB', 'meeting_time'),
+        ('timezone', 'CLUB', 'timezone'),
+        ('repeater_info', 'CLUB', 'repeater_info'),
+        ('website', 'CLUB', 'website'),
+        ('callsign', 'DEFAULTS', 'callsign'),
+        ('name', 'DEFAULTS', 'name'),
+        ('location', 'DEFAULTS', 'location'),
+        ('num_topics', 'DEFAULTS', 'num_topics'),
+        ('is_directed', 'NET_FORMAT', 'is_directed'),
+        ('use_roundtable', 'NET_FORMAT', 'use_roundtable'),
+        ('allow_comments', 'NET_FORMAT', 'allow_comments'),
+        ('emergency_priority', 'NET_FORMAT', 'emergency_priority'),
+        ('formal_traffic', 'NET_FORMAT', 'formal_traffic'),
+        ('use_elmering', 'SCRIPT_SECTIONS', 'use_elmering'),
+        ('template_set', 'NET_FORMAT', 'template_set'),
+    )
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a profile from a ConfigParser, falling back to defaults for missing keys"""
+        types = {f.name: f.type for f in fields(cls)}
+        values = {}
+        for attr, section, key in cls.INI_FIELDS:
+            if not config.has_option(section, key):
+                continue
+            if types[attr] is bool:
+                values[attr] = config.getboolean(section, key)
+            elif types[attr] is int:
+                values[attr] = config.getint(section, key)
+            else:
+                values[attr] = config.get(section, key)
+        return cls(**values)
+
+    @classmethod
+    def from_dict(cls, values):
+        """Inverse of dataclasses.asdict; unknown keys (from older or newer versions) are ignored"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in values.items() if key in names})
+
+    @classmethod
+    def from_ini(cls, path):
+        """Load a profile from net_config.ini or a saved net template"""
+        config = configparser.ConfigParser()
+        if not config.read(path, encoding='utf-8'):
+            raise FileNotFoundError(f"Profile not found: {path}")
+        return cls.from_config(config)
+
+    @property
+    def slug(self):
+        """Filesystem-friendly identifier for this profile"""
+        base = f"{self.club_name}_{self.net_name}".strip().replace(' ', '_')
+        return ''.join(c for c in base if c.isalnum() or c in '_-') or 'net'
+
+
+def build_sections(profile, selected_topics, announcements, templates=None):
+    """Build the (title, content) sections for already-selected topics"""
+    templates = templates or TemplateSet(TEMPLATES_DIR, profile.template_set)
+    values = {
+        'callsign': profile.callsign.strip(),
+        'name': profile.name.strip(),
+        'location': profile.location.strip(),
+        'time': profile.meeting_time.strip(),
+        'meeting_time': profile.meeting_time.strip(),
+        'club_name': profile.club_name.strip(),
+        'day': profile.meeting_day.strip(),
+        'meeting_day': profile.meeting_day.strip(),
+        'net_name': profile.net_name.strip(),
+        'timezone': profile.timezone.strip(),
+        'repeater_info': profile.repeater_info.strip(),
+        'website': profile.website.strip(),
+        'topics': ''.join(selected_topics)
+    }
+
+    sections = []
+    sections.append(("Opening", templates.render('opening', values)))
+
+    sections.append(("Connection Instructions", templates.render('connection', values)))
+
+    # Net Control Announcements
+    announcements_text = "Now for Net Control announcements:\n\n    " + "\n\n".join(announcements)
+    sections.append(("Net Control Announcements", announcements_text))
+
+    # Discussion Topics
+    for i, topic in enumerate(selected_topics, 1):
+        topic_text = f"Discussion Topic {i}:\n\n    {topic}"
+        sections.append((f"Topic {i}", topic_text))
+    sections.append(("Net Instructions", templates.render('net_instructions', values)))
+
+    sections.append(("Closing", templates.render('closing', values)))
+    return sections
+
+
+def script_topics(sections):
+    """Topic texts of a script built by build_sections, in order"""
+    return [content.split('\n\n', 1)[-1].strip() for title, content in sections
+            if title.startswith('Topic ')]
+
+
+def generate_sections(profile, topics, announcements, rng=None):
+    """Pick topics for the profile and build all script sections"""
+    rng = rng or random
+    selected_topics = rng.sample(topics, min(profile.num_topics, len(topics)))
+    return build_sections(profile, selected_topics, announcements)
+
+
+def iter_script_text(profile, sections):
+    """Plain-text export format, yielded as the header and then one chunk per section"""
+    yield (
+        "Net Control Script\n"
+        f"Net Control: {profile.callsign} - {profile.name}\n"
+        f"Location: {profile.location}\n"
+        + "=" * 50 + "\n\n"
+    )
+    for i, (title, content) in enumerate(sections, 1):
+        yield (
+            f"SECTION {i}: {title.upper()}\n"
+            + "-" * 30 + "\n"
+            + content
+            + "\n\n" + "=" * 50 + "\n\n"
+        )
+
+
+def render_script_text(profile, sections):
+    """Render sections in the plain-text export format"""
+    return ''.join(iter_script_text(profile, sections))
+
+
+def script_filename(profile, date, extension='.txt'):
+    """Default export filename, matching the GUI's suggested name"""
+    return f"net_script_{profile.callsign}_{date.strftime('%Y-%m-%d')}{extension}"
+
@@ -0,0 +1,139 @@
+"""Pluggable script exporters that stream sections to disk
+
+Each exporter writes to a temporary file next to the destination, which is
+renamed over it only once the export has completed, so a failed or canceled
+export never leaves a truncated script behind. Text-based formats are produced
+one section at a time through a large write buffer instead of being assembled
+in memory first.
+
+Formats that need a GUI toolkit (PDF through Qt) are registered by the
+application with register_exporter.
+"""
+import os
+import html
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+from netcontrol.engine import iter_script_text
+
+WRITE_BUFFER = 1 << 20
+
+
+@dataclass(frozen=True)
+class Exporter:
+    name: str
+    label: str
+    extension: str
+    # write(path, profile, sections, progress) - progress may be None, and may raise to abort
+    write: Callable
+    # chunks(profile, sections) -> str chunks, for text formats that can also be rendered in memory
+    chunks: Callable = None
+
+    @property
+    def file_filter(self):
+        return f"{self.label} (*{self.extension})"
+
+
+EXPORTERS = {}
+
+
+def register_exporter(name, label, extension, write=None, chunks=None):
+    """Register a format; text formats may pass just a chunk generator"""
+    EXPORTERS[name] = Exporter(name, label, extension, write or streaming_writer(chunks), chunks)
+
+
+def render_script(profile, sections, format_name='text'):
+    """Whole script as one string in a text format"""
+    return ''.join(EXPORTERS[format_name].chunks(profile, sections))
+
+
+def streaming_writer(chunks):
+    """Turn a chunk generator (header, then one chunk per section) into an exporter write function"""
+    def write(path, profile, sections, progress=None):
+        total = len(sections) + 1
+        with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+            for done, chunk in enumerate(chunks(profile, sections), 1):
+                f.write(chunk)
+                if progress is not None:
+                    progress(min(done / total, 1.0))
+    return write
+
+
+def script_title(profile):
+    return f"{profile.club_name} {profile.net_name}".strip() or "Net Control Script"
+
+
+def _plain_lines(content):
+    # Script text is indented for reading aloud; Markdown would turn that into code blocks
+    return '\n'.join(line.strip() for line in content.splitlines())
+
+
+def iter_script_markdown(profile, sections):
+    yield (
+        f"# {script_title(profile)}\n\n"
+        f"- **Net Control:** {profile.callsign} - {profile.name}\n"
+        f"- **Location:** {profile.location}\n\n"
+    )
+    for i, (title, content) in enumerate(sections, 1):
+        yield f"## Section {i}: {title}\n\n{_plain_lines(content)}\n\n"
+
+
+HTML_STYLE = """body { font-family: sans-serif; max-width: 50em; margin: 2em auto; }
+h2 { border-bottom: 1px solid #999; }
+.content { white-space: pre-wrap; font-size: 1.1em; }"""
+
+
+def iter_script_html(profile, sections, style=HTML_STYLE):
+    title = html.escape(script_title(profile))
+    yield (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{title}</title>\n<style>\n{style}\n</style>\n</head>\n<body>\n"
+        f"<h1>{title}</h1>\n"
+        f"<p><b>Net Control:</b> {html.escape(profile.callsign)} - {html.escape(profile.name)}<br>\n"
+        f"<b>Location:</b> {html.escape(profile.location)}</p>\n"
+    )
+    for i, (title, content) in enumerate(sections, 1):
+        yield (
+            f"<h2>Section {i}: {html.escape(title)}</h2>\n"
+            f"<div class=\"content\">{html.escape(content)}</div>\n"
+        )
+    yield "</body>\n</html>\n"
+
+
+register_exporter('text', "Text Files", '.txt', chunks=iter_script_text)
+register_exporter('markdown', "Markdown Files", '.md', chunks=iter_script_markdown)
+register_exporter('html', "HTML Files", '.html', chunks=iter_script_html)
+
+
+def exporter_for_path(path):
+    """Exporter matching the file extension, plain text otherwise"""
+    extension = os.path.splitext(path)[1].lower()
+    for exporter in EXPORTERS.values():
+        if exporter.extension == extension:
+            return exporter
+    return EXPORTERS['text']
+
+
+@contextmanager
+def atomic_path(path):
+    """Yield a temporary path next to `path`; it replaces `path` only if the block succeeds"""
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def export_script(path, profile, sections, format_name=None, progress=None):
+    """Write the script to path atomically; format_name defaults to the extension's format"""
+    exporter = EXPORTERS[format_name] if format_name else exporter_for_path(path)
+    with atomic_path(path) as tmp_path:
+        exporter.write(tmp_path, profile, sections, progress)
+    return path
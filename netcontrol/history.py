@@ -0,0 +1,170 @@
+"""Log of past nets as on-disk columns, for trend analytics
+
+Each column is a raw little-endian array in its own file under history/, and
+logging a net appends a few bytes to each one. Loading is one np.fromfile per
+column, and every statistic is computed with whole-array NumPy operations
+(bincount, unique, add.at), so years of weekly nets summarize in milliseconds.
+
+    net_start, net_end          one row per net (epoch seconds)
+    checkin_net, checkin_time,  one row per check-in; net is the row in the
+    checkin_group, checkin_flags  net columns, group indexes CHECKIN_GROUPS
+    topic_net, topic_id         one row per topic used; ids index topics.txt
+
+A net's check-in and topic rows are written before its net_start entry, so a
+write interrupted part way is dropped when the columns are next loaded, and cut
+off the files before the next net is appended.
+"""
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+from netcontrol.checkins import CHECKIN_GROUPS
+
+HISTORY_DIR = Path('history')
+
+COLUMNS = {
+    'net_start': '<f8',
+    'net_end': '<f8',
+    'checkin_net': '<i4',
+    'checkin_time': '<f8',
+    'checkin_group': 'u1',
+    'checkin_flags': 'u1',
+    'topic_net': '<i4',
+    'topic_id': '<i4',
+}
+TOPICS_FILE = 'topics.txt'
+
+
+class NetHistory:
+    """Append-only columnar store of logged nets"""
+
+    def __init__(self, directory=HISTORY_DIR):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._columns = None
+        self._topics = None
+        self._topic_ids = None
+
+    def _path(self, name):
+        return self.directory / f"{name}.col"
+
+    def columns(self):
+        """All columns as arrays, trimmed to the nets that were completely written"""
+        if self._columns is None:
+            columns = {}
+            for name, dtype in COLUMNS.items():
+                path = self._path(name)
+                columns[name] = np.fromfile(path, dtype=dtype) if path.exists() else np.empty(0, dtype)
+            nets = min(len(columns['net_start']), len(columns['net_end']))
+            columns['net_start'] = columns['net_start'][:nets]
+            columns['net_end'] = columns['net_end'][:nets]
+            for table in ('checkin', 'topic'):
+                names = [name for name in COLUMNS if name.startswith(table + '_')]
+                rows = min(len(columns[name]) for name in names)
+                keep = columns[f"{table}_net"][:rows] < nets
+                for name in names:
+                    columns[name] = columns[name][:rows][keep]
+            self._columns = columns
+        return self._columns
+
+    def topics(self):
+        if self._topics is None:
+            path = self.directory / TOPICS_FILE
+            self._topics = path.read_text(encoding='utf-8').splitlines() if path.exists() else []
+            self._topic_ids = {topic: i for i, topic in enumerate(self._topics)}
+        return self._topics
+
+    def __len__(self):
+        return len(self.columns()['net_start'])
+
+    def _append(self, name, values):
+        with open(self._path(name), 'ab') as f:
+            np.asarray(values, dtype=COLUMNS[name]).tofile(f)
+
+    def record_net(self, started, ended, checkins, topics=()):
+        """Log one net; checkins are CheckIn rows, topics the topic texts used. Returns the net's row"""
+        columns = self.columns()
+        for name, values in columns.items():
+            path = self._path(name)
+            if path.exists() and path.stat().st_size > values.nbytes:
+                os.truncate(path, values.nbytes)
+        net = len(columns['net_start'])
+        checkins = list(checkins)
+        topic_ids = []
+        new_topics = []
+        self.topics()
+        known = self._topic_ids
+        for topic in topics:
+            topic = ' '.join(topic.split())
+            if topic not in known:
+                known[topic] = len(self._topics) + len(new_topics)
+                new_topics.append(topic)
+            topic_ids.append(known[topic])
+        if new_topics:
+            with open(self.directory / TOPICS_FILE, 'a', encoding='utf-8') as f:
+                f.writelines(topic + '\n' for topic in new_topics)
+            self._topics.extend(new_topics)
+
+        self._append('checkin_net', [net] * len(checkins))
+        self._append('checkin_time', [checkin.time for checkin in checkins])
+        self._append('checkin_group', [checkin.group for checkin in checkins])
+        self._append('checkin_flags', [1 if checkin.traffic else 0 for checkin in checkins])
+        self._append('topic_net', [net] * len(topic_ids))
+        self._append('topic_id', topic_ids)
+        self._append('net_end', [ended])
+        self._append('net_start', [started])
+        self._columns = None
+        return net
+
+    def weekly_checkins(self, utc_offset=None):
+        """(week start dates, check-ins per week, check-ins per week and group) for weeks with nets
+
+        Weeks start on Monday in local time; the per-group array has one column per
+        CHECKIN_GROUPS entry.
+        """
+        columns = self.columns()
+        if utc_offset is None:
+            utc_offset = time.localtime().tm_gmtoff
+        # 1970-01-01 was a Thursday, so shifting by three days puts week boundaries on Mondays
+        net_weeks = ((columns['net_start'] + utc_offset) // 86400 + 3) // 7
+        weeks, net_week_index = np.unique(net_weeks, return_inverse=True)
+        checkin_weeks = net_week_index[columns['checkin_net']]
+        totals = np.bincount(checkin_weeks, minlength=len(weeks))
+        by_group = np.zeros((len(weeks), len(CHECKIN_GROUPS)), dtype=np.int64)
+        np.add.at(by_group, (checkin_weeks, columns['checkin_group']), 1)
+        starts = (weeks * 7 - 3).astype('datetime64[D]')
+        return starts, totals, by_group
+
+    def group_totals(self):
+        counts = np.bincount(self.columns()['checkin_group'], minlength=len(CHECKIN_GROUPS))
+        return dict(zip(CHECKIN_GROUPS, counts.tolist()))
+
+    def average_net_minutes(self):
+        """Mean length of nets with a recorded end time, or None"""
+        columns = self.columns()
+        lengths = columns['net_end'] - columns['net_start']
+        lengths = lengths[lengths > 0]
+        return float(lengths.mean()) / 60 if len(lengths) else None
+
+    def topic_popularity(self, limit=10):
+        """[(topic, times used)], most used first"""
+        topics = self.topics()
+        counts = np.bincount(self.columns()['topic_id'], minlength=len(topics))
+        top = np.argsort(counts, kind='stable')[::-1][:limit]
+        return [(topics[i], int(counts[i])) for i in top if counts[i]]
+
+    def summary(self):
+        columns = self.columns()
+        nets = len(columns['net_start'])
+        checkins = len(columns['checkin_net'])
+        return {
+            'nets': nets,
+            'checkins': checkins,
+            'traffic': int(np.count_nonzero(columns['checkin_flags'] & 1)),
+            'checkins_per_net': checkins / nets if nets else 0.0,
+            'average_minutes': self.average_net_minutes(),
+            'first': float(columns['net_start'].min()) if nets else None,
+            'last': float(columns['net_start'].max()) if nets else None,
+        }
@@ -0,0 +1,156 @@
+"""Append-only journal of the running net, for recovery after a crash
+
+Every change to the session (script generated, section edited, section shown,
+station checked in or removed) is appended as one JSON line and handed to the
+OS at once, so a crash of the application loses nothing. An edit is written as
+the span that changed, not the whole section. The file is fsynced
+at most once per SYNC_INTERVAL from a timer thread, which bounds what a power
+failure can lose without paying for an fsync per keystroke or click.
+
+After COMPACT_EVERY events the journal is rewritten as a single snapshot line
+(through a temporary file and a rename), so recovery replays at most a few
+hundred lines however long the net has been running. A torn last line from an
+interrupted write is ignored.
+
+The journal is discarded when the application closes normally; if one is
+still there at startup, the previous session ended abnormally.
+"""
+import os
+import json
+import threading
+from dataclasses import dataclass, field
+
+JOURNAL_FILE = 'session.journal'
+SYNC_INTERVAL = 1.0
+COMPACT_EVERY = 500
+
+
+@dataclass
+class SessionState:
+    """What the journal restores: the script, the section on screen and the check-in log"""
+    sections: list = field(default_factory=list)    # [title, content] pairs
+    section_idx: int = 0
+    checkins: list = field(default_factory=list)    # CheckIn fields, in log order
+    started: float = None                           # when the script was generated
+    profile: dict = None                            # NetProfile fields the script was built from
+    originals: list = None                          # sections as generated, for undoing edits
+
+    def apply(self, event):
+        kind = event['e']
+        if kind == 'snapshot':
+            self.sections = event['sections']
+            self.section_idx = event['idx']
+            self.checkins = event['checkins']
+            self.started = event.get('started')
+            self.profile = event.get('profile')
+            self.originals = event.get('originals')
+        elif kind == 'script':
+            self.sections = event['sections']
+            self.section_idx = 0
+            self.started = event.get('started')
+            self.profile = event.get('profile')
+            self.originals = [list(section) for section in self.sections]
+        elif kind == 'splice':
+            title, content = self.sections[event['i']]
+            self.sections[event['i']] = [title, content[:event['at']] + event['text'] + content[event['end']:]]
+        elif kind == 'revert':
+            self.sections[event['i']] = list(self.originals[event['i']])
+        elif kind == 'edit':
+            self.sections[event['i']] = [self.sections[event['i']][0], event['text']]
+        elif kind == 'goto':
+            self.section_idx = event['i']
+        elif kind == 'checkin':
+            self.checkins.append(event['row'])
+        elif kind == 'uncheckin':
+            del self.checkins[event['i']]
+        elif kind == 'clear_checkins':
+            self.checkins = []
+
+    def snapshot(self):
+        return {'e': 'snapshot', 'sections': self.sections, 'idx': self.section_idx,
+                'checkins': self.checkins, 'started': self.started, 'profile': self.profile,
+                'originals': self.originals}
+
+
+def read_journal(path=JOURNAL_FILE):
+    """Replay a journal into a SessionState; None if there is no journal"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return None
+    state = SessionState()
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            break  # torn write at the tail
+        state.apply(event)
+    return state
+
+
+class SessionJournal:
+    """Writer side of the journal; keeps the replayed state so it can compact itself"""
+
+    def __init__(self, path=JOURNAL_FILE, state=None):
+        self.path = path
+        self.state = state or SessionState()
+        self._lock = threading.Lock()
+        self._sync_timer = None
+        self._file = None
+        self._events = 0
+        # Start from a compact copy of whatever was recovered
+        self.compact()
+
+    def record(self, kind, **data):
+        """Append one event; it reaches the OS immediately and the disk within SYNC_INTERVAL"""
+        event = {'e': kind, **data}
+        with self._lock:
+            if self._file is None:
+                return
+            self.state.apply(event)
+            self._file.write(json.dumps(event, separators=(',', ':')) + '\n')
+            self._file.flush()
+            self._events += 1
+            compact = self._events >= COMPACT_EVERY
+            if not compact and self._sync_timer is None:
+                self._sync_timer = threading.Timer(SYNC_INTERVAL, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+        if compact:
+            self.compact()
+
+    def sync(self):
+        with self._lock:
+            self._sync_timer = None
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+
+    def compact(self):
+        """Replace the journal with one snapshot of the current state"""
+        with self._lock:
+            directory, name = os.path.split(os.path.abspath(self.path))
+            tmp_file = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self.state.snapshot(), separators=(',', ':')) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            if self._file is not None:
+                self._file.close()
+            os.replace(tmp_file, self.path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            self._events = 0
+
+    def discard(self):
+        """End of a normal session: nothing to recover next time"""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,177 @@
+"""Callsign -> name/location lookup imported from a licensee bulk file
+
+The import reads pipe-delimited records one line at a time, so memory stays
+bounded however large the download is. Two layouts are understood:
+
+    EN|<id>|<file no>|<ebf>|W5ALC|L|<licensee id>|<entity>|Jon|A|Smith|...|Pueblo|CO|...
+    W5ALC|Jon Smith|Pueblo, CO
+
+The first is the entity (EN.dat) record of an FCC ULS amateur dump, the second
+the roster layout read by netcontrol.roster. Stations live in a WITHOUT ROWID
+SQLite table keyed by callsign, so a lookup is one primary-key probe.
+
+An import first stages the file in a temporary table (a callsign listed more than
+once keeps its last record), then merges it with one upsert that only writes rows
+whose name or location changed. Each station remembers the file it came from, and
+a re-import drops only the callsigns that same file no longer contains, so several
+sources live side by side and a re-import touches just the changed records. A
+callsign found in more than one file belongs to the one imported last.
+"""
+import os
+import sqlite3
+from dataclasses import dataclass
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stations (
+    callsign TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    source TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imports (
+    path TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+"""
+
+LICENSEE_DB = 'licensees.db'
+BATCH_SIZE = 10000
+READ_BUFFER = 1 << 20
+
+# Field positions in an EN record
+EN_CALLSIGN, EN_ENTITY_TYPE, EN_ENTITY_NAME = 4, 5, 7
+EN_FIRST_NAME, EN_LAST_NAME, EN_SUFFIX = 8, 10, 11
+EN_CITY, EN_STATE = 16, 17
+
+
+def _title(value):
+    # ULS names are upper case; "JON SMITH" reads better over the air as "Jon Smith"
+    return value.title() if value.isupper() else value
+
+
+def parse_record(line):
+    """(callsign, name, location) for one record, or None if the line is not a station"""
+    fields = line.rstrip('\r\n').split('|')
+    if fields[0] == 'EN':
+        if len(fields) <= EN_STATE or fields[EN_ENTITY_TYPE] not in ('L', ''):
+            return None
+        callsign = fields[EN_CALLSIGN]
+        name = ' '.join(part for part in (fields[EN_FIRST_NAME], fields[EN_LAST_NAME],
+                                          fields[EN_SUFFIX]) if part)
+        name = _title(name or fields[EN_ENTITY_NAME])
+        city = _title(fields[EN_CITY])
+        location = f"{city}, {fields[EN_STATE]}" if city and fields[EN_STATE] else city or fields[EN_STATE]
+    else:
+        callsign = fields[0]
+        name = fields[1] if len(fields) > 1 else ''
+        location = fields[2] if len(fields) > 2 else ''
+    callsign = callsign.strip().upper()
+    if not callsign or not callsign.isalnum():
+        return None
+    return callsign, name.strip(), location.strip()
+
+
+@dataclass
+class ImportResult:
+    records: int = 0
+    changed: int = 0
+    removed: int = 0
+    skipped: bool = False
+
+    def __str__(self):
+        if self.skipped:
+            return "unchanged since the last import"
+        return f"{self.records:,} records, {self.changed:,} added or updated, {self.removed:,} removed"
+
+
+class LicenseeStore:
+    """SQLite callsign index; open one per thread, as with TopicStore"""
+
+    def __init__(self, db_path=LICENSEE_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(stations)")}
+        if 'source' not in columns:
+            # Indexes from before stations remembered their file held a single import
+            with self.conn:
+                self.conn.execute("ALTER TABLE stations ADD COLUMN source TEXT")
+                self.conn.execute("UPDATE stations SET source = (SELECT MAX(path) FROM imports)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS stations_source ON stations (source, callsign)")
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM stations").fetchone()[0]
+
+    def lookup(self, callsign):
+        """(callsign, name, location) for an exact callsign, or None"""
+        return self.conn.execute(
+            "SELECT callsign, name, location FROM stations WHERE callsign = ?",
+            (callsign.strip().upper(),)
+        ).fetchone()
+
+    def import_file(self, path, progress=None):
+        """Bring the stations from this file in line with it; progress may raise to abort (nothing is kept)
+
+        Stations imported from other files are left alone.
+        """
+        stat = os.stat(path)
+        signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+        path = os.path.abspath(path)
+        row = self.conn.execute("SELECT signature FROM imports WHERE path = ?", (path,)).fetchone()
+        if row and row[0] == signature:
+            return ImportResult(skipped=True)
+
+        result = ImportResult()
+        total = stat.st_size or 1
+        self.conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS incoming ("
+            "callsign TEXT PRIMARY KEY, name TEXT NOT NULL, location TEXT NOT NULL) WITHOUT ROWID"
+        )
+        with self.conn:
+            self.conn.execute("DELETE FROM incoming")
+            with open(path, 'rb', buffering=READ_BUFFER) as f:
+                batch = []
+                for line in f:
+                    record = parse_record(line.decode('utf-8', errors='replace'))
+                    if record is None:
+                        continue
+                    batch.append(record)
+                    if len(batch) >= BATCH_SIZE:
+                        self._stage(batch)
+                        result.records += len(batch)
+                        batch = []
+                        if progress is not None:
+                            # The merge below is quick next to parsing
+                            progress(0.9 * f.tell() / total)
+                self._stage(batch)
+                result.records += len(batch)
+
+            before = self.conn.total_changes
+            # "WHERE true" keeps SQLite from reading ON CONFLICT as part of the SELECT
+            self.conn.execute(
+                "INSERT INTO stations (callsign, name, location, source) SELECT callsign, name, location, ? "
+                "FROM incoming WHERE true "
+                "ON CONFLICT (callsign) DO UPDATE SET name = excluded.name, location = excluded.location, "
+                "source = excluded.source "
+                "WHERE name != excluded.name OR location != excluded.location OR source IS NOT excluded.source",
+                (path,)
+            )
+            result.changed = self.conn.total_changes - before
+            result.removed = self.conn.execute(
+                "DELETE FROM stations WHERE source = ? AND callsign NOT IN (SELECT callsign FROM incoming)",
+                (path,)
+            ).rowcount
+            self.conn.execute("DELETE FROM incoming")
+            self.conn.execute("INSERT OR REPLACE INTO imports (path, signature) VALUES (?, ?)", (path, signature))
+            if progress is not None:
+                progress(1.0)
+        return result
+
+    def _stage(self, batch):
+        self.conn.executemany("INSERT OR REPLACE INTO incoming (callsign, name, location) VALUES (?, ?, ?)",
+                              batch)
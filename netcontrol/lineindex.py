@@ -0,0 +1,157 @@
+"""Memory-mapped access to the non-empty lines of large text files
+
+A LineIndex scans the file once for the byte span of every non-empty (stripped)
+line and keeps only those offsets. Lines are decoded on demand, so sampling a few
+topics from a library of several hundred thousand lines never decodes the rest.
+The offsets are cached next to the file and reused while its size and mtime match.
+"""
+import os
+import re
+import mmap
+import random
+import struct
+from array import array
+from collections.abc import Sequence
+
+CACHE_MAGIC = b'NCLIDX1\0'
+# magic, source size, source mtime_ns, line count, array typecode
+CACHE_HEADER = struct.Struct('<8sQqQ1s7x')
+
+# Stripped content of one line: skip leading blanks, then first..last non-blank character
+_LINE_RE = re.compile(rb'^[ \t\r\f\v]*(\S(?:[^\n]*\S)?)', re.MULTILINE)
+
+
+def cache_path_for(path):
+    """Hidden index file stored next to the source file"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.lineidx")
+
+
+class LineIndex(Sequence):
+    """Read-only sequence of the stripped, non-empty lines in a UTF-8 text file"""
+
+    def __init__(self, path, use_cache=True, progress=None):
+        """progress, if given, is called with the fraction scanned; it may raise to abort"""
+        self.path = path
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        # Empty files cannot be mapped
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b''
+        self._order = None
+
+        self._spans = self._load_cache() if use_cache else None
+        if self._spans is None:
+            try:
+                self._spans = self._build_spans(progress)
+            except BaseException:
+                self.close()
+                raise
+            if use_cache:
+                self._save_cache()
+
+    def _typecode(self):
+        return 'I' if self._size < 2 ** 32 else 'Q'
+
+    def _build_spans(self, progress=None):
+        """Scan the mapped file once; spans holds (start, end) pairs back to back"""
+        spans = array(self._typecode())
+        for match in _LINE_RE.finditer(self._map):
+            spans.append(match.start(1))
+            spans.append(match.end(1))
+            if progress is not None and not len(spans) & 0x7FFF:
+                progress(match.end() / self._size)
+        return spans
+
+    def _load_cache(self):
+        try:
+            with open(cache_path_for(self.path), 'rb') as f:
+                magic, size, mtime_ns, count, typecode = CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+                if magic != CACHE_MAGIC or size != self._size or mtime_ns != self._mtime_ns:
+                    return None
+                spans = array(typecode.decode('ascii'))
+                spans.fromfile(f, count * 2)
+                return spans
+        except (OSError, EOFError, struct.error, ValueError):
+            return None
+
+    def _save_cache(self):
+        cache_file = cache_path_for(self.path)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, self._size, self._mtime_ns,
+                                          len(self._spans) // 2, self._spans.typecode.encode('ascii')))
+                self._spans.tofile(f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Read-only media: keep working from the in-memory index
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def __len__(self):
+        return len(self._spans) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        if self._order is not None:
+            index = self._order[index]
+        start = self._spans[2 * index]
+        end = self._spans[2 * index + 1]
+        return self._map[start:end].decode('utf-8', errors='replace')
+
+    def raw(self, index):
+        """Undecoded bytes of a line in file order (ignores shuffle)"""
+        return self._map[self._spans[2 * index]:self._spans[2 * index + 1]]
+
+    def page(self, start, count):
+        """Lines start..start+count (clipped to the end of the file)"""
+        return self[start:start + count]
+
+    def sample(self, k, rng=None):
+        """k distinct random lines, decoding only those lines"""
+        rng = rng or random
+        return [self[i] for i in rng.sample(range(len(self)), min(k, len(self)))]
+
+    def shuffle(self, rng=None):
+        """Randomize line order in place without touching the file"""
+        if self._order is None:
+            self._order = array('I' if len(self) < 2 ** 32 else 'Q', range(len(self)))
+        (rng or random).shuffle(self._order)
+
+    def view(self):
+        """Another sequence over the same mapping and offsets with its own line order
+
+        Views cost one small object, so several sessions can shuffle one library
+        independently. Only the original should be closed.
+        """
+        clone = object.__new__(LineIndex)
+        clone.__dict__.update(self.__dict__)
+        clone._order = None if self._order is None else array(self._order.typecode, self._order)
+        return clone
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        # Process pools re-open the file (and its cached index) instead of pickling offsets
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
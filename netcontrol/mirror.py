@@ -0,0 +1,316 @@
+"""Read-only web view of the section net control is reading, for other laptops
+
+A small HTTP and WebSocket server (standard library asyncio only) runs on its
+own thread. Browsers load the page at / and open /ws. A viewer that connects
+receives the current script once. After that it only receives deltas:
+
+    {"t": "script", "rev": 3, "titles": [...], "sections": [...], "idx": 0}
+    {"t": "goto", "rev": 4, "idx": 2}
+    {"t": "edit", "rev": 5, "i": 2, "at": 120, "end": 124, "text": "..."}
+
+An edit is the splice that changed the section (replace [at:end] with text, in
+the UTF-16 units JavaScript strings are indexed by), not the section itself, so
+typing into a long section sends a few bytes per change. Each message is encoded into a WebSocket frame once and written to every viewer
+without waiting on any of them. A viewer that falls more than MAX_BACKLOG bytes
+behind is disconnected, and reconnects into a fresh snapshot. /state returns the
+snapshot as JSON.
+
+The publish_* methods may be called from any thread.
+"""
+import json
+import base64
+import asyncio
+import socket
+import hashlib
+import threading
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+MAX_BACKLOG = 1 << 20
+MAX_HEADER = 16 * 1024
+
+OP_TEXT, OP_CLOSE, OP_PING, OP_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def encode_frame(payload, opcode=OP_TEXT):
+    """Unmasked server-to-client frame"""
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, length))
+    elif length < 1 << 16:
+        header = bytes((0x80 | opcode, 126)) + length.to_bytes(2, 'big')
+    else:
+        header = bytes((0x80 | opcode, 127)) + length.to_bytes(8, 'big')
+    return header + payload
+
+
+async def read_frame(reader, limit=MAX_HEADER):
+    """(opcode, payload) of the next frame; frames from browsers are always masked"""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), 'big')
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), 'big')
+    if limit is not None and length > limit:
+        raise ConnectionError("oversized frame")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return first & 0x0F, payload
+
+
+def lan_address():
+    """This machine's address on the local network, for the URL other laptops open"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            # Connecting a UDP socket sends nothing; it only picks the outgoing interface
+            s.connect(('10.255.255.255', 1))
+            return s.getsockname()[0]
+        except OSError:
+            return '127.0.0.1'
+
+
+def utf16_length(text, end):
+    """Length of text[:end] in UTF-16 code units, the offsets a browser slices strings by"""
+    prefix = text[:end]
+    if prefix.isascii():
+        return end
+    return len(prefix.encode('utf-16-le')) // 2
+
+
+def accept_key(key):
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+
+
+VIEWER_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Net Control</title>
+<style>
+body { font-family: sans-serif; margin: 0; background: #2b2b2b; color: #fff; }
+header { padding: 0.6em 1em; background: #3c3c3c; display: flex; justify-content: space-between; }
+#status { color: #aaa; }
+h1 { font-size: 1.4em; margin: 0.6em 1em; }
+pre { white-space: pre-wrap; font-family: Consolas, 'Courier New', monospace; font-size: 1.2em; margin: 0 1em 2em; }
+.changed { animation: flash 1s; }
+@keyframes flash { from { background: #4a90e2; } to { background: transparent; } }
+</style>
+</head>
+<body>
+<header><span id="progress">Waiting for net control...</span><span id="status">connecting</span></header>
+<h1 id="title"></h1>
+<pre id="content"></pre>
+<script>
+let script = {titles: [], sections: [], idx: 0};
+function render() {
+  const title = script.titles[script.idx];
+  document.getElementById('progress').textContent =
+    title === undefined ? 'No script loaded' : `Section ${script.idx + 1} of ${script.titles.length}`;
+  document.getElementById('title').textContent = title || '';
+  const content = document.getElementById('content');
+  content.textContent = script.sections[script.idx] || '';
+  content.classList.remove('changed'); void content.offsetWidth; content.classList.add('changed');
+}
+function connect() {
+  const ws = new WebSocket(`ws://${location.host}/ws`);
+  const status = document.getElementById('status');
+  ws.onopen = () => { status.textContent = 'live'; };
+  ws.onclose = () => { status.textContent = 'reconnecting'; setTimeout(connect, 1000); };
+  ws.onmessage = (event) => {
+    const m = JSON.parse(event.data);
+    if (m.t === 'script') script = {titles: m.titles, sections: m.sections, idx: m.idx};
+    else if (m.t === 'goto') script.idx = m.idx;
+    else if (m.t === 'edit') {
+      const text = script.sections[m.i];
+      script.sections[m.i] = text.slice(0, m.at) + m.text + text.slice(m.end);
+      if (m.i !== script.idx) return;
+    }
+    render();
+  };
+}
+connect();
+</script>
+</body>
+</html>
+"""
+
+
+class SectionMirror:
+    """Background server broadcasting the shown section to browsers"""
+
+    def __init__(self, host='127.0.0.1', port=8765):
+        self.host = host
+        self.port = port
+        self.titles = []
+        self.sections = []
+        self.idx = 0
+        self.rev = 0
+        self.viewers = set()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._handlers = set()
+        self._started = threading.Event()
+        self._error = None
+
+    @property
+    def url(self):
+        host = lan_address() if self.host in ('', '0.0.0.0') else self.host
+        return f"http://{host}:{self.port}/"
+
+    def start(self):
+        """Start serving; raises OSError if the port cannot be bound"""
+        self._thread = threading.Thread(target=self._run, name='section-mirror', daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEADER)
+            )
+            # Port 0 picks a free port, which is how the tests run side by side
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self._error = e
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def stop(self):
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    async def _shutdown(self):
+        self._server.close()
+        for writer in list(self.viewers):
+            writer.close()
+        self.viewers.clear()
+        # Closing a viewer ends its handler; wait for them so the loop stops with nothing pending
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=1)
+        self._loop.stop()
+
+    # Called from the GUI thread; state changes happen on the server's loop
+
+    def publish_script(self, sections, idx=0):
+        titles = [title for title, _ in sections]
+        contents = [content for _, content in sections]
+        self._call(self._set_script, titles, contents, idx)
+
+    def publish_goto(self, idx):
+        self._call(self._set_idx, idx)
+
+    def publish_edit(self, index, splice):
+        """Broadcast a (start, end, text) splice of section `index`, as made by netcontrol.pieces"""
+        self._call(self._splice, index, splice)
+
+    def _call(self, fn, *args):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def _set_script(self, titles, sections, idx):
+        self.titles, self.sections, self.idx = titles, sections, idx
+        self._broadcast(self.snapshot())
+
+    def _set_idx(self, idx):
+        if idx != self.idx:
+            self.idx = idx
+            self._broadcast({'t': 'goto', 'idx': idx})
+
+    def _splice(self, index, splice):
+        start, end, inserted = splice
+        if index >= len(self.sections) or (start == end and not inserted):
+            return
+        content = self.sections[index]
+        self.sections[index] = content[:start] + inserted + content[end:]
+        self._broadcast({'t': 'edit', 'i': index, 'at': utf16_length(content, start),
+                         'end': utf16_length(content, end), 'text': inserted})
+
+    def snapshot(self):
+        return {'t': 'script', 'rev': self.rev, 'titles': self.titles, 'sections': self.sections, 'idx': self.idx}
+
+    def _broadcast(self, message):
+        self.rev += 1
+        message['rev'] = self.rev
+        frame = encode_frame(json.dumps(message, separators=(',', ':')).encode('utf-8'))
+        for writer in list(self.viewers):
+            writer.write(frame)
+            if writer.transport.get_write_buffer_size() > MAX_BACKLOG:
+                self.viewers.discard(writer)
+                writer.close()
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode('latin-1').split('\r\n')
+        parts = lines[0].split()
+        path = parts[1] if len(parts) > 1 else '/'
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                await self._serve_viewer(reader, writer, headers)
+            elif path == '/':
+                self._respond(writer, '200 OK', 'text/html; charset=utf-8', VIEWER_PAGE.encode('utf-8'))
+            elif path == '/state':
+                body = json.dumps(self.snapshot()).encode('utf-8')
+                self._respond(writer, '200 OK', 'application/json', body)
+            else:
+                self._respond(writer, '404 Not Found', 'text/plain', b'Not found')
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.viewers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _respond(writer, status, content_type, body):
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            "Cache-Control: no-store\r\nConnection: close\r\n\r\n".encode('latin-1') + body
+        )
+
+    async def _serve_viewer(self, reader, writer, headers):
+        key = headers.get('sec-websocket-key')
+        if not key:
+            self._respond(writer, '400 Bad Request', 'text/plain', b'Missing Sec-WebSocket-Key')
+            return
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n".encode('latin-1')
+        )
+        writer.write(encode_frame(json.dumps(self.snapshot(), separators=(',', ':')).encode('utf-8')))
+        self.viewers.add(writer)
+        # Viewers never send data; only control frames need an answer
+        while True:
+            opcode, payload = await read_frame(reader)
+            if opcode == OP_CLOSE:
+                writer.write(encode_frame(payload[:2], OP_CLOSE))
+                return
+            if opcode == OP_PING:
+                writer.write(encode_frame(payload, OP_PONG))
@@ -0,0 +1,121 @@
+"""Piece-table text for edited sections, with undo, redo and reset
+
+A section's text is a list of pieces, each a (buffer, start, end) span of either
+the generated original or a string that was typed in. Edits only rearrange
+pieces. Typed text is stored once, and nothing is ever copied out of the
+original. Each edit is recorded as the pieces it removed and the pieces it
+inserted, so history grows with what was typed rather than with the size of
+the section. Undo, redo and reset to the original only swap short piece lists.
+
+Every change is reported as a splice, (start, end, text), meaning "replace
+text[start:end] with text", which is all the session journal writes for an
+edit.
+"""
+
+
+def _common_prefix(a, b):
+    # Bisect with slice comparisons, which run in C, instead of a per-character loop
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def splice_between(old, new):
+    """Smallest single (start, end, text) splice turning old into new"""
+    start = _common_prefix(old, new)
+    tail = _common_prefix(old[start:][::-1], new[start:][::-1])
+    return start, len(old) - tail, new[start:len(new) - tail]
+
+
+def apply_splice(text, splice):
+    start, end, inserted = splice
+    return text[:start] + inserted + text[end:]
+
+
+class PieceTable:
+    """One section's text as spans of the original and of inserted strings"""
+
+    def __init__(self, original):
+        self.original = original
+        self.pieces = [(original, 0, len(original))] if original else []
+        self.undo_stack = []    # (piece index, offset, removed pieces, inserted pieces)
+        self.redo_stack = []
+
+    def text(self):
+        return ''.join(buffer[start:end] for buffer, start, end in self.pieces)
+
+    def __len__(self):
+        return sum(end - start for _, start, end in self.pieces)
+
+    @property
+    def modified(self):
+        return self.pieces != ([(self.original, 0, len(self.original))] if self.original else [])
+
+    def replace(self, start, end, text):
+        """Replace text[start:end]; returns the splice applied, or None if nothing changed"""
+        if start == end and not text:
+            return None
+        pieces = self.pieces
+        first, offset = 0, 0
+        while first < len(pieces) and offset + pieces[first][2] - pieces[first][1] <= start:
+            offset += pieces[first][2] - pieces[first][1]
+            first += 1
+        first_offset = offset
+        last = first
+        while last < len(pieces) and offset < end:
+            offset += pieces[last][2] - pieces[last][1]
+            last += 1
+        removed = pieces[first:last]
+        if not removed and not text:
+            return None
+
+        # Keep the parts of the first and last pieces that lie outside start..end
+        inserted = []
+        if removed and start > first_offset:
+            buffer, piece_start, _ = removed[0]
+            inserted.append((buffer, piece_start, piece_start + start - first_offset))
+        if text:
+            inserted.append((text, 0, len(text)))
+        if removed and offset > end:
+            buffer, _, piece_end = removed[-1]
+            inserted.append((buffer, piece_end - (offset - end), piece_end))
+        self._swap(first, first_offset, removed, inserted)
+        self.redo_stack.clear()
+        return start, end, text
+
+    def _swap(self, index, offset, removed, inserted):
+        self.pieces[index:index + len(removed)] = inserted
+        self.undo_stack.append((index, offset, removed, inserted))
+
+    @staticmethod
+    def _span(pieces):
+        return ''.join(buffer[start:end] for buffer, start, end in pieces)
+
+    def _revert(self, source, target):
+        index, offset, removed, inserted = source.pop()
+        self.pieces[index:index + len(inserted)] = removed
+        target.append((index, offset, inserted, removed))
+        # The swapped pieces can extend past the edit; report only the part that changed
+        start, end, text = splice_between(self._span(inserted), self._span(removed))
+        return offset + start, offset + end, text
+
+    def undo(self):
+        """Undo the last change; returns its splice, or None if there is nothing to undo"""
+        return self._revert(self.undo_stack, self.redo_stack) if self.undo_stack else None
+
+    def redo(self):
+        return self._revert(self.redo_stack, self.undo_stack) if self.redo_stack else None
+
+    def reset(self):
+        """Back to the original text as one undoable change; None if it is already unchanged"""
+        if not self.modified:
+            return None
+        length = len(self)
+        self._swap(0, 0, list(self.pieces), [(self.original, 0, len(self.original))] if self.original else [])
+        self.redo_stack.clear()
+        return 0, length, self.original
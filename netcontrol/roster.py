@@ -0,0 +1,149 @@
+"""Prefix lookup over a large station roster without loading it into Python objects
+
+A roster is a text file with one station per line, fields separated by '|':
+
+    W5ALC|Jon Smith|Pueblo, CO
+    K0ABC|Ann Jones|Denver, CO
+
+Only the callsign is required. Each column gets a sorted array of line numbers,
+ordered by the upper-cased field, so a completion is a binary search over that
+array plus a short forward scan. Every comparison reads straight from the
+memory-mapped file. The arrays are cached next to the roster, like the line
+index they build on, and reused while the file is unchanged.
+"""
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+from netcontrol.lineindex import LineIndex
+
+CALLSIGN, NAME, LOCATION = range(3)
+COLUMNS = 3
+SEPARATOR = b'|'
+
+CACHE_MAGIC = b'NCROST1\0'
+# magic, source size, source mtime_ns, line count, column count
+CACHE_HEADER = struct.Struct('<8sQqQQ')
+
+
+def roster_cache_path(path):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{name}.rosteridx")
+
+
+class Roster:
+    """Sorted per-column indexes over a memory-mapped roster file"""
+
+    def __init__(self, path, progress=None):
+        """progress, if given, is called with the fraction done; it may raise to abort"""
+        self.path = path
+        # The line scan is the quick part of a first build; sorting the columns is the rest
+        self.lines = LineIndex(path, progress=progress and (lambda done: progress(done * 0.25)))
+        stat = os.stat(path)
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        self.orders = self._load_cache()
+        if self.orders is None:
+            try:
+                self.orders = []
+                for column in range(COLUMNS):
+                    self.orders.append(self._build_order(column))
+                    if progress is not None:
+                        progress(0.25 + 0.75 * (column + 1) / COLUMNS)
+            except BaseException:
+                self.close()
+                raise
+            self._save_cache()
+
+    def __len__(self):
+        return len(self.lines)
+
+    def field(self, line, column):
+        """Upper-cased raw bytes of one field, used as the sort key"""
+        return self._field(line, column).upper()
+
+    def _field(self, line, column):
+        raw = self.lines.raw(line)
+        for _ in range(column):
+            cut = raw.find(SEPARATOR)
+            if cut == -1:
+                return b''
+            raw = raw[cut + 1:]
+        cut = raw.find(SEPARATOR)
+        return (raw if cut == -1 else raw[:cut]).strip()
+
+    def _build_order(self, column):
+        keys = [self.field(line, column) for line in range(len(self.lines))]
+        order = array('I' if len(keys) < 2 ** 32 else 'Q')
+        order.extend(line for line in sorted(range(len(keys)), key=keys.__getitem__) if keys[line])
+        return order
+
+    def _load_cache(self):
+        try:
+            with open(roster_cache_path(self.path), 'rb') as f:
+                magic, size, mtime_ns, count, columns = CACHE_HEADER.unpack(f.read(CACHE_HEADER.size))
+                if (magic != CACHE_MAGIC or size != self._size or mtime_ns != self._mtime_ns
+                        or count != len(self.lines) or columns != COLUMNS):
+                    return None
+                orders = []
+                for _ in range(columns):
+                    typecode, length = struct.unpack('<1s7xQ', f.read(16))
+                    order = array(typecode.decode('ascii'))
+                    order.fromfile(f, length)
+                    orders.append(order)
+                return orders
+        except (OSError, EOFError, struct.error, ValueError):
+            return None
+
+    def _save_cache(self):
+        cache_file = roster_cache_path(self.path)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, self._size, self._mtime_ns, len(self.lines), COLUMNS))
+                for order in self.orders:
+                    f.write(struct.pack('<1s7xQ', order.typecode.encode('ascii'), len(order)))
+                    order.tofile(f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def complete(self, prefix, column=CALLSIGN, limit=12):
+        """Distinct values of `column` starting with prefix (case-insensitive), in sorted order"""
+        key = prefix.strip().upper().encode('utf-8')
+        if not key:
+            return []
+        order = self.orders[column]
+        sort_key = lambda line: self.field(line, column)
+        position = bisect_left(order, key, key=sort_key)
+        results = []
+        while position < len(order) and len(results) < limit:
+            value = self._field(order[position], column)
+            if not value.upper().startswith(key):
+                break
+            results.append(value.decode('utf-8', errors='replace'))
+            position += 1
+            if position < len(order) and sort_key(order[position]) == value.upper():
+                # Jump over repeats of this value (a location may appear on thousands of lines)
+                position = bisect_right(order, value.upper(), lo=position, key=sort_key)
+        return results
+
+    def lookup(self, callsign):
+        """(callsign, name, location) for an exact callsign, or None"""
+        key = callsign.strip().upper().encode('utf-8')
+        if not key:
+            return None
+        order = self.orders[CALLSIGN]
+        position = bisect_left(order, key, key=lambda line: self.field(line, CALLSIGN))
+        if position < len(order) and self.field(order[position], CALLSIGN) == key:
+            line = order[position]
+            return tuple(self._field(line, column).decode('utf-8', errors='replace')
+                         for column in range(COLUMNS))
+        return None
+
+    def close(self):
+        self.lines.close()
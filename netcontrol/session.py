@@ -0,0 +1,99 @@
+"""Several nets in one process
+
+A NetSession holds only what differs between nets run side by side (the
+profile, generated script, position, check-in log and journal). Everything
+read-only is shared through the SessionManager: a topic file is indexed
+and mapped once, and each session gets a LineIndex view with its own shuffle
+order over it. Templates are shared through the process-wide cache in
+netcontrol.templates, while themes, the roster and the licensee index belong
+to the window.
+
+Each session journals to its own file, so recovery after a crash restores
+every net that was open.
+"""
+import glob
+import os
+import threading
+from dataclasses import dataclass, field
+
+from netcontrol.checkins import CheckInStore
+from netcontrol.engine import DEFAULT_TOPICS, DEFAULT_ANNOUNCEMENTS, NetProfile
+from netcontrol.journal import JOURNAL_FILE
+from netcontrol.lineindex import LineIndex
+from netcontrol.topicstore import file_signature
+
+
+@dataclass(eq=False)
+class NetSession:
+    name: str
+    journal_path: str = JOURNAL_FILE
+    profile: NetProfile = None      # Setup tab values, saved while another session is shown
+    topics: object = field(default_factory=lambda: list(DEFAULT_TOPICS))    # list or LineIndex view
+    club_announcements: list = field(default_factory=lambda: list(DEFAULT_ANNOUNCEMENTS))
+    nco_announcements: list = None
+    sections: list = field(default_factory=list)
+    section_idx: int = 0
+    edits: dict = field(default_factory=dict)     # section index -> PieceTable, once edited
+    export_lines: list = field(default_factory=list)
+    checkin_store: CheckInStore = field(default_factory=CheckInStore)
+    net_started: float = None
+    recorded_net_id: int = None
+    journal: object = None          # SessionJournal, created by the session's first event
+
+
+def journal_files(path=JOURNAL_FILE):
+    """Journals left by sessions that did not close normally, first session first"""
+    stem, extension = os.path.splitext(path)
+    numbered = []
+    for name in glob.glob(f"{glob.escape(stem)}-*{extension}"):
+        number = name[len(stem) + 1:len(name) - len(extension)]
+        if number.isdigit():
+            numbered.append((int(number), name))
+    return ([path] if os.path.exists(path) else []) + [name for _, name in sorted(numbered)]
+
+
+class SessionManager:
+    """Open sessions plus the read-only resources they share"""
+
+    def __init__(self, journal_path=JOURNAL_FILE):
+        self.journal_path = journal_path
+        self.sessions = []
+        self._libraries = {}    # absolute path -> (signature, LineIndex)
+        self._lock = threading.Lock()
+        self._next_number = 1
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __iter__(self):
+        return iter(self.sessions)
+
+    def new_session(self, name=None, journal_path=None):
+        """Add a session; journal_path is given when recovering one, otherwise the next free file"""
+        in_use = {session.journal_path for session in self.sessions}
+        stem, extension = os.path.splitext(self.journal_path)
+        while True:
+            number = self._next_number
+            self._next_number += 1
+            path = self.journal_path if number == 1 else f"{stem}-{number}{extension}"
+            if journal_path is not None or path not in in_use:
+                break
+        journal_path = journal_path or path
+        session = NetSession(name or f"Net {number}", journal_path)
+        self.sessions.append(session)
+        return session
+
+    def remove(self, session):
+        self.sessions.remove(session)
+
+    def topic_library(self, path, progress=None):
+        """A view of the shared index for a topics file, building it on first use (any thread)"""
+        path = os.path.abspath(path)
+        signature = file_signature(path)
+        with self._lock:
+            cached = self._libraries.get(path)
+            if cached is None or cached[0] != signature:
+                # Sessions still holding views of a replaced index keep it alive until they drop it
+                cached = (signature, LineIndex(path, progress=progress))
+                self._libraries[path] = cached
+            return cached[1].view()
@@ -0,0 +1,174 @@
+"""File-based section templates, compiled once into cached render plans
+
+Section bodies come from plain text files in the templates directory
+(``templates/`` by default, or ``templates/<template_set>/`` for a profile that
+selects another net format). Placeholders use ``{field}`` and literal braces are
+written ``{{`` and ``}}``. Missing files fall back to the built-in text.
+
+Each file is parsed once into a render plan and kept in a process-wide cache
+keyed by path; the plan is recompiled only when the file's mtime or size changes.
+"""
+import os
+from pathlib import Path
+
+TEMPLATES_DIR = Path('templates')
+
+# (section key, file name) in the order the files are documented
+SECTION_TEMPLATES = (
+    ('opening', 'opening.txt'),
+    ('connection', 'connection_instructions.txt'),
+    ('net_instructions', 'net_instructions.txt'),
+    ('closing', 'closing.txt'),
+)
+
+FIELDS = frozenset({
+    'callsign', 'name', 'location', 'time', 'meeting_time', 'day', 'meeting_day',
+    'club_name', 'net_name', 'timezone', 'repeater_info', 'website', 'topics'
+})
+
+DEFAULT_TEMPLATES = {
+    'opening': """START OF NET:
+
+    Good evening everyone, it is {time} in the Rocky Mountains. This is {name}, {callsign}, located in {location}. Welcome to the {club_name} {day} Night {net_name}.
+
+    This NET meets every {time} Night to discuss amateur radio and other interesting topics. We are here to have fun on the radio through our communications and help to make the use of many fine repeaters that otherwise might be very underutilized and quiet. That also lets others hear that the repeaters are on the air, and that they are active!
+
+    When more than 2 people are using the repeaters, please set up a 'rotation' so that you won't be doubling over the other parties in a 'round table' discussion. It is VERY IMPORTANT to remember you are on many repeaters simultaneously. Good amateur operating practice is remembering to allow all who might want to join in an opportunity to do so, just like using a single stand-alone repeater. Long ragchews are welcome, though remember, most of the repeaters have a 3-minute timeout, keep that in mind as you talk to a friend.
+
+    (BREAK FOR REPEATER RESET)""",
+
+    'connection': """    When monitoring the repeater system, we ask that you DO NOT 'KERCHUNCK' the system or repeater to test to see if you are keying up the system. PLEASE DO come on and ask for a radio check. KERCHUNCKING the system can cause link issues. Once again, to see if you are making the 'repeater' actually come on and ask for a radio check. Most of the time you will get an answer from someone. AND, if YOU hear anyone ask for a radio check and no one responds fairly quickly, then you come on and advise the asking station that they are making the system and can be heard, or give a proper signal report.
+
+    (BREAK FOR REPEATER RESET)""",
+
+    'net_instructions': """    This is a directed NET. All check-ins must go through net control. We will take a few check-ins then do a roundtable of that list, then take another check-in list. We take check-ins by Modes.
+
+
+    PLEASE LISTEN CAREFULLY TO THESE CHECK-IN INSTRUCTIONS:
+        WHEN CHECKING IN SAY ONLY YOUR CALLSIGN PHONETICALLY TWICE. Please to facilitate the system keying up allow a key up time of 1.5 seconds, and hold the PTT a half second or so at the last syllable so that you don't get cut off. If Net control misses you then please stand by for the next round of check-ins.
+
+    Tonight's Topic:
+
+\t{topics}
+
+    SHORTTIMERS CHECK IN FIRST.
+        No-Traffic Check-ins - Make sure to acknowledge check-ins
+        Repeater Owners and System Operators - Make sure to acknowledge check-ins
+        Digital Check-ins - Make sure to acknowledge check-ins
+        Analog Check-ins - Make sure to acknowledge check-ins
+
+    Now we'll open the floor for any additional comments, questions, or announcements. This is your opportunity to share anything ham radio related that we haven't covered tonight. Please give your callsign twice if you have something to share.
+
+    When all have been called:
+        Did we miss anyone?
+        Last call""",
+
+    'closing': """    This has been the {club_name} {day} Night {net_name}. With that, this is {name}, {callsign} from {location} wrapping up tonight's net and returning all systems to normal amateur use. 73' and have a great night, we will look for you next week!""",
+}
+
+
+class TemplateError(ValueError):
+    """A template file could not be parsed"""
+
+
+def compile_template(source, origin='<template>'):
+    """Parse template text into a plan: literals at even positions, field names at odd ones"""
+    plan = []
+    literal = []
+    i = 0
+    length = len(source)
+    while i < length:
+        char = source[i]
+        if char == '{':
+            if source.startswith('{{', i):
+                literal.append('{')
+                i += 2
+                continue
+            end = source.find('}', i)
+            if end == -1:
+                raise TemplateError(f"{origin}: unclosed '{{' at line {source.count(chr(10), 0, i) + 1}")
+            field = source[i + 1:end].strip()
+            if field not in FIELDS:
+                raise TemplateError(f"{origin}: unknown field {{{field}}} at line {source.count(chr(10), 0, i) + 1}")
+            plan.append(''.join(literal))
+            plan.append(field)
+            literal = []
+            i = end + 1
+        elif char == '}':
+            if not source.startswith('}}', i):
+                raise TemplateError(f"{origin}: single '}}' at line {source.count(chr(10), 0, i) + 1}")
+            literal.append('}')
+            i += 2
+        else:
+            # Copy the run of plain text up to the next brace in one step
+            next_brace = min((p for p in (source.find('{', i), source.find('}', i)) if p != -1), default=length)
+            literal.append(source[i:next_brace])
+            i = next_brace
+    plan.append(''.join(literal))
+    return tuple(plan)
+
+
+def render_plan(plan, values):
+    """Fill a compiled plan with field values"""
+    parts = list(plan)
+    for i in range(1, len(parts), 2):
+        parts[i] = values[parts[i]]
+    return ''.join(parts)
+
+
+# path -> (mtime_ns, size, plan); shared by every TemplateSet in the process
+_plan_cache = {}
+_default_plans = {}
+
+
+def load_plan(path, key):
+    """Compiled plan for a template file, recompiled only when the file changes"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        if key not in _default_plans:
+            _default_plans[key] = compile_template(DEFAULT_TEMPLATES[key], f"<default {key}>")
+        return _default_plans[key]
+
+    cached = _plan_cache.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    with open(path, 'r', encoding='utf-8') as f:
+        plan = compile_template(f.read(), str(path))
+    _plan_cache[path] = (stat.st_mtime_ns, stat.st_size, plan)
+    return plan
+
+
+class TemplateSet:
+    """The section templates of one net format"""
+
+    def __init__(self, directory=TEMPLATES_DIR, template_set=''):
+        self.directory = Path(directory) / template_set if template_set else Path(directory)
+
+    def path(self, key):
+        return self.directory / dict(SECTION_TEMPLATES)[key]
+
+    def render(self, key, values):
+        return render_plan(load_plan(self.path(key), key), values)
+
+    def write_defaults(self):
+        """Create any missing template files from the built-in text so they can be edited"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for key, filename in SECTION_TEMPLATES:
+            path = self.directory / filename
+            if not path.exists():
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(DEFAULT_TEMPLATES[key])
+
+
+def available_template_sets(directory=TEMPLATES_DIR):
+    """Names of the net-format subdirectories that contain at least one section template"""
+    names = []
+    try:
+        entries = sorted(Path(directory).iterdir())
+    except OSError:
+        return names
+    for entry in entries:
+        if entry.is_dir() and any((entry / filename).exists() for _, filename in SECTION_TEMPLATES):
+            names.append(entry.name)
+    return names
@@ -0,0 +1,218 @@
+"""Theme definitions: a color table plus one shared stylesheet template
+
+Colors are applied through the window palette, and the stylesheet only
+carries what a palette cannot express (borders, radii, padding, hover states).
+There is deliberately no catch-all ``QWidget { ... }`` rule, so widgets that no
+rule matches keep the native style and are cheap to polish.
+
+User themes are .ini files in the themes directory:
+
+    [theme]
+    name = Night Red
+    base = dark            ; built-in theme whose colors fill in the gaps
+    stylesheet = extra.qss ; optional, appended after the shared rules
+
+    [colors]
+    window = #1a0000
+    highlight = #aa0000
+
+Color names match the keys of DARK_COLORS; ``$name`` in a stylesheet expands to
+the theme's color. Interactive states (hover, validation, editing, status
+messages) are selected by dynamic properties (see set_style_state in the GUI).
+"""
+import os
+import configparser
+from string import Template
+from dataclasses import dataclass
+from pathlib import Path
+
+THEMES_DIR = Path('themes')
+
+LIGHT_COLORS = {
+    'window': '#f8f9fa',
+    'window_text': '#212529',
+    'base': '#ffffff',
+    'alternate_base': '#f1f3f5',
+    'text': '#212529',
+    'editor_base': '#f4f4f4',
+    'focus_base': '#f0f8ff',
+    'button': '#17a2b8',
+    'button_text': '#ffffff',
+    'button_border': '#138496',
+    'button_hover': '#138496',
+    'button_hover_border': '#117a8b',
+    'button_pressed': '#117a8b',
+    'button_disabled': '#e0e0e0',
+    'disabled_text': '#6c757d',
+    'highlight': '#4a90e2',
+    'highlighted_text': '#ffffff',
+    'border': '#cccccc',
+    'input_border': '#dddddd',
+    'tab': '#e0e0e0',
+    'tab_selected': '#d0d0d0',
+    'success': '#28a745',
+    'danger': '#e74c3c',
+    'primary': '#27ae60',
+    'error_text': '#c62828',
+    'error_base': '#ffebee',
+    'error_border': '#ef5350',
+    'success_text': '#2e7d32',
+    'success_base': '#e8f5e8',
+    'success_border': '#66bb6a',
+    'editing_base': '#000000',
+    'editing_border': '#ffc107',
+}
+
+DARK_COLORS = {
+    'window': '#2b2b2b',
+    'window_text': '#ffffff',
+    'base': '#3c3c3c',
+    'alternate_base': '#2b2b2b',
+    'text': '#ffffff',
+    'editor_base': '#3c3c3c',
+    'focus_base': '#3c3c3c',
+    'button': '#3c3c3c',
+    'button_text': '#ffffff',
+    'button_border': '#555555',
+    'button_hover': '#4a4a4a',
+    'button_hover_border': '#777777',
+    'button_pressed': '#2b2b2b',
+    'button_disabled': '#333333',
+    'disabled_text': '#888888',
+    'highlight': '#4a90e2',
+    'highlighted_text': '#ffffff',
+    'border': '#555555',
+    'input_border': '#555555',
+    'tab': '#3c3c3c',
+    'tab_selected': '#2b2b2b',
+    'success': '#28a745',
+    'danger': '#e74c3c',
+    'primary': '#27ae60',
+    'error_text': '#c62828',
+    'error_base': '#ffebee',
+    'error_border': '#ef5350',
+    'success_text': '#2e7d32',
+    'success_base': '#e8f5e8',
+    'success_border': '#66bb6a',
+    'editing_base': '#000000',
+    'editing_border': '#ffc107',
+}
+
+STYLESHEET_TEMPLATE = """
+QTabWidget::pane { border: 1px solid $border; }
+QTabBar::tab {
+    background: $tab; color: $window_text; border: 1px solid $border;
+    padding: 8px 16px; margin-right: 2px;
+    border-top-left-radius: 4px; border-top-right-radius: 4px;
+}
+QTabBar::tab:selected { background: $tab_selected; border-bottom: none; }
+QGroupBox {
+    font-weight: bold; border: 2px solid $border; border-radius: 8px;
+    margin-top: 10px; padding: 10px;
+}
+QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; left: 10px; padding: 0 8px; }
+QLineEdit, QSpinBox, QComboBox {
+    border: 2px solid $input_border; border-radius: 4px; padding: 6px 8px;
+    background-color: $base; color: $text;
+}
+QLineEdit:focus, QSpinBox:focus, QComboBox:focus { border-color: $highlight; background-color: $focus_base; }
+QPushButton {
+    background-color: $button; color: $button_text; border: 2px solid $button_border;
+    border-radius: 6px; padding: 8px 16px; font-weight: 500;
+}
+QPushButton:hover { background-color: $button_hover; border-color: $button_hover_border; }
+QPushButton:pressed { background-color: $button_pressed; }
+QPushButton:disabled { background-color: $button_disabled; color: $disabled_text; border-color: $border; }
+QTextEdit {
+    border: 1px solid $border; border-radius: 4px; background-color: $editor_base; color: $text;
+    font-family: 'Consolas', 'Courier New', monospace; font-size: 14px;
+}
+QListView {
+    border: 1px solid $border; border-radius: 4px;
+    background-color: $base; color: $text; alternate-background-color: $alternate_base;
+}
+QListView::item { padding: 8px; border-bottom: 1px solid $alternate_base; }
+QListView::item:selected { background-color: $highlight; color: $highlighted_text; }
+QProgressBar { border: 1px solid $border; border-radius: 4px; text-align: center; height: 20px; }
+QProgressBar::chunk { background-color: $success; border-radius: 4px; }
+QCheckBox { padding: 4px; }
+
+/* Widget states are dynamic properties; changing one only re-polishes that widget */
+QPushButton[role="danger"] { background-color: $danger; color: #ffffff; }
+QPushButton[role="primary"] { background-color: $primary; color: #ffffff; font-size: 16px; font-weight: bold; }
+QPushButton[animated="true"]:hover { background-color: $highlight; }
+QLineEdit[valid="true"] { border: 2px solid $success; }
+QLineEdit[valid="false"] { border: 2px solid $danger; }
+QTextEdit[editing="true"] { background-color: $editing_base; border: 2px solid $editing_border; }
+QFrame#statusBar[state="error"] { background-color: $error_base; border: 1px solid $error_border; }
+QFrame#statusBar[state="success"] { background-color: $success_base; border: 1px solid $success_border; }
+QFrame#statusBar QLabel[state="error"] { color: $error_text; }
+QFrame#statusBar QLabel[state="success"] { color: $success_text; }
+"""
+
+
+@dataclass(frozen=True)
+class Theme:
+    name: str
+    dark: bool
+    colors: tuple       # (color name, '#rrggbb') pairs
+    stylesheet: str     # fully expanded, ready for setStyleSheet
+
+    def color(self, key):
+        return dict(self.colors)[key]
+
+
+def make_theme(name, dark, colors, extra_stylesheet=''):
+    """Expand the stylesheet template once for a color table"""
+    template = Template(STYLESHEET_TEMPLATE + extra_stylesheet)
+    return Theme(name, dark, tuple(colors.items()), template.safe_substitute(colors))
+
+
+BUILTIN_THEMES = {
+    'Dark': make_theme('Dark', True, DARK_COLORS),
+    'Light': make_theme('Light', False, LIGHT_COLORS),
+}
+
+
+def load_theme_file(path):
+    """Read a user theme; raises ValueError if the file is not a valid theme"""
+    config = configparser.ConfigParser()
+    try:
+        if not config.read(path, encoding='utf-8'):
+            raise ValueError(f"Cannot read theme file: {path}")
+    except configparser.Error as e:
+        raise ValueError(f"{path}: {e}") from e
+
+    name = config.get('theme', 'name', fallback=Path(path).stem)
+    base = config.get('theme', 'base', fallback='light').lower()
+    dark = base == 'dark'
+    colors = dict(DARK_COLORS if dark else LIGHT_COLORS)
+    if config.has_section('colors'):
+        for key, value in config.items('colors'):
+            if key not in colors:
+                raise ValueError(f"{path}: unknown color '{key}'")
+            colors[key] = value
+
+    extra = ''
+    stylesheet = config.get('theme', 'stylesheet', fallback='')
+    if stylesheet:
+        with open(os.path.join(os.path.dirname(path), stylesheet), 'r', encoding='utf-8') as f:
+            extra = f.read()
+    return make_theme(name, dark, colors, extra)
+
+
+def load_user_themes(directory=THEMES_DIR):
+    """Valid themes from directory/*.ini; broken files are reported and skipped"""
+    themes = {}
+    try:
+        paths = sorted(Path(directory).glob('*.ini'))
+    except OSError:
+        return themes
+    for path in paths:
+        try:
+            theme = load_theme_file(path)
+        except (OSError, ValueError) as e:
+            print(f"Skipping theme {path}: {e}")
+            continue
+        themes[theme.name] = theme
+    return themes
@@ -0,0 +1,191 @@
+"""On-disk topic library with usage history, for no-repeat topic selection
+
+Topics are stored once by text in SQLite and linked to one or more libraries
+(the default list or a loaded topics file). Every generated net is recorded, so
+selection can skip anything used in the last K nets of that library across
+restarts.
+
+Selection walks an index of per-library random keys from a random starting point
+and stops at the first eligible topic, so it costs a few index probes rather than
+a scan of the library, however large the library or the history grows.
+"""
+import os
+import random
+import sqlite3
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL UNIQUE,
+    last_net INTEGER
+);
+CREATE TABLE IF NOT EXISTS libraries (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    signature TEXT
+);
+CREATE TABLE IF NOT EXISTS library_topics (
+    library_id INTEGER NOT NULL,
+    topic_id INTEGER NOT NULL,
+    shuffle_key INTEGER NOT NULL,
+    PRIMARY KEY (library_id, topic_id)
+);
+CREATE INDEX IF NOT EXISTS library_topics_shuffle ON library_topics (library_id, shuffle_key);
+CREATE TABLE IF NOT EXISTS nets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    held_at TEXT NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    library TEXT
+);
+CREATE TABLE IF NOT EXISTS topic_usage (
+    net_id INTEGER NOT NULL,
+    topic_id INTEGER NOT NULL,
+    PRIMARY KEY (net_id, topic_id)
+);
+CREATE INDEX IF NOT EXISTS topic_usage_topic ON topic_usage (topic_id, net_id);
+"""
+
+SHUFFLE_KEY_RANGE = 2 ** 31
+DEFAULT_LIBRARY = 'default'
+
+
+def file_signature(path):
+    """Size/mtime signature used to skip re-importing an unchanged topics file"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class TopicStore:
+    """SQLite-backed topic library that remembers which nets used which topics"""
+
+    def __init__(self, db_path='topics.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        # Stores created before nets remembered their library gain the column here
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(nets)")}
+        if 'library' not in columns:
+            self.conn.execute("ALTER TABLE nets ADD COLUMN library TEXT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS nets_library ON nets (library, id)")
+
+    def close(self):
+        self.conn.close()
+
+    def library_id(self, name):
+        row = self.conn.execute("SELECT id FROM libraries WHERE name = ?", (name,)).fetchone()
+        if row:
+            return row[0]
+        with self.conn:
+            return self.conn.execute("INSERT INTO libraries (name) VALUES (?)", (name,)).lastrowid
+
+    def sync_library(self, name, topics, signature=None, rng=None):
+        """Make library `name` contain exactly `topics`; skipped when the signature is unchanged"""
+        rng = rng or random
+        library_id = self.library_id(name)
+        if signature is not None:
+            row = self.conn.execute("SELECT signature FROM libraries WHERE id = ?", (library_id,)).fetchone()
+            if row[0] == signature:
+                return library_id
+
+        with self.conn:
+            self.conn.execute("DELETE FROM library_topics WHERE library_id = ?", (library_id,))
+            self.conn.executemany("INSERT OR IGNORE INTO topics (text) VALUES (?)", ((t,) for t in topics))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO library_topics (library_id, topic_id, shuffle_key) "
+                "SELECT ?, id, ? FROM topics WHERE text = ?",
+                ((library_id, rng.randrange(SHUFFLE_KEY_RANGE), t) for t in topics)
+            )
+            self.conn.execute("UPDATE libraries SET signature = ? WHERE id = ?", (signature, library_id))
+        return library_id
+
+    def latest_net_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM nets").fetchone()[0]
+
+    def recent_cutoff(self, name, exclude_recent):
+        """Highest net id outside the last `exclude_recent` nets that drew from library `name`"""
+        if exclude_recent <= 0:
+            return self.latest_net_id()
+        row = self.conn.execute(
+            "SELECT id FROM nets WHERE library = ? ORDER BY id DESC LIMIT 1 OFFSET ?",
+            (name, exclude_recent - 1)
+        ).fetchone()
+        return row[0] - 1 if row else 0
+
+    def pick(self, name, count, exclude_recent=0, rng=None):
+        """Return up to `count` (topic_id, text) pairs not used in the last `exclude_recent` nets of `name`
+
+        If the library does not have enough eligible topics, the least recently
+        used ones fill the remaining slots.
+        """
+        rng = rng or random
+        library_id = self.library_id(name)
+        cutoff = self.recent_cutoff(name, exclude_recent)
+        chosen = []
+        chosen_ids = set()
+
+        query = (
+            "SELECT t.id, t.text FROM library_topics lt JOIN topics t ON t.id = lt.topic_id "
+            "WHERE lt.library_id = ? AND lt.shuffle_key {op} ? "
+            "AND (t.last_net IS NULL OR t.last_net <= ?){exclude} "
+            "ORDER BY lt.shuffle_key {order} LIMIT 1"
+        )
+        while len(chosen) < count:
+            start = rng.randrange(SHUFFLE_KEY_RANGE)
+            exclude = self._exclude_clause(chosen_ids)
+            params = (library_id, start, cutoff, *chosen_ids)
+            row = (self.conn.execute(query.format(op='>=', order='ASC', exclude=exclude), params).fetchone()
+                   or self.conn.execute(query.format(op='<', order='DESC', exclude=exclude), params).fetchone())
+            if row is None:
+                break
+            chosen.append(row)
+            chosen_ids.add(row[0])
+
+        if len(chosen) < count:
+            chosen.extend(self.conn.execute(
+                "SELECT t.id, t.text FROM library_topics lt JOIN topics t ON t.id = lt.topic_id "
+                f"WHERE lt.library_id = ?{self._exclude_clause(chosen_ids)} "
+                "ORDER BY t.last_net ASC LIMIT ?",
+                (library_id, *chosen_ids, count - len(chosen))
+            ).fetchall())
+        return chosen
+
+    @staticmethod
+    def _exclude_clause(topic_ids):
+        if not topic_ids:
+            return ""
+        return f" AND t.id NOT IN ({','.join('?' * len(topic_ids))})"
+
+    def record_net(self, topic_ids, held_at=None, label='', library=None):
+        """Record a net that drew `topic_ids` from `library`; returns the new net id"""
+        held_at = held_at or datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            net_id = self.conn.execute("INSERT INTO nets (held_at, label, library) VALUES (?, ?, ?)",
+                                       (held_at, label, library)).lastrowid
+            self.conn.executemany("INSERT OR IGNORE INTO topic_usage (net_id, topic_id) VALUES (?, ?)",
+                                  ((net_id, topic_id) for topic_id in topic_ids))
+            self.conn.executemany("UPDATE topics SET last_net = ? WHERE id = ?",
+                                  ((net_id, topic_id) for topic_id in topic_ids))
+        return net_id
+
+    def forget_net(self, net_id):
+        """Undo record_net, e.g. when a script is regenerated before the net is held"""
+        with self.conn:
+            topic_ids = [row[0] for row in self.conn.execute(
+                "SELECT topic_id FROM topic_usage WHERE net_id = ?", (net_id,))]
+            self.conn.execute("DELETE FROM topic_usage WHERE net_id = ?", (net_id,))
+            self.conn.execute("DELETE FROM nets WHERE id = ?", (net_id,))
+            self.conn.executemany(
+                "UPDATE topics SET last_net = (SELECT MAX(net_id) FROM topic_usage WHERE topic_id = ?) "
+                "WHERE id = ?",
+                ((topic_id, topic_id) for topic_id in topic_ids)
+            )
+
+    def last_used(self, text):
+        """held_at of the last net that used this topic, or None"""
+        row = self.conn.execute(
+            "SELECT n.held_at FROM topics t JOIN nets n ON n.id = t.last_net WHERE t.text = ?", (text,)
+        ).fetchone()
+        return row[0] if row else None
@@ -0,0 +1,130 @@
+"""Low-overhead spans written as a Chrome trace, for finding where GUI time goes
+
+Hot functions are decorated with @traced, and smaller steps can be wrapped in
+`with span(...)`. While tracing is off, each call costs one global lookup. While
+it is on, each span appends one tuple to a bounded deque. No I/O happens until
+stop() writes the trace file, which is in the Chrome trace-event JSON format and
+opens in Perfetto (ui.perfetto.dev) or chrome://tracing.
+
+Tracing starts at launch when NETCONTROL_TRACE is set, either to the output
+path or to 1 for a time-stamped file in the working directory. It can also be
+switched on from the application's Settings tab.
+"""
+import os
+import json
+import time
+import inspect
+import functools
+import threading
+from collections import deque
+
+TRACE_ENV = 'NETCONTROL_TRACE'
+MAX_EVENTS = 500_000
+
+_recorder = None
+
+
+class _Recorder:
+    def __init__(self, path):
+        self.path = path
+        self.events = deque(maxlen=MAX_EVENTS)  # (name, start us, duration us, thread id, args)
+        self.started = time.perf_counter_ns()
+
+
+def default_trace_path():
+    return f"netcontrol-trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+
+
+def start(path=None):
+    """Begin recording; spans started before this are not recorded"""
+    global _recorder
+    _recorder = _Recorder(path or default_trace_path())
+
+
+def start_from_environment():
+    value = os.environ.get(TRACE_ENV, '').strip()
+    if value and value != '0':
+        start(None if value == '1' else value)
+
+
+def active():
+    return _recorder is not None
+
+
+def stop():
+    """Stop recording and write the trace; returns its path, or None if tracing was off"""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is None:
+        return None
+    write_trace(recorder.path, list(recorder.events))
+    return recorder.path
+
+
+def write_trace(path, events):
+    pid = os.getpid()
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    trace = [{'ph': 'M', 'name': 'process_name', 'pid': pid, 'args': {'name': 'Net Control'}}]
+    trace.extend({'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': tid,
+                  'args': {'name': names.get(tid, f"thread {tid}")}}
+                 for tid in {event[3] for event in events})
+    for name, start_us, duration_us, tid, args in events:
+        event = {'ph': 'X', 'name': name, 'ts': start_us, 'dur': duration_us, 'pid': pid, 'tid': tid}
+        if args:
+            event['args'] = args
+        trace.append(event)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+class span:
+    """`with span('load topics', file=name):` records the block when tracing is on"""
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        recorder = _recorder
+        if recorder is not None and self.start >= recorder.started:
+            end = time.perf_counter_ns()
+            recorder.events.append((self.name, (self.start - recorder.started) // 1000,
+                                    (end - self.start) // 1000, threading.get_ident(), self.args))
+        return False
+
+
+def traced(fn=None, *, name=None):
+    """Record every call of fn as a span named after its qualified name
+
+    Like Qt does for slots, positional arguments beyond what fn accepts are
+    dropped, so decorated methods can stay connected to signals such as clicked.
+    """
+    if fn is None:
+        return functools.partial(traced, name=name)
+    label = name or fn.__qualname__
+    code = fn.__code__
+    positional = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if positional is not None and len(args) > positional:
+            args = args[:positional]
+        recorder = _recorder
+        if recorder is None:
+            return fn(*args, **kwargs)
+        start_ns = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            end_ns = time.perf_counter_ns()
+            if recorder is _recorder:
+                recorder.events.append((label, (start_ns - recorder.started) // 1000,
+                                        (end_ns - start_ns) // 1000, threading.get_ident(), None))
+    return wrapper
@@ -0,0 +1,36 @@
+import os
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    """net-control.py loaded as a module, with a QApplication to run its Qt objects"""
+    pytest.importorskip("PyQt6.QtWidgets")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    spec = importlib.util.spec_from_file_location("net_control", ROOT / "net-control.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.qt_app = QApplication.instance() or QApplication([])
+    return module
+
+
+@pytest.fixture
+def window(app_module, tmp_path, monkeypatch):
+    """A main window working in tmp_path, with its QSettings kept there too"""
+    from PyQt6.QtCore import QSettings
+
+    monkeypatch.chdir(tmp_path)
+    QSettings.setPath(QSettings.Format.NativeFormat, QSettings.Scope.UserScope, str(tmp_path / 'settings'))
+    window = app_module.NetControlWindow()
+    yield window
+    window.close()
+    window.deleteLater()
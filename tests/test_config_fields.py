@@ -0,0 +1,28 @@
+import configparser
+
+
+def club_name_on_disk():
+    config = configparser.ConfigParser()
+    config.read('net_config.ini', encoding='utf-8')
+    return config.get('CLUB', 'name', fallback=None)
+
+
+def test_only_user_edits_are_saved_and_quit_flushes_them(window, app_module, monkeypatch):
+    from PyQt6.QtTest import QTest
+
+    net_config = window.get_net_config()
+    saved = club_name_on_disk()
+    # Values filled in by code stay out of net_config.ini, even after a focus-out
+    window.club_name_input.setText("Filled In By A Template")
+    window.club_name_input.editingFinished.emit()
+    window.num_topics_input.setValue(4)
+    assert not net_config._dirty
+
+    QTest.keyClicks(window.club_name_input, " ARC")
+    assert net_config.snapshot.club.name == "Filled In By A Template ARC"
+    assert club_name_on_disk() == saved
+
+    # Quitting before the debounced save fires still writes it
+    monkeypatch.setattr(app_module.QApplication, 'quit', lambda: None)
+    window.quit_net()
+    assert club_name_on_disk() == "Filled In By A Template ARC"
@@ -0,0 +1,32 @@
+def net_topics(store, net_id):
+    return {row[0] for row in store.conn.execute("SELECT topic_id FROM topic_usage WHERE net_id = ?", (net_id,))}
+
+
+def test_regenerating_after_end_net_keeps_the_held_net(window, app_module, monkeypatch):
+    monkeypatch.setattr(app_module.QMessageBox, 'question',
+                        lambda *args: app_module.QMessageBox.StandardButton.Yes)
+    # End Net lives on the Check-ins tab
+    window.ensure_tab(window.CHECKINS_TAB)
+    window.no_repeat_cb.setChecked(True)
+    window.no_repeat_nets_input.setValue(8)
+    window.num_topics_input.setValue(7)
+
+    window.generate_script_sections()
+    held_net = window.recorded_net_id
+    held_topics = net_topics(window.topic_store, held_net)
+    assert len(held_topics) == 7
+
+    window.end_net()
+    assert window.recorded_net_id is None
+
+    # The next net's script must not undo the history of the net that was just held
+    window.generate_script_sections()
+    assert window.recorded_net_id != held_net
+    assert net_topics(window.topic_store, held_net) == held_topics
+    assert not held_topics & net_topics(window.topic_store, window.recorded_net_id)
+
+    # Regenerating before this net is held still replaces its own earlier pick
+    pending_net = window.recorded_net_id
+    window.generate_script_sections()
+    assert net_topics(window.topic_store, pending_net) == set()
+    assert not held_topics & net_topics(window.topic_store, window.recorded_net_id)
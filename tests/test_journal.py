@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+import subprocess
+import textwrap
+
+from netcontrol.checkins import CheckIn, CheckInStore
+from netcontrol.journal import SessionJournal, read_journal, COMPACT_EVERY
+
+SECTIONS = [[f"Section {i}", f"Content of section {i}"] for i in range(6)]
+CHECKINS = 699
+
+CRASHING_SESSION = textwrap.dedent("""
+    import os, sys
+    from netcontrol.checkins import CheckInStore
+    from netcontrol.journal import SessionJournal
+
+    journal = SessionJournal(sys.argv[1])
+    journal.record('script', sections={sections!r}, started=1.0, profile={{'callsign': 'W5ALC'}})
+    journal.record('goto', i=2)
+    store = CheckInStore()
+    for n in range({checkins}):
+        # Rows are journaled exactly as the window does: list(store[row])
+        row = store.append(f"k{{n}}", name=f"Op {{n}}", location="Pueblo, CO", comments="QRP" if n % 7 else "",
+                           traffic=n % 5 == 0, group=n % 5, when=1000.0 + n)
+        journal.record('checkin', row=list(store[row]))
+    journal.record('uncheckin', i=0)
+    journal.record('splice', i=2, at=0, end=7, text="Revised")
+    # Killed mid-net: no discard, no close, no final fsync
+    os._exit(0)
+""")
+
+
+def expected_checkin(n):
+    return CheckIn(time=1000.0 + n, callsign=f"K{n}", name=f"Op {n}", location="Pueblo, CO",
+                   group=n % 5, traffic=n % 5 == 0, comments="QRP" if n % 7 else "")
+
+
+def test_crashed_session_is_restored(tmp_path):
+    path = tmp_path / 'session.journal'
+    script = CRASHING_SESSION.format(sections=SECTIONS, checkins=CHECKINS)
+    subprocess.run([sys.executable, '-c', script, str(path)], check=True, cwd=tmp_path,
+                   env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)})
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    # Compaction kept the journal to a snapshot plus the events since
+    assert json.loads(lines[0])['e'] == 'snapshot'
+    assert len(lines) < COMPACT_EVERY
+
+    # A write torn by the crash is ignored
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"e":"checkin","row":["N0TO')
+
+    state = read_journal(str(path))
+    assert state.section_idx == 2
+    assert state.sections[2] == ["Section 2", "Revised of section 2"]
+    assert state.sections[:2] + state.sections[3:] == SECTIONS[:2] + SECTIONS[3:]
+    assert state.originals == SECTIONS
+    assert state.started == 1.0 and state.profile == {'callsign': 'W5ALC'}
+    assert len(state.checkins) == CHECKINS - 1
+
+    # Rebuild the log the way restore_session does and compare every field of every row
+    store = CheckInStore()
+    for when, callsign, name, location, group, traffic, comments in state.checkins:
+        store.append(callsign, name=name, location=location, comments=comments,
+                     traffic=traffic, group=group, when=when)
+    for row, n in enumerate(range(1, CHECKINS)):
+        restored, expected = store[row], expected_checkin(n)
+        for field in CheckIn._fields:
+            assert getattr(restored, field) == getattr(expected, field), (n, field)
+
+
+def test_recovered_state_resumes_and_discard_removes_the_journal(tmp_path):
+    path = str(tmp_path / 'session.journal')
+    journal = SessionJournal(path)
+    journal.record('script', sections=SECTIONS)
+    journal.record('edit', i=1, text="Rewritten")
+    journal.discard()
+    assert read_journal(path) is None
+
+    journal = SessionJournal(path)
+    journal.record('script', sections=SECTIONS)
+    journal.record('edit', i=1, text="Rewritten")
+    journal.sync()
+    # The next start carries the recovered state on into a fresh, compacted journal
+    resumed = SessionJournal(path, read_journal(path))
+    resumed.record('revert', i=1)
+    resumed.record('clear_checkins')
+    state = read_journal(path)
+    assert state.sections == SECTIONS
+    assert state.checkins == []
+    resumed.discard()
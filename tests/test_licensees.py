@@ -0,0 +1,30 @@
+import os
+
+from netcontrol.licensees import LicenseeStore
+
+
+def write_roster(path, stations, mtime):
+    path.write_text(''.join(f"{callsign}|{name}|{location}\n" for callsign, name, location in stations))
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_reimport_only_removes_stations_from_the_same_file(tmp_path):
+    store = LicenseeStore(str(tmp_path / 'licensees.db'))
+    weekly = tmp_path / 'weekly.txt'
+    daily = tmp_path / 'daily.txt'
+    write_roster(weekly, [('W5ALC', 'Jon Smith', 'Pueblo, CO'), ('K0ABC', 'Ann Lee', 'Denver, CO')], 1)
+    write_roster(daily, [('N0NEW', 'New Ham', 'Aurora, CO')], 1)
+    store.import_file(str(weekly))
+    store.import_file(str(daily))
+    assert len(store) == 3
+
+    write_roster(weekly, [('W5ALC', 'Jon Smith', 'Canon City, CO')], 2)
+    result = store.import_file(str(weekly))
+    assert (result.records, result.changed, result.removed) == (1, 1, 1)
+    assert store.lookup('w5alc') == ('W5ALC', 'Jon Smith', 'Canon City, CO')
+    assert store.lookup('K0ABC') is None
+    assert store.lookup('N0NEW') == ('N0NEW', 'New Ham', 'Aurora, CO')
+
+    # The daily file's import record survives, so re-importing it is still skipped
+    assert store.import_file(str(daily)).skipped
+    store.close()
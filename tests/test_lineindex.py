@@ -0,0 +1,95 @@
+import os
+import pickle
+
+import pytest
+
+from netcontrol.lineindex import LineIndex, cache_path_for
+
+LINES = ["First topic", "Second topic, with  inner  spaces", "Third 🙂 topic"]
+
+
+def write(path, data, mtime_ns=None):
+    path.write_bytes(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def spans(index):
+    return [(index._spans[2 * i], index._spans[2 * i + 1]) for i in range(len(index))]
+
+
+@pytest.mark.parametrize('newline, trailing', [("\n", True), ("\n", False), ("\r\n", True), ("\r\n", False)])
+def test_offsets_of_stripped_non_empty_lines(tmp_path, newline, trailing):
+    data = newline.join(["  " + LINES[0], "", LINES[1] + " \t", "   ", LINES[2]]).encode('utf-8')
+    if trailing:
+        data += newline.encode('ascii')
+    path = tmp_path / 'topics.txt'
+    write(path, data)
+    with LineIndex(str(path), use_cache=False) as index:
+        assert list(index) == LINES
+        for (start, end), line in zip(spans(index), LINES):
+            assert data[start:end] == line.encode('utf-8')
+        assert index[-1] == LINES[-1]
+        assert index.page(1, 5) == LINES[1:]
+
+
+def test_empty_and_blank_files(tmp_path):
+    for data in (b"", b"\n\n  \r\n"):
+        path = tmp_path / 'empty.txt'
+        write(path, data)
+        with LineIndex(str(path)) as index:
+            assert len(index) == 0 and list(index) == []
+
+
+def test_cache_is_reused_while_size_and_mtime_match(tmp_path, monkeypatch):
+    path = tmp_path / 'topics.txt'
+    write(path, "\n".join(LINES).encode('utf-8'), mtime_ns=1_000_000_000)
+    with LineIndex(str(path)) as index:
+        built = spans(index)
+    assert os.path.exists(cache_path_for(str(path)))
+
+    def rescan(self, progress=None):
+        raise AssertionError("the cached index should have been used")
+    monkeypatch.setattr(LineIndex, '_build_spans', rescan)
+    with LineIndex(str(path)) as index:
+        assert spans(index) == built
+        assert list(index) == LINES
+
+
+def test_cache_is_rebuilt_when_the_file_changes(tmp_path):
+    path = tmp_path / 'topics.txt'
+    write(path, b"alpha\nbeta\n", mtime_ns=1_000_000_000)
+    with LineIndex(str(path)) as index:
+        assert list(index) == ["alpha", "beta"]
+
+    # Same size, new mtime
+    write(path, b"gamma\ndelt\n", mtime_ns=2_000_000_000)
+    with LineIndex(str(path)) as index:
+        assert list(index) == ["gamma", "delt"]
+
+    # Same mtime, new size
+    write(path, b"gamma\ndelta\nepsilon\n", mtime_ns=2_000_000_000)
+    with LineIndex(str(path)) as index:
+        assert list(index) == ["gamma", "delta", "epsilon"]
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    path = tmp_path / 'topics.txt'
+    write(path, b"alpha\nbeta\n")
+    LineIndex(str(path)).close()
+    with open(cache_path_for(str(path)), 'r+b') as f:
+        f.truncate(20)
+    with LineIndex(str(path)) as index:
+        assert list(index) == ["alpha", "beta"]
+
+
+def test_views_shuffle_independently_and_pickle_by_path(tmp_path):
+    path = tmp_path / 'topics.txt'
+    write(path, "\n".join(f"topic {i}" for i in range(50)).encode('utf-8'))
+    with LineIndex(str(path)) as index:
+        view = index.view()
+        view.shuffle()
+        assert sorted(view) == sorted(index)
+        assert list(index) == [f"topic {i}" for i in range(50)]
+        with pickle.loads(pickle.dumps(index)) as copy:
+            assert list(copy) == list(index)
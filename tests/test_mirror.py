@@ -0,0 +1,65 @@
+import os
+import json
+import base64
+import asyncio
+import urllib.request
+
+from netcontrol.mirror import SectionMirror, read_frame, accept_key, OP_TEXT
+
+SECTIONS = [("Opening", "Good evening, this is W5ALC."), ("Check-ins", "Stations 🙂 please call now.")]
+
+
+async def next_message(reader):
+    opcode, payload = await asyncio.wait_for(read_frame(reader, limit=None), timeout=5)
+    assert opcode == OP_TEXT
+    return json.loads(payload)
+
+
+async def watch(mirror):
+    reader, writer = await asyncio.open_connection('127.0.0.1', mirror.port)
+    key = base64.b64encode(os.urandom(16)).decode('ascii')
+    writer.write(
+        f"GET /ws HTTP/1.1\r\nHost: 127.0.0.1:{mirror.port}\r\nUpgrade: websocket\r\n"
+        f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode('latin-1')
+    )
+    response = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+    assert response.startswith("HTTP/1.1 101")
+    assert f"Sec-WebSocket-Accept: {accept_key(key)}" in response
+
+    snapshot = await next_message(reader)
+    assert snapshot['t'] == 'script'
+    assert snapshot['titles'] == ["Opening", "Check-ins"]
+    assert snapshot['sections'] == [content for _, content in SECTIONS]
+    assert snapshot['idx'] == 0
+
+    mirror.publish_goto(1)
+    goto = await next_message(reader)
+    assert (goto['t'], goto['idx']) == ('goto', 1)
+    assert goto['rev'] > snapshot['rev']
+
+    # "Good evening" -> "Good night": only the changed span goes over the wire
+    mirror.publish_edit(0, (5, 12, "night"))
+    edit = await next_message(reader)
+    assert edit == {'t': 'edit', 'rev': goto['rev'] + 1, 'i': 0, 'at': 5, 'end': 12, 'text': "night"}
+
+    # Offsets after an emoji count it as two UTF-16 units, as the page's JavaScript does
+    mirror.publish_edit(1, (23, 26, "later"))
+    edit = await next_message(reader)
+    assert (edit['at'], edit['end'], edit['text']) == (24, 27, "later")
+    writer.close()
+
+
+def test_viewer_gets_snapshot_then_deltas():
+    mirror = SectionMirror('127.0.0.1', 0)
+    mirror.start()
+    try:
+        assert mirror.port != 0
+        mirror.publish_script(SECTIONS, 0)
+        asyncio.run(watch(mirror))
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{mirror.port}/state", timeout=5) as response:
+            state = json.load(response)
+        assert state['idx'] == 1
+        assert state['sections'] == ["Good night, this is W5ALC.", "Stations 🙂 please call later."]
+    finally:
+        mirror.stop()
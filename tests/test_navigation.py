@@ -0,0 +1,14 @@
+def test_showing_a_script_does_not_record_a_jump_to_the_first_section(window, monkeypatch):
+    window.ensure_tab(window.SCRIPT_TAB)
+    window.generate_script_sections()
+    window.show_script(0)
+    window.jump_spinner.setValue(3)
+    assert window.section_idx == 2
+
+    gotos = []
+    monkeypatch.setattr(window, 'journal_event',
+                        lambda kind, **data: kind == 'goto' and gotos.append(data['i']))
+    # A recovered or regenerated script opening at section 5 goes straight there
+    window.show_script(4)
+    assert gotos == [4]
+    assert window.section_idx == 4
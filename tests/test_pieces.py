@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from netcontrol.pieces import PieceTable, splice_between, apply_splice
+
+ORIGINAL = "Good evening, this is net control."
+
+
+def test_replace_returns_the_splice_and_keeps_the_original():
+    table = PieceTable(ORIGINAL)
+    assert table.replace(5, 12, "night") == (5, 12, "night")
+    assert table.text() == "Good night, this is net control."
+    assert len(table) == len(table.text())
+    assert table.modified
+    assert table.original == ORIGINAL
+    assert table.replace(3, 3, "") is None
+
+
+def test_overlapping_replaces():
+    table = PieceTable(ORIGINAL)
+    expected = ORIGINAL
+    # Each edit straddles the typed text and original text around it
+    for start, end, text in [(5, 12, "night"), (3, 8, "D MOR"), (0, 6, ""), (2, 25, "X"), (0, 0, ">> ")]:
+        table.replace(start, end, text)
+        expected = expected[:start] + text + expected[end:]
+        assert table.text() == expected
+    assert len(table) == len(expected)
+
+
+def test_undo_past_the_first_edit():
+    table = PieceTable(ORIGINAL)
+    table.replace(5, 12, "night")
+    table.replace(0, 4, "Hi")
+    assert table.undo() == (0, 2, "Good")
+    assert table.text() == "Good night, this is net control."
+    assert table.undo() == (5, 10, "evening")
+    assert table.text() == ORIGINAL
+    assert not table.modified
+    assert table.undo() is None
+    assert table.text() == ORIGINAL
+
+
+def test_redo_and_a_new_edit_invalidating_it():
+    table = PieceTable(ORIGINAL)
+    table.replace(5, 12, "night")
+    table.replace(0, 4, "Hi")
+    table.undo()
+    table.undo()
+    assert table.redo() == (5, 12, "night")
+    assert table.text() == "Good night, this is net control."
+
+    table.replace(len(table), len(table), " 73")
+    assert table.redo() is None
+    assert table.text() == "Good night, this is net control. 73"
+    table.undo()
+    assert table.text() == "Good night, this is net control."
+
+
+def test_reset_is_one_undoable_change():
+    table = PieceTable(ORIGINAL)
+    assert table.reset() is None
+    table.replace(5, 12, "night")
+    table.replace(0, 0, "Hello. ")
+    edited = table.text()
+    assert table.reset() == (0, len(edited), ORIGINAL)
+    assert table.text() == ORIGINAL and not table.modified
+    # Undo and redo report only the span that differs, not the whole section
+    assert table.undo() == (0, 12, "Hello. Good night")
+    assert table.text() == edited
+    assert table.redo() == (0, 17, "Good evening")
+    assert table.text() == ORIGINAL
+
+
+def test_empty_original():
+    table = PieceTable("")
+    assert table.text() == "" and not table.modified
+    table.replace(0, 0, "typed")
+    assert table.text() == "typed"
+    assert table.reset() == (0, 5, "")
+    assert table.text() == ""
+
+
+@pytest.mark.parametrize('old, new', [
+    (ORIGINAL, ORIGINAL),
+    (ORIGINAL, ""),
+    ("", ORIGINAL),
+    (ORIGINAL, ORIGINAL.replace("evening", "night")),
+    ("aaaa", "aaaaaa"),
+    ("abcabc", "abc"),
+    ("🙂 net", "🙂 the net"),
+])
+def test_splice_between_round_trips(old, new):
+    start, end, text = splice_between(old, new)
+    assert apply_splice(old, (start, end, text)) == new
+    assert 0 <= start <= end <= len(old)
+    assert len(text) == len(new) - len(old) + (end - start)
+
+
+def test_splice_between_drives_a_piece_table():
+    rng = random.Random(7)
+    table = PieceTable(ORIGINAL)
+    text = ORIGINAL
+    for _ in range(200):
+        start = rng.randrange(len(text) + 1)
+        end = rng.randrange(start, len(text) + 1)
+        new = text[:start] + ''.join(rng.choice("abc \n") for _ in range(rng.randrange(4))) + text[end:]
+        splice = splice_between(text, new)
+        if splice[0] != splice[1] or splice[2]:
+            table.replace(*splice)
+        text = new
+        assert table.text() == text
+    while table.undo() is not None:
+        pass
+    assert table.text() == ORIGINAL
@@ -0,0 +1,55 @@
+import time
+
+
+SECTION_SECONDS = 0.4
+SECTIONS = 5
+BLOCK_SECONDS = 0.15
+
+
+def test_chained_sections_do_not_drift(app_module):
+    """A GUI thread blocked for BLOCK_SECONDS at a time delays a section, but the delays never add up"""
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    scheduler = app_module.NetScheduler()
+    loop = QEventLoop()
+    fired = []
+
+    def section_due():
+        fired.append(time.monotonic())
+        if len(fired) == SECTIONS:
+            loop.quit()
+        else:
+            scheduler.start(SECTION_SECONDS, chain=True)
+
+    # Simulate a busy window: the event loop stalls every 250 ms
+    blocker = QTimer()
+    blocker.setInterval(250)
+    blocker.timeout.connect(lambda: time.sleep(BLOCK_SECONDS))
+
+    scheduler.due.connect(section_due)
+    QTimer.singleShot(10 * 1000, loop.quit)
+    start = time.monotonic()
+    scheduler.start(SECTION_SECONDS)
+    blocker.start()
+    loop.exec()
+    blocker.stop()
+
+    assert len(fired) == SECTIONS
+    for number, fired_at in enumerate(fired, 1):
+        lateness = fired_at - (start + number * SECTION_SECONDS)
+        assert -0.001 <= lateness < BLOCK_SECONDS + 0.05
+
+
+def test_pause_keeps_remaining_time(app_module):
+    scheduler = app_module.NetScheduler()
+    scheduler.start(10)
+    scheduler.pause()
+    remaining = scheduler.remaining()
+    time.sleep(0.05)
+    assert scheduler.remaining() == remaining
+    scheduler.set_duration(20)
+    assert abs(scheduler.remaining() - (remaining + 10)) < 0.01
+    scheduler.resume()
+    assert scheduler.running
+    scheduler.cancel()
+    assert scheduler.remaining() is None
@@ -0,0 +1,80 @@
+import random
+
+from netcontrol.topicstore import TopicStore
+
+CLUB_A = [f"Club A topic {i}" for i in range(10)]
+CLUB_B = [f"Club B topic {i}" for i in range(10)]
+
+
+def hold_net(store, library, count, exclude_recent, rng):
+    picked = store.pick(library, count, exclude_recent, rng)
+    store.record_net([topic_id for topic_id, _ in picked], library=library)
+    return {text for _, text in picked}
+
+
+def test_no_topic_repeats_within_the_window(tmp_path):
+    store = TopicStore(str(tmp_path / 'topics.db'))
+    store.sync_library('A', CLUB_A)
+    rng = random.Random(1)
+    nets = [hold_net(store, 'A', 2, 4, rng) for _ in range(20)]
+    for n, topics in enumerate(nets):
+        assert len(topics) == 2
+        for earlier in nets[max(0, n - 4):n]:
+            assert not topics & earlier
+    store.close()
+
+
+def test_window_counts_only_nets_of_the_same_library(tmp_path):
+    store = TopicStore(str(tmp_path / 'topics.db'))
+    store.sync_library('A', CLUB_A)
+    store.sync_library('B', CLUB_B)
+    rng = random.Random(2)
+    used_by_a = hold_net(store, 'A', 3, 2, rng)
+    # Other clubs' nets in between do not push club A's last net out of its window
+    for _ in range(5):
+        hold_net(store, 'B', 1, 2, rng)
+    for _ in range(10):
+        assert not hold_net(store, 'A', 3, 2, random.Random(rng.random())) & used_by_a
+        store.forget_net(store.latest_net_id())
+    store.close()
+
+
+def test_history_survives_reopening(tmp_path):
+    path = str(tmp_path / 'topics.db')
+    store = TopicStore(path)
+    store.sync_library('A', CLUB_A)
+    used = hold_net(store, 'A', 4, 3, random.Random(3))
+    store.close()
+
+    store = TopicStore(path)
+    store.sync_library('A', CLUB_A)
+    assert not hold_net(store, 'A', 4, 3, random.Random(4)) & used
+    assert all(store.last_used(text) for text in used)
+    store.close()
+
+
+def test_forget_net_makes_its_topics_eligible_again(tmp_path):
+    store = TopicStore(str(tmp_path / 'topics.db'))
+    store.sync_library('A', CLUB_A[:4])
+    rng = random.Random(5)
+    first = hold_net(store, 'A', 2, 1, rng)
+    second = hold_net(store, 'A', 2, 2, rng)
+    assert not first & second
+
+    # Regenerating the second net before it is held forgets it and picks again
+    store.forget_net(store.latest_net_id())
+    assert all(store.last_used(text) is None for text in second)
+    assert all(store.last_used(text) for text in first)
+    assert hold_net(store, 'A', 2, 2, rng) == second
+    store.close()
+
+
+def test_short_library_falls_back_to_least_recently_used(tmp_path):
+    store = TopicStore(str(tmp_path / 'topics.db'))
+    store.sync_library('A', CLUB_A[:3])
+    rng = random.Random(6)
+    oldest = hold_net(store, 'A', 1, 0, rng)
+    hold_net(store, 'A', 2, 1, rng)
+    # Everything was used in the window, so the oldest topic is reused first
+    assert hold_net(store, 'A', 1, 5, rng) == oldest
+    store.close()